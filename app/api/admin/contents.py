@@ -3,9 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, text, func, and_, cast
 from geoalchemy2.functions import ST_X, ST_Y
 from geoalchemy2 import Geometry
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 from app.api.deps import get_db, get_current_admin
+from app.core.cache import invalidate_stage_cache
 from app.models import Content, ContentPrerequisite, Stage
 from app.schemas.content import (
     ContentCreate,
@@ -64,7 +65,7 @@ async def create_content(
 ):
     center_point_sql = None
     if content_data.center_point:
-        center_point_sql = text(f"ST_GeogFromText('POINT({content_data.center_point.lon} {content_data.center_point.lat})')")
+        center_point_sql = text(f"ST_GeogFromText('POINT({content_data.center_point['lon']} {content_data.center_point['lat']})')")
     
     content = Content(
         title=content_data.title,
@@ -174,8 +175,8 @@ async def set_content_prerequisites(
 async def get_contents_admin(
     page: int = Query(1, ge=1), 
     size: int = Query(20, ge=1, le=100), 
-    content_type: Optional[str] = Query(None), 
-    exposure_slot: Optional[str] = Query(None), 
+    content_type: Optional[Literal["story", "domination"]] = Query(None), 
+    exposure_slot: Optional[Literal["story", "event"]] = Query(None), 
     status: Optional[str] = Query(None), 
     search: Optional[str] = Query(None), 
     db: AsyncSession = Depends(get_db), 
@@ -272,6 +273,8 @@ async def delete_content(
         
     await db.delete(content)
     await db.commit()
+    # 콘텐츠 삭제 시 소속 스테이지도 함께 삭제되므로 스테이지 캐시 무효화
+    await invalidate_stage_cache()
     return {"deleted": True, "content_id": content_id}
 
 @router.patch("/{content_id}/toggle-open")
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, and_, func, asc, desc
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 from app.api.deps import get_db, get_current_admin
-from app.models import NFCTag, Admin
+from app.core.cache import invalidate_stage_cache
+from app.models import NFCTag, Admin, StageHint
 from app.schemas.common import PaginatedResponse
 from pydantic import BaseModel, Field
 
@@ -21,8 +22,8 @@ class NFCTagCreate(BaseModel):
     latitude: Optional[float] = Field(None, description="위도", ge=-90, le=90)
     longitude: Optional[float] = Field(None, description="경도", ge=-180, le=180)
     tap_message: Optional[str] = Field(None, description="탭 메시지")
-    point_reward: int = Field(0, description="포인트 보상", ge=0)
-    cooldown_sec: int = Field(0, description="쿨다운(초)", ge=0)
+    point_reward: int = Field(0, description="포인트 보상", ge=0, le=32767)
+    cooldown_sec: int = Field(0, description="쿨다운(초)", ge=0, le=32767)
     use_limit: Optional[int] = Field(None, description="사용 제한 횟수", ge=1)
     is_active: bool = Field(True, description="활성화 여부")
     category: Optional[str] = Field(None, description="카테고리")
@@ -38,8 +39,8 @@ class NFCTagUpdate(BaseModel):
     latitude: Optional[float] = Field(None, ge=-90, le=90)
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     tap__message: Optional[str] = None
-    point_reward: Optional[int] = Field(None, ge=0)
-    cooldown_sec: Optional[int] = Field(None, ge=0)
+    point_reward: Optional[int] = Field(None, ge=0, le=32767)
+    cooldown_sec: Optional[int] = Field(None, ge=0, le=32767)
     use_limit: Optional[int] = Field(None, ge=1)
     is_active: Optional[bool] = None
     category: Optional[str] = None
@@ -132,8 +133,6 @@ async def create_nfc_tag(
         floor_location=nfc_data.floor_location,
         media_url=nfc_data.media_url,
         link_url=nfc_data.link_url,
-        latitude=nfc_data.latitude,
-        longitude=nfc_data.longitude,
         geom=geom_sql,
         tap_message=nfc_data.tap_message,
         point_reward=nfc_data.point_reward,
@@ -153,7 +152,7 @@ async def create_nfc_tag(
 async def get_nfc_tags(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
-    category: Optional[str] = Query(None, description="카테고리 필터"),
+    category: Optional[Literal["none", "stage", "hint", "checkpoint", "base", "safezone", "treasure"]] = Query(None, description="카테고리 필터"),
     active: Optional[bool] = Query(None, description="활성화 상태 필터"),
     search: Optional[str] = Query(None, description="태그명/UDID 검색"),
     # [수정 1] sort 파라미터 추가 (프론트엔드와 기본값 일치)
@@ -287,22 +286,22 @@ async def update_nfc_tag(
     # 수정할 필드들 업데이트
     update_data = nfc_data.model_dump(exclude_unset=True)
     
-    # 좌표 업데이트가 있는 경우 geom도 업데이트
+    # 좌표는 geom에만 저장 (latitude/longitude는 geom에서 계산되는 읽기 전용 속성)
     if "latitude" in update_data or "longitude" in update_data:
-        lat = update_data.get("latitude", nfc_tag.latitude)
-        lon = update_data.get("longitude", nfc_tag.longitude)
+        lat = update_data.pop("latitude", nfc_tag.latitude)
+        lon = update_data.pop("longitude", nfc_tag.longitude)
         
         if lat is not None and lon is not None:
-            geom_sql = text(f"ST_GeogFromText('POINT({lon} {lat})')")
-            nfc_tag.geom = geom_sql
+            nfc_tag.geom = text(f"ST_GeogFromText('POINT({lon} {lat})')")
+        else:
+            nfc_tag.geom = None
     
     for field, value in update_data.items():
-        if field not in ["latitude", "longitude"]:  # geom은 위에서 처리
-            setattr(nfc_tag, field, value)
-        else:
-            setattr(nfc_tag, field, value)
+        setattr(nfc_tag, field, value)
     
     await db.commit()
+    # 스테이지 상세 응답에 NFC 정보(udid, tag_name)가 포함되므로 캐시 무효화
+    await invalidate_stage_cache(nfc_id=nfc_tag.id)
     await db.refresh(nfc_tag)
     
     return format_nfc_response(nfc_tag)
@@ -327,7 +326,6 @@ async def delete_nfc_tag(
         )
     
     # 힌트에서 사용 중인지 확인
-    from app.models import StageHint
     hint_result = await db.execute(select(StageHint).where(StageHint.nfc_id == nfc_id))
     hints_using_tag = hint_result.scalars().all()
     
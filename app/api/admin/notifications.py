@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
-from typing import Optional
+from typing import Optional, Literal
 from datetime import datetime, timezone
 
 from app.api.deps import get_db, get_current_admin
@@ -108,7 +108,7 @@ async def get_notifications_admin(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     status: Optional[str] = Query(None, description="draft|scheduled|published|expired|all"),
-    notification_type: Optional[str] = Query(None, description="system|event|promotion"),
+    notification_type: Optional[Literal["system", "event", "promotion"]] = Query(None, description="system|event|promotion"),
     search: Optional[str] = Query(None, description="제목 검색"),
     db: AsyncSession = Depends(get_db),
     current_admin = Depends(get_current_admin)
@@ -153,12 +153,14 @@ async def get_notifications_admin(
     offset = (page - 1) * size
     paginated = filtered[offset:offset + size]
     
-    return PaginatedResponse(
-        items=[NotificationResponse.model_validate(n) for n in paginated],
+    response = PaginatedResponse(
+        items=[NotificationResponse.from_orm_fast(n) for n in paginated],
         page=page,
         size=size,
         total=total
     )
+    # 모델에서 바로 JSON bytes로 직렬화 (중간 dict 변환 생략)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
@@ -178,7 +180,8 @@ async def get_notification_admin(
     if notification.status != 'draft':
         notification.status = calculate_status(notification.start_at, notification.end_at, False)
     
-    return NotificationResponse.model_validate(notification)
+    response = NotificationResponse.from_orm_fast(notification)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/{notification_id}")
@@ -7,6 +7,7 @@ import uuid
 
 from app import models, schemas
 from app.api import deps
+from app.services.reward_catalog import refresh_rewards_listing
 
 from app.models import Admin, StoreReward, Store
 from app.schemas.common import PaginatedResponse
@@ -116,6 +117,7 @@ async def update_store_reward(
     db.add(reward)
     await db.commit()
     await db.refresh(reward)
+    await refresh_rewards_listing()
     
     return StoreRewardResponse.model_validate(reward)
 
@@ -136,6 +138,7 @@ async def delete_store_reward(
         
     await db.delete(reward)
     await db.commit()
+    await refresh_rewards_listing()
     return Response(status_code=204)
 
 @router.post(
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, text, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, delete, insert, text, and_, func
+from sqlalchemy.orm import selectinload, raiseload
 from typing import List, Optional
 
 # 좌표 변환 라이브러리
 from geoalchemy2.shape import to_shape 
 
 from app.api.deps import get_db, get_current_admin
+from app.core.cache import invalidate_stage_cache
 from app.models import Content, Stage, StageHint, HintImage, StagePuzzle, StageUnlock, NFCTag
 from app.schemas.stage import (
     StageCreate,
@@ -18,6 +19,7 @@ from app.schemas.stage import (
     HintUpdate,
     HintResponse,
     HintImageUpdate,
+    HintImageItem,
     PuzzleConfig,
     UnlockConfig
 )
@@ -77,6 +79,23 @@ def format_stage_response(stage: Stage) -> StageResponse:
         created_at=stage.created_at
     )
 
+async def insert_hint_images(db: AsyncSession, hint_id, images: List[HintImageItem]) -> None:
+    """힌트 이미지 일괄 INSERT (이미지마다 ORM 객체를 만들지 않고 한 번의 executemany로 전송)"""
+    if not images:
+        return
+    await db.execute(
+        insert(HintImage),
+        [
+            {
+                "hint_id": hint_id,
+                "order_no": img.order_no,
+                "url": img.url,
+                "alt_text": img.alt_text
+            }
+            for img in images
+        ]
+    )
+
 def format_hint_response(hint: StageHint) -> HintResponse:
     nfc_info = None
     # [주의] 비동기 세션에서 관계 속성(nfc, images)에 접근하려면 미리 로드되어 있어야 함
@@ -125,7 +144,9 @@ async def get_stages_by_content(
                 selectinload(StageHint.images)
             ),
             selectinload(Stage.puzzles),
-            selectinload(Stage.unlocks)
+            selectinload(Stage.unlocks),
+            # 위에서 로드하지 않은 관계에 접근하면 지연 로딩(N+1) 대신 즉시 오류
+            raiseload("*")
         )
         .order_by(Stage.stage_no)
     )
@@ -288,6 +309,7 @@ async def update_stage(
         setattr(stage, field, value)
     
     await db.commit()
+    await invalidate_stage_cache()
     await db.refresh(stage)
     
     return format_stage_response(stage)
@@ -308,7 +330,9 @@ async def get_stage(
                 selectinload(StageHint.images)
             ),
             selectinload(Stage.puzzles),
-            selectinload(Stage.unlocks)
+            selectinload(Stage.unlocks),
+            # 위에서 로드하지 않은 관계에 접근하면 지연 로딩(N+1) 대신 즉시 오류
+            raiseload("*")
         )
     )
     result = await db.execute(stmt)
@@ -469,24 +493,13 @@ async def create_hint(
     
     db.add(hint)
     
-    image_list = []
-    
     try:
         await db.flush([hint])
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create hint (flush): {e}")
 
-    if hint_data.images:
-        for img_data in hint_data.images:
-            image = HintImage(
-                hint_id=hint.id,
-                order_no=img_data.get("order_no", 1),
-                url=img_data.get("url", ""),
-                alt_text=img_data.get("alt_text", "")
-            )
-            db.add(image)
-            image_list.append({"url": image.url, "alt_text": image.alt_text, "order_no": image.order_no})
+    await insert_hint_images(db, hint.id, hint_data.images)
 
     try:
         await db.commit()
@@ -494,6 +507,8 @@ async def create_hint(
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to commit hint and images: {e}")
     
+    await invalidate_stage_cache()
+    
     # [수정] 관계 속성(nfc, images) 로딩을 위해 Refresh 대신 다시 Select 수행
     # db.refresh(hint) 만으로는 relation이 로드되지 않아 MissingGreenlet 에러 발생 가능
     refreshed_hint_result = await db.execute(
@@ -580,14 +595,7 @@ async def update_hint(
             await db.flush()
             
             # 4-2. 새 이미지 추가
-            for img_data in update_data['images']:
-                image = HintImage(
-                    hint_id=hint_id,
-                    order_no=img_data.get("order_no", 1),
-                    url=img_data.get("url", ""),
-                    alt_text=img_data.get("alt_text", "")
-                )
-                db.add(image)
+            await insert_hint_images(db, hint_id, hint_data.images)
 
         # 5. 텍스트 블록 업데이트
         if 'text_blocks' in update_data and update_data['text_blocks'] is not None:
@@ -623,6 +631,8 @@ async def update_hint(
         except Exception as e:
             await db.rollback() # 롤백
             raise HTTPException(status_code=500, detail=f"Database commit error: {e}")
+        
+        await invalidate_stage_cache()
 
     # [수정] 커밋 후 다시 조회하여 관계 속성 로드 및 Stale 데이터 방지
     refreshed_hint_result = await db.execute(
@@ -661,20 +671,14 @@ async def update_hint_images(
     
     await db.execute(delete(HintImage).where(HintImage.hint_id == hint_id))
     
-    for img_data in image_data.images:
-        image = HintImage(
-            hint_id=hint_id,
-            order_no=img_data.get("order_no", 1),
-            url=img_data.get("url", ""),
-            alt_text=img_data.get("alt", "")
-        )
-        db.add(image)
+    await insert_hint_images(db, hint_id, image_data.images)
     
     await db.commit()
+    await invalidate_stage_cache()
     
     return {
         "hint_id": hint_id,
-        "images": image_data.images
+        "images": [image.as_input_dict() for image in image_data.images]
     }
 
 @router.put("/{stage_id}/puzzles")
@@ -694,6 +698,13 @@ async def update_stage_puzzles(
             detail="Stage not found"
         )
     
+    for puzzle_config in puzzle_data.puzzles:
+        if puzzle_config.get("show_when", "always") not in ("always", "after_clear"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid show_when. Must be: always, after_clear"
+            )
+    
     await db.execute(delete(StagePuzzle).where(StagePuzzle.stage_id == stage_id))
     
     created_puzzles = []
@@ -715,6 +726,7 @@ async def update_stage_puzzles(
         })
     
     await db.commit()
+    await invalidate_stage_cache()
     
     return {
         "stage_id": stage_id,
@@ -751,6 +763,7 @@ async def update_unlock_config(
     
     db.add(unlock_config)
     await db.commit()
+    await invalidate_stage_cache()
     await db.refresh(unlock_config)
     
     return {
@@ -818,6 +831,7 @@ async def delete_hint(
 
         # 4. 커밋
         await db.commit()
+        await invalidate_stage_cache()
 
     except Exception as e:
         # 5. 롤백
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.orm import selectinload
 from typing import List
 import uuid
 
 from app import models, schemas
 from app.api import deps
+from app.services.reward_catalog import refresh_rewards_listing
 
 from app.schemas import reward as schemas_reward
 from app.schemas import store as schemas_store
@@ -23,7 +24,15 @@ async def create_store(
     """
     (관리자) 새로운 매장을 생성합니다.
     """
-    db_store = models.Store(**store_in.dict())
+    store_data = store_in.dict()
+    
+    # 좌표는 geom에만 저장 (latitude/longitude는 geom에서 계산되는 읽기 전용 속성)
+    lat = store_data.pop("latitude")
+    lon = store_data.pop("longitude")
+    if lat is not None and lon is not None:
+        store_data["geom"] = text(f"ST_GeogFromText('POINT({lon} {lat})')")
+    
+    db_store = models.Store(**store_data)
     db.add(db_store)
     await db.commit()
     await db.refresh(db_store)
@@ -168,12 +177,24 @@ async def update_store(
         raise HTTPException(status_code=404, detail="Store not found")
     
     update_data = store_in.dict(exclude_unset=True)
+    
+    # 좌표는 geom에만 저장 (latitude/longitude는 geom에서 계산되는 읽기 전용 속성)
+    if "latitude" in update_data or "longitude" in update_data:
+        lat = update_data.pop("latitude", store.latitude)
+        lon = update_data.pop("longitude", store.longitude)
+        
+        if lat is not None and lon is not None:
+            store.geom = text(f"ST_GeogFromText('POINT({lon} {lat})')")
+        else:
+            store.geom = None
+    
     for field, value in update_data.items():
         setattr(store, field, value)
         
     db.add(store)
     await db.commit()
     await db.refresh(store)
+    await refresh_rewards_listing()
     
     # [3. 수정] Pydantic 모델 수동 변환 (Lazy Loading 방지)
     # db.refresh() 후에도 'rewards' 관계가 로드된 상태인지 보장하기 위해
@@ -216,6 +237,7 @@ async def delete_store(
         
     await db.delete(store)
     await db.commit()
+    await refresh_rewards_listing()
     return Response(status_code=204)
 
 # --- Store Rewards ---
@@ -242,6 +264,7 @@ async def create_store_reward(
     db.add(db_reward)
     await db.commit()
     await db.refresh(db_reward)
+    await refresh_rewards_listing()
     
     # [수정] schemas.reward.StoreSimpleResponse 사용
     store_simple_data = schemas_reward.StoreSimpleResponse(
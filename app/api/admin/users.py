@@ -10,6 +10,7 @@ from app.schemas.common import PaginatedResponse
 from app.schemas.user import UserResponse, UserUpdateRequest, PointAdjustRequest
 from app.schemas.progress import RewardHistoryItem
 from app.schemas.user import ResetAllPointsRequest
+from app.services.reward_ledger import bulk_insert_reward_ledger
 
 from sqlalchemy import cast
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TEXT
@@ -331,24 +332,28 @@ async def reset_all_points(
         if not targets:
             return {"message": "초기화할 대상 사용자가 없습니다."}
 
-        # 3. 상쇄 내역(Negative Delta) 생성을 위한 Ledger 객체 리스트 생성
+        # 3. 상쇄 내역(Negative Delta) 생성
         new_ledger_entries = [
-            RewardLedger(
-                user_id=row.user_id,
-                coin_delta=-(row.current_balance),
-                note="관리자 시스템 전체 포인트 초기화"
-            ) for row in targets
+            {
+                "user_id": row.user_id,
+                "coin_delta": -(row.current_balance),
+                "note": "관리자 시스템 전체 포인트 초기화"
+            } for row in targets
         ]
 
         # 4. 데이터베이스 일괄 업데이트 실행
-        # (1) RewardLedger에 상쇄 기록 추가
-        db.add_all(new_ledger_entries)
+        # (1) RewardLedger에 상쇄 기록 추가 (대상이 많으므로 ORM 대신 COPY로 일괄 기록)
+        await bulk_insert_reward_ledger(db, new_ledger_entries)
 
         # (2) User 테이블의 profile JSONB 필드 내 points 값을 0으로 일괄 변경
         # 기존 adjust_user_points에서 사용한 방식과 유사하게 명시적 UPDATE 실행
+        # 이미 0이거나 points 키가 없는 사용자는 제외 (profile 전체를 다시 쓰는 행 갱신/WAL을 줄임)
         await db.execute(
             update(User)
-            .where(User.profile.is_not(None))
+            .where(
+                User.profile.is_not(None),
+                User.profile["points"].astext != "0"
+            )
             .values(
                 profile=func.jsonb_set(
                     func.coalesce(User.profile, cast('{}', JSONB)), 
@@ -1,8 +1,9 @@
+import asyncio
 import secrets
 import string
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, text
 
@@ -12,6 +13,7 @@ from app.core.security import (
     create_access_token, 
     create_refresh_token,
     verify_token,
+    invalidate_token_cache,
     get_password_hash,
     validate_login_id
 )
@@ -72,7 +74,7 @@ async def _create_user(register_request: RegisterRequest, db: AsyncSession) -> U
     await db.flush()  # user.id 생성을 위해
     
     # 로컬 인증 정보 생성
-    password_hash = get_password_hash(register_request.password)
+    password_hash = await asyncio.to_thread(get_password_hash, register_request.password)
     auth_identity = AuthIdentity(
         user_id=user.id,
         provider='local',
@@ -177,7 +179,7 @@ async def login(
         )
     
     # 비밀번호 검증
-    if not verify_password(login_request.password, auth_identity.password_hash):
+    if not await asyncio.to_thread(verify_password, login_request.password, auth_identity.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -201,7 +203,7 @@ async def login(
     access_token = create_access_token(token_data)
     
     # 최근 로그인 시각 업데이트
-    auth_identity.last_login_at = text("now()")
+    await AuthIdentity.touch_last_login(db, auth_identity.id)
     user.last_active_at = text("now()")
     
     await db.commit()
@@ -279,13 +281,17 @@ async def refresh_token(
 
 
 @router.post("/logout")
-async def logout():
+async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+):
     """
     로그아웃
     
     클라이언트 측에서 토큰을 삭제하면 됩니다.
-    서버 측에서는 토큰 블랙리스트 처리가 필요하면 추후 구현.
+    서버 측에서는 토큰 검증 캐시만 비우며, 토큰 블랙리스트 처리가 필요하면 추후 구현.
     """
+    if credentials:
+        invalidate_token_cache(credentials.credentials)
     return {"message": "Logged out successfully"}
 
 
@@ -358,7 +364,7 @@ async def request_password_reset(
     temp_password = _generate_random_password()
     
     # 7. 새 비밀번호를 해싱하여 DB에 업데이트
-    auth_identity.password_hash = get_password_hash(temp_password)
+    auth_identity.password_hash = await asyncio.to_thread(get_password_hash, temp_password)
     
     try:
         await db.commit()
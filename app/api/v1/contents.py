@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, text, cast, func, Integer
+from sqlalchemy.orm import load_only
 from geoalchemy2.functions import ST_X, ST_Y
 from geoalchemy2 import Geometry
-from typing import List, Optional
+from typing import List, Optional, Literal
 from datetime import datetime, timezone
 from pydantic import BaseModel, ConfigDict
 import uuid
@@ -12,6 +13,7 @@ from app.api.deps import get_db, get_current_user, get_optional_current_user
 from app.models import Content, UserContentProgress, User
 from app.schemas.content import (
     ContentListResponse,
+    CONTENT_LIST_ADAPTER,
     ContentResponse,
     ContentProgressResponse,
     ContentJoinResponse,
@@ -32,7 +34,7 @@ def format_center_point(lon: Optional[float], lat: Optional[float]) -> Optional[
 @router.get("", response_model=List[ContentListResponse])
 async def get_contents(
     only_available: bool = Query(True, description="입장 가능한 콘텐츠만 조회"),
-    exposure_slot: Optional[str] = Query(None, description="노출 슬롯 필터: story|event"),
+    exposure_slot: Optional[Literal["story", "event"]] = Query(None, description="노출 슬롯 필터: story|event"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     db: AsyncSession = Depends(get_db),
@@ -52,7 +54,7 @@ async def get_contents(
         progress_subquery = (
             select(
                 UserContentProgress.content_id,
-                (UserContentProgress.status == 'cleared').label('is_cleared')
+                UserContentProgress.is_cleared.label('is_cleared')
             )
             .where(UserContentProgress.user_id == current_user.id)
             .subquery()
@@ -96,8 +98,9 @@ async def get_contents(
         content, lon, lat, is_cleared = row
         center_point_obj = format_center_point(lon, lat)
         
-        response_items.append(ContentListResponse(
-            id=str(content.id),
+        # DB에서 읽은 값은 이미 타입이 맞으므로 검증 없이 생성 (UUID는 응답 직렬화 시 한 번만 문자열로 변환)
+        response_items.append(ContentListResponse.model_construct(
+            id=content.id,
             title=content.title,
             description=content.description,
             thumbnail_url=content.thumbnail_url,
@@ -106,7 +109,7 @@ async def get_contents(
             exposure_slot=content.exposure_slot,
             is_always_on=content.is_always_on,
             reward_coin=content.reward_coin,
-            center_point=center_point_obj.model_dump() if center_point_obj else None,
+            center_point=center_point_obj,
             start_at=content.start_at,
             end_at=content.end_at,
             has_next_content=content.has_next_content,
@@ -115,7 +118,8 @@ async def get_contents(
             is_test=content.is_test # [수정] 응답에 is_test 추가
         ))
     
-    return response_items
+    # 목록 전체를 한 번에 JSON bytes로 직렬화 (response_model 재검증/변환 생략, bgImgURL alias 유지)
+    return Response(content=CONTENT_LIST_ADAPTER.dump_json(response_items, by_alias=True), media_type="application/json")
 
 @router.get("/{content_id}", response_model=ContentResponse)
 async def get_content_detail(
@@ -140,8 +144,8 @@ async def get_content_detail(
     
     content, lon, lat = row
     
-    return ContentResponse(
-        id=str(content.id),
+    return ContentResponse.model_construct(
+        id=content.id,
         title=content.title,
         description=content.description,
         thumbnail_url=content.thumbnail_url,
@@ -152,7 +156,7 @@ async def get_content_detail(
         reward_coin=content.reward_coin,
         center_point=format_center_point(lon, lat),
         has_next_content=content.has_next_content,
-        next_content_id=str(content.next_content_id) if content.next_content_id else None,
+        next_content_id=content.next_content_id,
         created_at=content.created_at,
         start_at=content.start_at,
         end_at=content.end_at,
@@ -272,9 +276,14 @@ async def get_content_stages(
     if not content_progress_result.scalar_one_or_none():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User has not joined this content")
     
+    # 목록에 필요한 컬럼만 로드 (배경 이미지 URL, meta(JSONB), 위치 등 상세 화면용 컬럼은 읽지 않음)
     stages_result = await db.execute(
         select(Stage)
-        .where(Stage.content_id == content.id, Stage.parent_stage_id.is_(None))
+        .options(load_only(
+            Stage.id, Stage.stage_no, Stage.title, Stage.description,
+            Stage.is_hidden, Stage.uses_nfc, Stage.thumbnail_url
+        ))
+        .where(Stage.content_id == content.id, Stage.is_main_stage)
         .order_by(cast(Stage.stage_no, Integer))
     )
     stages = stages_result.scalars().all()
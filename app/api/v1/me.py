@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update # [1. update 임포트]
 from typing import List
@@ -18,7 +19,7 @@ from app.core.security import verify_password, get_password_hash
 from app.schemas.progress import RewardHistoryItem
 from app.schemas.common import PaginatedResponse
 from app.models import RewardLedger
-from app.utils.file_uploader import upload_file_to_storage
+from app.utils.file_uploader import upload_file_to_storage, get_allowed_extension
 
 router = APIRouter()
 
@@ -146,14 +147,14 @@ async def change_password(
         )
     
     # 현재 비밀번호 확인
-    if not verify_password(password_change.current_password, auth_identity.password_hash):
+    if not await asyncio.to_thread(verify_password, password_change.current_password, auth_identity.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
         )
     
     # 새 비밀번호로 변경
-    auth_identity.password_hash = get_password_hash(password_change.new_password)
+    auth_identity.password_hash = await asyncio.to_thread(get_password_hash, password_change.new_password)
     
     try:
         await db.commit()
@@ -205,12 +206,14 @@ async def get_my_rewards(
     )
     rewards = rewards_result.scalars().all()
     
-    return PaginatedResponse(
-        items=[RewardHistoryItem.model_validate(r) for r in rewards],
+    response = PaginatedResponse(
+        items=[RewardHistoryItem.from_orm_fast(r) for r in rewards],
         page=page,
         size=size,
         total=total
     )
+    # 모델에서 바로 JSON bytes로 직렬화 (중간 dict 변환 생략)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 # [3. 신규 API 추가]
 @router.post("/adjust-points", response_model=RewardHistoryItem)
@@ -331,6 +334,12 @@ async def upload_profile_image(
             detail="유효한 이미지 파일이 아닙니다."
         )
 
+    if get_allowed_extension(file.filename) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 파일 형식입니다."
+        )
+
     try:
         # 2. 실제 파일 업로드 유틸리티 호출
         uploaded_url = await upload_file_to_storage(
@@ -52,7 +52,7 @@ class NFCTagLookupResponse(BaseModel):
 
 class NFCRegisterRequest(BaseModel):
     """NFC 사전 등록 요청 스키마"""
-    udid: str = Field(..., description="등록할 NFC 태그의 UDID")
+    udid: str = Field(..., min_length=1, max_length=100, description="등록할 NFC 태그의 UDID")
     tag_name: str = Field(..., min_length=1, max_length=100, description="NFC 태그 이름")
 
 class NFCRegisterResponse(BaseModel):
@@ -366,28 +366,32 @@ async def verify_location(
     
     # [수정] async with db.begin() 제거하고 명시적 commit 사용
     
-    # 1. 힌트 조회
-    hint_result = await db.execute(select(StageHint).where(StageHint.id == req.hint_id))
-    hint = hint_result.scalar_one_or_none()
+    # 1. 힌트 조회 + 거리 계산 (PostGIS ST_Distance: 미터 단위 반환)
+    # 힌트 조회와 같은 쿼리에서 계산해, 조회한 위치를 다시 DB로 보내는 왕복을 없앰
+    user_point = f"POINT({req.longitude} {req.latitude})"
+    
+    hint_result = await db.execute(
+        select(
+            StageHint,
+            func.ST_Distance(
+                StageHint.location,
+                func.ST_GeogFromText(user_point)
+            ).label("distance_m")
+        ).where(StageHint.id == req.hint_id)
+    )
+    hint_row = hint_result.first()
     
-    if not hint:
+    if not hint_row:
         return LocationVerifyResponse(allowed=False, reason="Hint not found")
     
+    hint = hint_row.StageHint
+    
     # 2. 위치 설정 여부 확인
     if not hint.location or not hint.radius_m:
         return LocationVerifyResponse(allowed=False, reason="This hint does not have location verification configured.")
     
-    # 3. 거리 계산 (PostGIS ST_Distance: 미터 단위 반환)
-    user_point = f"POINT({req.longitude} {req.latitude})"
-    
-    distance_query = select(
-        func.ST_Distance(
-            hint.location,
-            func.ST_GeogFromText(user_point)
-        )
-    )
-    distance_result = await db.execute(distance_query)
-    distance_meters = distance_result.scalar() or 0.0
+    # 3. 거리 확인용 값
+    distance_meters = hint_row.distance_m or 0.0
     
     # 4. 반경 확인
     if distance_meters > hint.radius_m:
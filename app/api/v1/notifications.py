@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from typing import List
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 
 from app.api.deps import get_db
 from app.models import Notification
-from app.schemas.notification import NotificationAppResponse
+from app.schemas.notification import NotificationAppResponse, NOTIFICATION_APP_LIST_ADAPTER
 
 router = APIRouter()
 
@@ -35,7 +35,9 @@ async def get_notifications_app(
     result = await db.execute(query)
     notifications = result.scalars().all()
     
-    return [NotificationAppResponse.model_validate(n) for n in notifications]
+    items = [NotificationAppResponse.from_orm_fast(n) for n in notifications]
+    # 목록 전체를 한 번에 JSON bytes로 직렬화 (response_model 재검증/변환 생략)
+    return Response(content=NOTIFICATION_APP_LIST_ADAPTER.dump_json(items), media_type="application/json")
 
 
 @router.get("/{notification_id}", response_model=NotificationAppResponse)
@@ -58,4 +60,4 @@ async def get_notification_detail_app(
     await db.commit()
     await db.refresh(notification)
     
-    return NotificationAppResponse.model_validate(notification)
\ No newline at end of file
+    return NotificationAppResponse.from_orm_fast(notification)
\ No newline at end of file
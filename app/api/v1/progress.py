@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, text, func
+from sqlalchemy import select, and_, text
 from sqlalchemy.orm import selectinload
 import uuid
 from typing import Optional, Dict
 from datetime import datetime, timezone
 
 from app.api.deps import get_db, get_current_user
+from app.core.database import transaction
 from app.models import (
     User, Stage, UserStageProgress, UserContentProgress, 
-    Content, RewardLedger, StoreReward
+    Content, RewardLedger
 )
 from app.schemas.progress import (
     StageUnlockRequest,
@@ -22,6 +23,7 @@ from app.schemas.progress import (
     RewardConsumeResponse
 )
 from app.schemas.common import PaginatedResponse
+from app.services.reward_redeem import redeem_store_reward
 
 router = APIRouter()
 
@@ -246,7 +248,7 @@ async def clear_stage(
                 UserStageProgress.user_id == current_user.id,
                 UserStageProgress.stage_id.in_(all_stage_ids),
                 UserStageProgress.stage_id != stage.id, # 방금 클리어한 스테이지는 제외
-                UserStageProgress.status == "cleared"
+                UserStageProgress.is_cleared
             )
         )
     )
@@ -303,86 +305,17 @@ async def consume_reward(
     재고 확인, 포인트 확인, 재고 차감, 포인트 내역 기록을 트랜잭션으로 처리합니다.
     """
     
-    # [수정] with db.begin()을 사용하여 트랜잭션 보장
-    async with db.begin():
-        try:
-            # 1. 교환할 상품(StoreReward) 조회 (FOR UPDATE로 비관적 락 설정)
-            reward_item_result = await db.execute(
-                select(StoreReward)
-                .where(StoreReward.id == consume_request.reward_id)
-                .with_for_update() # 비관적 락 (재고 동시성 문제 방지)
-            )
-            reward_item = reward_item_result.scalar_one_or_none()
-
-            if not reward_item:
-                raise HTTPException(status_code=404, detail="Reward item not found")
-            if not reward_item.is_active:
-                raise HTTPException(status_code=400, detail="Reward item is not active")
-
-            # 2. (재고 체크)
-            if reward_item.stock_qty is not None: # NULL이 아니면(무제한이 아니면)
-                if reward_item.stock_qty <= 0:
-                    raise HTTPException(status_code=400, detail="Item out of stock")
-
-            # 3. (포인트 체크) 사용자의 현재 포인트 잔액 계산
-            # [수정] 이 쿼리도 트랜잭션에 포함
-            user_points_result = await db.execute(
-                select(func.sum(RewardLedger.coin_delta)).where(RewardLedger.user_id == current_user.id)
-            )
-            current_points = user_points_result.scalar() or 0
-
-            # 4. 상품 가격과 비교
-            if current_points < reward_item.price_coin:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Not enough points. Required: {reward_item.price_coin}, Available: {current_points}"
-                )
-                
-            # 5. (재고 차감) stock_qty가 NULL이 아닐 때만 1 차감
-            if reward_item.stock_qty is not None:
-                reward_item.stock_qty -= 1
-                
-            # 6. (포인트 내역 기록) RewardLedger에 차감 내역 추가
-            new_ledger_entry = RewardLedger(
-                user_id=current_user.id,
-                store_id=reward_item.store_id,
-                store_reward_id=reward_item.id, # [수정] reward_id -> store_reward_id
-                coin_delta=-reward_item.price_coin, # 포인트 차감
-                note=f"Consumed: {reward_item.product_name}"
-            )
-            db.add(new_ledger_entry)
-            
-            # 7. user.profile 캐시 업데이트
-            user_to_update = await db.get(User, current_user.id, with_for_update=True)
-            if user_to_update:
-                user_profile = user_to_update.profile or {}
-                user_profile['points'] = current_points - reward_item.price_coin
-                user_to_update.profile = user_profile
-                # SQLAlchemy 1.4+는 변경 감지
-            
-            # [수정] db.commit()은 with db.begin()이 대신 처리
-
-            # 8. 성공 응답 반환 (트랜잭션이 성공적으로 커밋된 후)
-            # new_ledger_entry.id는 flush 이후에 접근 가능 (commit 전에)
-            await db.flush([new_ledger_entry])
-            
-            return RewardConsumeResponse(
-                success=True,
-                reward_id=reward_item.id,
-                points_deducted=reward_item.price_coin,
-                remaining_points=current_points - reward_item.price_coin,
-                ledger_id=new_ledger_entry.id
-            )
+    # [수정] /rewards/redeem 과 동일한 교환 로직 사용 (app.services.reward_redeem)
+    async with transaction(db):
+        result = await redeem_store_reward(db, current_user.id, consume_request.reward_id)
 
-        except Exception as e:
-            # [수정] db.rollback()은 with db.begin()이 대신 처리
-            if isinstance(e, HTTPException):
-                raise e # HTTP 예외는 그대로 다시 발생시킴
-            
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"An error occurred during transaction: {e}"
-            )
+    return RewardConsumeResponse(
+        success=True,
+        reward_id=result.reward_id,
+        points_deducted=result.price_coin,
+        remaining_points=result.remaining_points,
+        ledger_id=result.ledger_id
+    )
 
 
 @router.get("/rewards", response_model=PaginatedResponse[RewardHistoryItem])
@@ -417,13 +350,15 @@ async def get_rewards_history(
     
     # [수정] Pydantic 스키마의 타입에 맞게 UUID를 str()로 변환
     items = [
-        RewardHistoryItem.model_validate(reward)
+        RewardHistoryItem.from_orm_fast(reward)
         for reward in rewards
     ]
     
-    return PaginatedResponse(
+    response = PaginatedResponse(
         items=items,
         page=page,
         size=size,
         total=total
-    )
\ No newline at end of file
+    )
+    # 모델에서 바로 JSON bytes로 직렬화 (중간 dict 변환 생략)
+    return Response(content=response.model_dump_json(), media_type="application/json")
\ No newline at end of file
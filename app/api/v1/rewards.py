@@ -1,21 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
-from sqlalchemy import select, update, func, and_, or_
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select, func, and_, or_
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
+import base64
 
 from app.api.deps import get_db, get_current_user
-from app.models import User, StoreReward, Store, RewardLedger 
-from app.schemas.common import PaginatedResponse
+from app.core.cache import cache_get, cache_set, REWARDS_CACHE_PREFIX
+from app.core.config import settings
+from app.core.database import transaction
+from app.models import User, StoreReward, MvActiveReward
+from app.models.reward import EXPOSURE_ORDER_FIRST, EXPOSURE_ORDER_LAST
+from app.schemas.common import CursorPaginatedResponse
+from app.services.reward_redeem import redeem_store_reward
 
 from pydantic import BaseModel, ConfigDict
 
 # --- Pydantic Schemas (응답 모델) ---
 
 class StoreSimpleResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False, extra='ignore')
     store_name: str
     description: Optional[str] = None
     address: Optional[str] = None
@@ -23,7 +29,7 @@ class StoreSimpleResponse(BaseModel):
     longitude: Optional[float] = None
 
 class RewardLookupResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False, extra='ignore')
     
     id: UUID
     product_name: str
@@ -45,78 +51,125 @@ class RewardRedeemResponse(BaseModel):
     ledger_id: int 
     remaining_points: int 
 
+# 목록 응답 모델 validator를 import 시점에 미리 생성 (첫 요청 지연 방지)
+StoreSimpleResponse.model_rebuild(force=True)
+RewardLookupResponse.model_rebuild(force=True)
+RewardListResponse = CursorPaginatedResponse[RewardLookupResponse]
+RewardListResponse.model_rebuild(force=True)
+
 # --- API Router ---
 
 router = APIRouter()
 
 
+# 노출 순서가 없는(NULL) 상품은 맨 뒤로 정렬 (ix_mv_active_rewards_keyset 인덱스와 동일한 표현식)
+exposure_order_key = func.coalesce(MvActiveReward.exposure_order, EXPOSURE_ORDER_LAST)
+
+
+def encode_reward_cursor(reward: MvActiveReward) -> str:
+    """마지막 행의 정렬 키 (exposure_order|created_at|id)를 커서 문자열로 인코딩"""
+    exposure_order = reward.exposure_order if reward.exposure_order is not None else EXPOSURE_ORDER_LAST
+    raw = f"{exposure_order}|{reward.created_at.isoformat()}|{reward.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_reward_cursor(cursor: str) -> Tuple[int, datetime, UUID]:
+    """커서 문자열을 정렬 키로 디코딩 (형식 오류 시 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        exposure_order, created_at, reward_id = raw.split("|")
+        exposure_order = int(exposure_order)
+        # exposure_order는 integer(int4) 컬럼과 비교하므로 범위 밖 값은 DB 바인딩 오류(500) 대신 400
+        if not EXPOSURE_ORDER_FIRST <= exposure_order <= EXPOSURE_ORDER_LAST:
+            raise ValueError("exposure_order out of int4 range")
+        return exposure_order, datetime.fromisoformat(created_at), UUID(reward_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+
 @router.get(
     "", 
-    response_model=PaginatedResponse[RewardLookupResponse],
+    response_model=RewardListResponse,
     summary="[App] 전체 리워드(상품) 목록 조회"
 )
 async def list_rewards_for_app(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     store_id: Optional[UUID] = Query(None, description="특정 매장 ID 필터")
 ):
     """
     앱에서 사용 가능한 (활성화된) 모든 리워드 상품 목록을 조회합니다.
+    (exposure_order ASC, created_at DESC, id ASC 순 커서 페이지네이션)
     """
     
-    now = datetime.utcnow()
+    cache_key = f"{REWARDS_CACHE_PREFIX}{category}:{store_id}:{cursor}:{size}"
+    cached = await cache_get(cache_key)
+    if cached:
+        # 캐시에는 이미 직렬화된 JSON이 들어 있으므로 재검증 없이 그대로 반환
+        return Response(content=cached, media_type="application/json")
     
-    query = (
-        select(StoreReward)
-        .join(StoreReward.store)
-        .options(joinedload(StoreReward.store))
-    )
-    count_query = select(func.count(StoreReward.id)).join(StoreReward.store)
-    
-    conditions = [
-        StoreReward.is_active == True,
-        Store.show_products == True,
-        or_(
-            Store.is_always_on == True,
-            and_(
-                Store.display_start_at <= now,
-                Store.display_end_at >= now
-            )
-        )
-    ]
+    # 노출 조건(활성 상품/상품 노출 매장/노출 기간)은 mv_active_rewards 갱신 시 미리 적용됨
+    # (매장 정보도 뷰에 포함되어 있어 JOIN/추가 조회 없음, 갱신 주기만큼 반영 지연)
+    query = select(MvActiveReward)
+    
+    conditions = []
     
     if category:
-        conditions.append(StoreReward.category == category)
+        conditions.append(MvActiveReward.category == category)
         
     if store_id:
-        conditions.append(StoreReward.store_id == store_id)
+        conditions.append(MvActiveReward.store_id == store_id)
+    
+    if cursor:
+        # 정렬 방향이 섞여 있으므로 (ASC, DESC, ASC) row-value 비교 대신 풀어서 비교
+        last_order, last_created_at, last_id = decode_reward_cursor(cursor)
+        conditions.append(
+            or_(
+                exposure_order_key > last_order,
+                and_(
+                    exposure_order_key == last_order,
+                    or_(
+                        MvActiveReward.created_at < last_created_at,
+                        and_(
+                            MvActiveReward.created_at == last_created_at,
+                            MvActiveReward.id > last_id
+                        )
+                    )
+                )
+            )
+        )
         
-    query = query.where(and_(*conditions))
-    count_query = count_query.where(and_(*conditions))
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    if conditions:
+        query = query.where(and_(*conditions))
     
     query = query.order_by(
-        StoreReward.exposure_order.asc(), 
-        StoreReward.created_at.desc()
+        exposure_order_key.asc(), 
+        MvActiveReward.created_at.desc(),
+        MvActiveReward.id.asc()
     )
     
-    offset = (page - 1) * size
-    query = query.offset(offset).limit(size)
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    query = query.limit(size + 1)
     
     result = await db.execute(query)
     items = result.scalars().all()
     
-    return PaginatedResponse(
-        items=items,
-        page=page,
+    has_next = len(items) > size
+    items = items[:size]
+    
+    response = RewardListResponse(
+        items=[RewardLookupResponse.model_validate(item) for item in items],
         size=size,
-        total=total
+        next_cursor=encode_reward_cursor(items[-1]) if has_next else None
     )
+    # 한 번만 직렬화해서 캐시 저장과 응답에 함께 사용 (FastAPI의 response_model 재검증/재직렬화 생략)
+    payload = response.model_dump_json()
+    await cache_set(cache_key, payload, settings.REWARDS_CACHE_TTL_SEC)
+    
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
@@ -168,72 +221,10 @@ async def redeem_reward(
     상품을 교환(구매)합니다. reward_id를 Request Body로 받습니다.
     """
     
-    reward_id = request.reward_id
-    
-    try:
-        query = (
-            select(StoreReward)
-            .where(StoreReward.id == reward_id)
-            .with_for_update() 
-        )
-        result = await db.execute(query)
-        reward = result.scalars().first()
-
-        if not reward:
-            raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다.")
-        
-        if not reward.is_active:
-            raise HTTPException(status_code=400, detail="현재 교환 불가능한 상품입니다.")
-
-        if reward.stock_qty is not None: 
-            if reward.stock_qty <= 0:
-                raise HTTPException(status_code=400, detail="상품 재고가 소진되었습니다.")
-            
-            reward.stock_qty -= 1
-            db.add(reward)
-
-        user_to_update = await db.get(User, user.id, with_for_update=True)
-        if user_to_update is None:
-            raise HTTPException(status_code=404, detail="사용자 정보를 찾을 수 없습니다.")
-
-        user_points = user_to_update.profile.get("points", 0) if user_to_update.profile else 0
-        
-        if user_points < reward.price_coin:
-            raise HTTPException(status_code=400, detail=f"포인트가 부족합니다. (보유: {user_points}P, 필요: {reward.price_coin}P)")
-        
-        new_points = user_points - reward.price_coin
-        
-        if user_to_update.profile is None:
-             user_to_update.profile = {}
-        
-        updated_profile = user_to_update.profile.copy()
-        updated_profile["points"] = new_points
-            
-        await db.execute(
-            update(User)
-            .where(User.id == user.id)
-            .values(profile=updated_profile)
-        )
-
-        new_ledger_entry = RewardLedger(
-            user_id=user.id,
-            coin_delta= -abs(reward.price_coin),
-            note=f"상품 교환: {reward.product_name}",
-            store_reward_id=reward.id
-        )
-        db.add(new_ledger_entry)
-        
-        await db.flush([new_ledger_entry]) 
-
-        await db.commit()
-    
-    except Exception as e:
-        await db.rollback()
-        if isinstance(e, HTTPException):
-            raise e
-        raise HTTPException(status_code=500, detail=f"An error occurred: {e}")
+    async with transaction(db):
+        result = await redeem_store_reward(db, user.id, request.reward_id)
     
     return RewardRedeemResponse(
-        ledger_id=new_ledger_entry.id,
-        remaining_points=new_points
+        ledger_id=result.ledger_id,
+        remaining_points=result.remaining_points
     )
\ No newline at end of file
@@ -1,47 +1,188 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection
+from sqlalchemy import select, and_, exists, func, cast
+from typing import List, Optional, Union
+import orjson
 
-# [추가] 좌표 변환을 위한 라이브러리 추가
-from geoalchemy2.shape import to_shape 
+# [추가] 좌표 변환을 위한 라이브러리 추가 (좌표는 쿼리에서 ST_X/ST_Y로 조회)
+from geoalchemy2 import Geometry
 
 from app.api.deps import get_db, get_current_user
-from app.models import Stage, StageHint, HintImage, StagePuzzle, StageUnlock, User, UserStageProgress, NFCTag
+from app.core.cache import cache_get, cache_set, STAGE_CACHE_PREFIX, nfc_info_cache
+from app.core.config import settings
+from app.models import Stage, StageHint, HintImage, StagePuzzle, StageUnlock, User, UserStageProgress, UserContentProgress, NFCTag
 from app.schemas.stage import StageDetailResponse, HintResponse
 
 router = APIRouter()
 
-# [수정] Helper: 위치 정보 포맷팅 (Stage용) - to_shape 사용
-def format_location(stage: Stage) -> Optional[dict]:
-    """geography 타입의 location을 dict로 변환"""
-    if not stage.location:
+# 앱 스테이지 API는 조회 전용이므로 ORM 객체 대신 Core select(컬럼) 결과(mappings)를 바로 사용
+stage_table = Stage.__table__
+hint_table = StageHint.__table__
+hint_image_table = HintImage.__table__
+puzzle_table = StagePuzzle.__table__
+unlock_table = StageUnlock.__table__
+
+
+def point_lon(column):
+    """geography(POINT) 컬럼의 경도 (SQL에서 계산)"""
+    return func.ST_X(cast(column, Geometry("POINT", srid=4326)))
+
+
+def point_lat(column):
+    """geography(POINT) 컬럼의 위도 (SQL에서 계산)"""
+    return func.ST_Y(cast(column, Geometry("POINT", srid=4326)))
+
+
+# 응답(StageDetailResponse/HintResponse)에 쓰는 컬럼만 명시적으로 조회
+# (테이블에 컬럼이 추가되어도 조회 대상이 늘지 않음, location(geography)은 경도/위도로 따로 조회)
+stage_columns = (
+    stage_table.c.id,
+    stage_table.c.content_id,
+    stage_table.c.parent_stage_id,
+    stage_table.c.stage_no,
+    stage_table.c.title,
+    stage_table.c.description,
+    stage_table.c.start_button_text,
+    stage_table.c.uses_nfc,
+    stage_table.c.is_hidden,
+    stage_table.c.is_open,
+    stage_table.c.time_limit_min,
+    stage_table.c.clear_need_nfc_count,
+    stage_table.c.clear_time_attack_sec,
+    stage_table.c.radius_m,
+    stage_table.c.unlock_on_enter_radius,
+    stage_table.c.unlock_stage_id,
+    stage_table.c.background_image_url,
+    stage_table.c.thumbnail_url,
+    stage_table.c.meta,
+    stage_table.c.created_at,
+)
+hint_columns = (
+    hint_table.c.id,
+    hint_table.c.stage_id,
+    hint_table.c.preset,
+    hint_table.c.order_no,
+    hint_table.c.text_block_1,
+    hint_table.c.text_block_2,
+    hint_table.c.text_block_3,
+    hint_table.c.cooldown_sec,
+    hint_table.c.failure_cooldown_sec,
+    hint_table.c.reward_coin,
+    hint_table.c.nfc_id,
+    hint_table.c.radius_m,
+    point_lon(hint_table.c.location).label("lon"),
+    point_lat(hint_table.c.location).label("lat"),
+)
+
+# [수정] Helper: 위치 정보 포맷팅 (Stage용) - 좌표는 쿼리에서 ST_X/ST_Y로 조회
+def format_location(lon: Optional[float], lat: Optional[float], radius_m: Optional[int]) -> Optional[dict]:
+    """쿼리에서 조회한 경도/위도를 location dict로 변환"""
+    if lon is None or lat is None:
         return None
     
-    try:
-        point = to_shape(stage.location)
-        result = {
-            "lon": float(point.x), # 경도
-            "lat": float(point.y)  # 위도
-        }
-        if stage.radius_m:
-            result["radius_m"] = stage.radius_m
-        return result
-    except Exception:
-        return None
+    result = {
+        "lon": lon, # 경도
+        "lat": lat  # 위도
+    }
+    if radius_m:
+        result["radius_m"] = radius_m
+    return result
 
-# [추가] Helper: 위치 정보 포맷팅 (Hint용)
-def format_hint_location(hint: StageHint) -> Optional[dict]:
-    if not hint.location:
-        return None
-    try:
-        point = to_shape(hint.location)
-        return {
-            "lat": float(point.y), # 위도
-            "lon": float(point.x)  # 경도
-        }
-    except Exception:
+# [수정] Helper: 위치 정보 포맷팅 (Hint용) - 좌표는 쿼리에서 ST_X/ST_Y로 조회
+def format_hint_location(lon: Optional[float], lat: Optional[float]) -> Optional[dict]:
+    if lon is None or lat is None:
         return None
+    return {
+        "lat": lat, # 위도
+        "lon": lon  # 경도
+    }
+
+def build_hint_response(hint, nfc_info: Optional[dict], images: List[dict]) -> HintResponse:
+    """힌트 조회 결과(mappings 행)를 응답 모델로 변환 (DB에서 읽은 값이므로 검증 없이 생성)"""
+    return HintResponse.model_construct(
+        id=str(hint["id"]),
+        stage_id=str(hint["stage_id"]),
+        preset=hint["preset"],
+        order_no=hint["order_no"],
+        text_block_1=hint["text_block_1"],
+        text_block_2=hint["text_block_2"],
+        text_block_3=hint["text_block_3"],
+        cooldown_sec=hint["cooldown_sec"],
+        
+        # [추가] 신규 필드 매핑
+        failure_cooldown_sec=hint["failure_cooldown_sec"],
+        location=format_hint_location(hint["lon"], hint["lat"]),
+        radius_m=hint["radius_m"],
+        
+        reward_coin=hint["reward_coin"],
+        nfc=nfc_info,
+        images=images
+    )
+
+def content_joined_expr(user_id, content_id):
+    """콘텐츠 참여 여부 EXISTS 식 (content_id는 값 또는 Stage.content_id 컬럼)"""
+    return exists().where(
+        and_(
+            UserContentProgress.user_id == user_id,
+            UserContentProgress.content_id == content_id
+        )
+    ).label("joined")
+
+
+def stage_status_expr(user_id, stage_id):
+    """사용자의 스테이지 진행 상태 스칼라 서브쿼리 ((user_id, stage_id)가 기본키라 최대 1건)"""
+    return (
+        select(UserStageProgress.status)
+        .where(
+            and_(
+                UserStageProgress.user_id == user_id,
+                UserStageProgress.stage_id == stage_id
+            )
+        )
+        .scalar_subquery()
+        .label("stage_status")
+    )
+
+
+def ensure_stage_access(joined: bool, stage_status: Optional[str], is_hidden: bool) -> None:
+    """콘텐츠 참여 여부 및 히든 스테이지 잠금 여부 확인"""
+    if not joined:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has not joined this content"
+        )
+    
+    # 스테이지가 잠금 상태이고 히든이면 접근 불가
+    if is_hidden and (stage_status is None or stage_status == "locked"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Stage is locked"
+        )
+
+async def load_nfc_infos(conn: Union[AsyncSession, AsyncConnection], nfc_ids) -> dict:
+    """
+    NFC 태그 표시 정보 조회 (nfc_id → {"id", "udid", "tag_name"})
+    프로세스 로컬 캐시를 먼저 확인하고, 없는 태그만 WHERE id IN (...) 한 번으로 조회해 캐시에 채웁니다.
+    """
+    nfc_infos = {}
+    missing_ids = set()
+    for nfc_id in nfc_ids:
+        cached = nfc_info_cache.get(nfc_id)
+        if cached is not None:
+            nfc_infos[nfc_id] = cached
+        else:
+            missing_ids.add(nfc_id)
+    
+    if missing_ids:
+        nfc_result = await conn.execute(
+            select(NFCTag.id, NFCTag.udid, NFCTag.tag_name).where(NFCTag.id.in_(missing_ids))
+        )
+        for nfc_id, udid, tag_name in nfc_result.all():
+            nfc_info = {"id": str(nfc_id), "udid": udid, "tag_name": tag_name}
+            nfc_info_cache.set(nfc_id, nfc_info)
+            nfc_infos[nfc_id] = nfc_info
+    
+    return nfc_infos
 
 @router.get("/{stage_id}", response_model=StageDetailResponse)
 async def get_stage_detail(
@@ -51,165 +192,163 @@ async def get_stage_detail(
 ):
     """
     스테이지 상세 정보 조회 (힌트/이미지/퍼즐 포함)
+    스테이지 내용은 Redis에 캐시하고, 사용자별 접근 권한은 매번 확인합니다. (X-Cache: HIT/MISS)
     """
     
-    # 스테이지 조회
-    stage_result = await db.execute(select(Stage).where(Stage.id == stage_id))
-    stage = stage_result.scalar_one_or_none()
-    
-    if not stage:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Stage not found"
-        )
-    
-    # 사용자가 해당 콘텐츠에 참여했는지 확인
-    from app.models import UserContentProgress
-    content_progress_result = await db.execute(
-        select(UserContentProgress).where(
-            and_(
-                UserContentProgress.user_id == current_user.id,
-                UserContentProgress.content_id == stage.content_id
+    cache_key = f"{STAGE_CACHE_PREFIX}{stage_id}"
+    cached = await cache_get(cache_key)
+    if cached:
+        # 권한 확인에 필요한 두 필드만 읽음 (힌트/이미지/퍼즐까지 모델로 재검증하지 않음)
+        cached_stage = orjson.loads(cached)
+        # 사용자별 접근 권한은 캐시와 관계없이 매번 확인 (쿼리 1회)
+        access_result = await db.execute(
+            select(
+                content_joined_expr(current_user.id, cached_stage["content_id"]),
+                stage_status_expr(current_user.id, stage_id)
             )
         )
-    )
-    content_progress = content_progress_result.scalar_one_or_none()
+        joined, stage_status = access_result.one()
+        ensure_stage_access(joined, stage_status, cached_stage["is_hidden"])
+        return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
     
-    if not content_progress:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User has not joined this content"
-        )
+    # ORM 세션 대신 세션이 사용 중인 연결로 Core select 실행 (identity map/인스턴스 생성 없이 mappings 사용)
+    conn = await db.connection()
     
-    # 사용자의 스테이지 진행상황 확인
-    stage_progress_result = await db.execute(
-        select(UserStageProgress).where(
-            and_(
-                UserStageProgress.user_id == current_user.id,
-                UserStageProgress.stage_id == stage_id
-            )
+    # 스테이지 + 사용자 접근 권한(참여 여부/진행 상태) + 좌표를 한 번에 조회
+    stage_result = await conn.execute(
+        select(
+            *stage_columns,
+            content_joined_expr(current_user.id, stage_table.c.content_id),
+            stage_status_expr(current_user.id, stage_table.c.id),
+            point_lon(stage_table.c.location).label("lon"),
+            point_lat(stage_table.c.location).label("lat")
         )
+        .where(stage_table.c.id == stage_id)
     )
-    stage_progress = stage_progress_result.scalar_one_or_none()
+    stage = stage_result.mappings().one_or_none()
     
-    # 스테이지가 잠금 상태이고 히든이면 접근 불가
-    if stage.is_hidden and (not stage_progress or stage_progress.status == "locked"):
+    if not stage:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Stage is locked"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Stage not found"
         )
     
+    ensure_stage_access(stage["joined"], stage["stage_status"], stage["is_hidden"])
+    
     # 힌트 조회
-    hints_result = await db.execute(
-        select(StageHint).where(StageHint.stage_id == stage_id).order_by(StageHint.order_no)
+    hints_result = await conn.execute(
+        select(*hint_columns)
+        .where(hint_table.c.stage_id == stage_id)
+        .order_by(hint_table.c.order_no)
     )
-    hints = hints_result.scalars().all()
+    hints = hints_result.mappings().all()
     
-    # 힌트별 이미지와 NFC 정보 조회
-    hint_responses = []
-    for hint in hints:
-        # 힌트 이미지 조회
-        images_result = await db.execute(
-            select(HintImage).where(HintImage.hint_id == hint.id).order_by(HintImage.order_no)
+    # 힌트 이미지는 WHERE hint_id IN (...) 한 번으로 조회 후 힌트별로 묶음 (힌트 수만큼 쿼리 반복 방지)
+    images_by_hint = {}
+    if hints:
+        images_result = await conn.execute(
+            select(
+                hint_image_table.c.hint_id,
+                hint_image_table.c.url,
+                hint_image_table.c.alt_text,
+                hint_image_table.c.order_no
+            )
+            .where(hint_image_table.c.hint_id.in_([hint["id"] for hint in hints]))
+            .order_by(hint_image_table.c.hint_id, hint_image_table.c.order_no)
         )
-        images = images_result.scalars().all()
-        
-        # NFC 정보 조회
-        nfc_info = None
-        if hint.nfc_id:
-            nfc_result = await db.execute(select(NFCTag).where(NFCTag.id == hint.nfc_id))
-            nfc_tag = nfc_result.scalar_one_or_none()
-            if nfc_tag:
-                nfc_info = {
-                    "id": str(nfc_tag.id),
-                    "udid": nfc_tag.udid,
-                    "tag_name": nfc_tag.tag_name
-                }
-        
-        hint_responses.append(HintResponse(
-            id=str(hint.id),
-            stage_id=str(hint.stage_id),
-            preset=hint.preset,
-            order_no=hint.order_no,
-            text_block_1=hint.text_block_1,
-            text_block_2=hint.text_block_2,
-            text_block_3=hint.text_block_3,
-            cooldown_sec=hint.cooldown_sec,
-            
-            # [추가] 신규 필드 매핑
-            failure_cooldown_sec=hint.failure_cooldown_sec,
-            location=format_hint_location(hint),
-            radius_m=hint.radius_m,
-            
-            reward_coin=hint.reward_coin,
-            nfc=nfc_info,
-            images=[
-                {
-                    "url": img.url,
-                    "alt": img.alt_text,
-                    "order_no": img.order_no
-                }
-                for img in images
-            ]
-        ))
+        for img in images_result.mappings():
+            images_by_hint.setdefault(img["hint_id"], []).append({
+                "url": img["url"],
+                "alt": img["alt_text"],
+                "order_no": img["order_no"]
+            })
+    
+    # NFC 정보 (프로세스 로컬 캐시 + 캐시에 없는 태그만 일괄 조회)
+    nfc_infos = await load_nfc_infos(conn, {hint["nfc_id"] for hint in hints if hint["nfc_id"]})
+    
+    hint_responses = [
+        build_hint_response(
+            hint,
+            nfc_infos.get(hint["nfc_id"]) if hint["nfc_id"] else None,
+            images_by_hint.get(hint["id"], [])
+        )
+        for hint in hints
+    ]
     
     # 퍼즐 조회
-    puzzles_result = await db.execute(
-        select(StagePuzzle).where(StagePuzzle.stage_id == stage_id)
+    puzzles_result = await conn.execute(
+        select(
+            puzzle_table.c.id,
+            puzzle_table.c.puzzle_style,
+            puzzle_table.c.show_when,
+            puzzle_table.c.config
+        )
+        .where(puzzle_table.c.stage_id == stage_id)
     )
-    puzzles = puzzles_result.scalars().all()
     
     puzzle_list = [
         {
-            "id": str(puzzle.id),
-            "style": puzzle.puzzle_style,
-            "show_when": puzzle.show_when,
-            "config": puzzle.config
+            "id": str(puzzle["id"]),
+            "style": puzzle["puzzle_style"],
+            "show_when": puzzle["show_when"],
+            "config": puzzle["config"]
         }
-        for puzzle in puzzles
+        for puzzle in puzzles_result.mappings()
     ]
     
-    # 해금 연출 설정 조회
-    unlock_result = await db.execute(
-        select(StageUnlock).where(StageUnlock.stage_id == stage_id)
+    # 해금 연출 설정 조회 (스테이지당 1개)
+    unlock_result = await conn.execute(
+        select(
+            unlock_table.c.unlock_preset,
+            unlock_table.c.next_action,
+            unlock_table.c.image_url,
+            unlock_table.c.bottom_text
+        )
+        .where(unlock_table.c.stage_id == stage_id)
+        .limit(1)
     )
-    unlock_config = unlock_result.scalar_one_or_none()
+    unlock_config = unlock_result.mappings().first()
     
     unlock_info = None
     if unlock_config:
         unlock_info = {
-            "preset": unlock_config.unlock_preset,
-            "next_action": unlock_config.next_action,
-            "image_url": unlock_config.image_url,
-            "bottom_text": unlock_config.bottom_text
+            "preset": unlock_config["unlock_preset"],
+            "next_action": unlock_config["next_action"],
+            "image_url": unlock_config["image_url"],
+            "bottom_text": unlock_config["bottom_text"]
         }
     
-    # 응답 데이터 구성
-    return StageDetailResponse(
-        id=str(stage.id),
-        content_id=str(stage.content_id),
-        parent_stage_id=str(stage.parent_stage_id) if stage.parent_stage_id else None,
-        stage_no=stage.stage_no,
-        title=stage.title,
-        description=stage.description,
-        start_button_text=stage.start_button_text,
-        uses_nfc=stage.uses_nfc,
-        is_hidden=stage.is_hidden,
-        time_limit_min=stage.time_limit_min,
-        clear_need_nfc_count=stage.clear_need_nfc_count,
-        clear_time_attack_sec=stage.clear_time_attack_sec,
-        location=format_location(stage),
-        unlock_on_enter_radius=stage.unlock_on_enter_radius,
-        is_open=stage.is_open,
-        unlock_stage_id=str(stage.unlock_stage_id) if stage.unlock_stage_id else None,
-        background_image_url=stage.background_image_url,
-        thumbnail_url=stage.thumbnail_url,
-        meta=stage.meta,
-        created_at=stage.created_at,
+    # 응답 데이터 구성 (DB에서 읽은 값이므로 검증 없이 생성)
+    response = StageDetailResponse.model_construct(
+        id=str(stage["id"]),
+        content_id=str(stage["content_id"]),
+        parent_stage_id=str(stage["parent_stage_id"]) if stage["parent_stage_id"] else None,
+        stage_no=stage["stage_no"],
+        title=stage["title"],
+        description=stage["description"],
+        start_button_text=stage["start_button_text"],
+        uses_nfc=stage["uses_nfc"],
+        is_hidden=stage["is_hidden"],
+        time_limit_min=stage["time_limit_min"],
+        clear_need_nfc_count=stage["clear_need_nfc_count"],
+        clear_time_attack_sec=stage["clear_time_attack_sec"],
+        location=format_location(stage["lon"], stage["lat"], stage["radius_m"]),
+        unlock_on_enter_radius=stage["unlock_on_enter_radius"],
+        is_open=stage["is_open"],
+        unlock_stage_id=str(stage["unlock_stage_id"]) if stage["unlock_stage_id"] else None,
+        background_image_url=stage["background_image_url"],
+        thumbnail_url=stage["thumbnail_url"],
+        meta=stage["meta"],
+        created_at=stage["created_at"],
         hints=hint_responses,
         puzzles=puzzle_list,
         unlock_config=unlock_info
     )
+    
+    payload = response.model_dump_json()
+    await cache_set(cache_key, payload, settings.STAGE_CACHE_TTL_SEC)
+    
+    return Response(content=payload, media_type="application/json", headers={"X-Cache": "MISS"})
 
 @router.get("/{stage_id}/hints", response_model=List[HintResponse])
 async def get_stage_hints(
@@ -221,72 +360,41 @@ async def get_stage_hints(
     스테이지 힌트 목록 조회
     """
     
-    # 스테이지 존재 확인
-    stage_result = await db.execute(select(Stage).where(Stage.id == stage_id))
-    stage = stage_result.scalar_one_or_none()
+    # ORM 세션 대신 세션이 사용 중인 연결로 Core select 실행
+    conn = await db.connection()
     
-    if not stage:
+    # 스테이지 존재 확인 + 사용자 권한 확인 (콘텐츠 참여 여부 EXISTS를 같은 쿼리로)
+    stage_result = await conn.execute(
+        select(stage_table.c.id, content_joined_expr(current_user.id, stage_table.c.content_id))
+        .where(stage_table.c.id == stage_id)
+    )
+    row = stage_result.one_or_none()
+    
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Stage not found"
         )
     
-    # 사용자 권한 확인 (콘텐츠 참여 여부)
-    from app.models import UserContentProgress
-    content_progress_result = await db.execute(
-        select(UserContentProgress).where(
-            and_(
-                UserContentProgress.user_id == current_user.id,
-                UserContentProgress.content_id == stage.content_id
-            )
-        )
-    )
-    content_progress = content_progress_result.scalar_one_or_none()
-    
-    if not content_progress:
+    if not row.joined:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User has not joined this content"
         )
     
     # 힌트 조회
-    hints_result = await db.execute(
-        select(StageHint).where(StageHint.stage_id == stage_id).order_by(StageHint.order_no)
+    hints_result = await conn.execute(
+        select(*hint_columns)
+        .where(hint_table.c.stage_id == stage_id)
+        .order_by(hint_table.c.order_no)
     )
-    hints = hints_result.scalars().all()
+    hints = hints_result.mappings().all()
     
-    # 힌트별 NFC 정보 조회
-    hint_responses = []
-    for hint in hints:
-        nfc_info = None
-        if hint.nfc_id:
-            nfc_result = await db.execute(select(NFCTag).where(NFCTag.id == hint.nfc_id))
-            nfc_tag = nfc_result.scalar_one_or_none()
-            if nfc_tag:
-                nfc_info = {
-                    "id": str(nfc_tag.id),
-                    "udid": nfc_tag.udid,
-                    "tag_name": nfc_tag.tag_name
-                }
-        
-        hint_responses.append(HintResponse(
-            id=str(hint.id),
-            stage_id=str(hint.stage_id),
-            preset=hint.preset,
-            order_no=hint.order_no,
-            text_block_1=hint.text_block_1,
-            text_block_2=hint.text_block_2,
-            text_block_3=hint.text_block_3,
-            cooldown_sec=hint.cooldown_sec,
-            
-            # [추가] 신규 필드 매핑
-            failure_cooldown_sec=hint.failure_cooldown_sec,
-            location=format_hint_location(hint),
-            radius_m=hint.radius_m,
-            
-            reward_coin=hint.reward_coin,
-            nfc=nfc_info,
-            images=[]  # 이미지는 상세 조회에서만 제공
-        ))
+    # 힌트들의 NFC 정보 (프로세스 로컬 캐시 + 캐시에 없는 태그만 WHERE id IN (...) 한 번으로 조회)
+    nfc_infos = await load_nfc_infos(conn, {hint["nfc_id"] for hint in hints if hint["nfc_id"]})
     
-    return hint_responses
\ No newline at end of file
+    # 이미지는 상세 조회에서만 제공
+    return [
+        build_hint_response(hint, nfc_infos.get(hint["nfc_id"]) if hint["nfc_id"] else None, [])
+        for hint in hints
+    ]
@@ -0,0 +1,144 @@
+# app/core/cache.py
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from uuid import UUID
+import asyncio
+import time
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+# 전역 Redis 클라이언트 (레이트 제한, 캐시)
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# 앱 리워드 목록 캐시 키 prefix (관리자 매장/상품 수정 시 일괄 무효화)
+REWARDS_CACHE_PREFIX = "rewards:v1:"
+
+# 앱 스테이지 상세 캐시 키 prefix (관리자 스테이지/힌트/NFC 수정 시 일괄 무효화)
+STAGE_CACHE_PREFIX = "stage:v1:"
+
+# 스테이지 캐시 무효화 알림 채널 (워커별 프로세스 로컬 캐시 정리용, 메시지: NFC 태그 ID 또는 "*")
+STAGE_INVALIDATE_CHANNEL = "stage:invalidate"
+STAGE_INVALIDATE_ALL = "*"
+
+
+async def cache_get(key: str) -> Optional[str]:
+    """캐시 조회 (Redis 장애 시 None 반환 → DB 조회로 진행)"""
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError as e:
+        print(f"Cache get failed ({key}): {e}")
+        return None
+
+
+async def cache_set(key: str, value: str, ttl_sec: int) -> None:
+    """캐시 저장 (실패해도 API 응답에는 영향 없음)"""
+    try:
+        await redis_client.set(key, value, ex=ttl_sec)
+    except redis.RedisError as e:
+        print(f"Cache set failed ({key}): {e}")
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """prefix로 시작하는 캐시 키 일괄 삭제 (관리자 수정 시 무효화용)"""
+    try:
+        keys = [key async for key in redis_client.scan_iter(match=f"{prefix}*", count=500)]
+        if keys:
+            await redis_client.delete(*keys)
+    except redis.RedisError as e:
+        print(f"Cache invalidation failed ({prefix}): {e}")
+
+
+async def invalidate_rewards_cache() -> None:
+    """앱 리워드 목록 캐시 전체 무효화"""
+    await cache_delete_prefix(REWARDS_CACHE_PREFIX)
+
+
+async def invalidate_stage_cache(nfc_id: Optional[UUID] = None) -> None:
+    """
+    앱 스테이지 상세 캐시 전체 무효화
+    Redis 캐시를 지우고, 다른 워커들도 로컬 캐시를 정리하도록 무효화 채널에 알립니다.
+    (nfc_id를 주면 해당 NFC 태그 정보 캐시도 정리)
+    """
+    await cache_delete_prefix(STAGE_CACHE_PREFIX)
+    
+    message = str(nfc_id) if nfc_id else STAGE_INVALIDATE_ALL
+    # 현재 워커는 바로 정리 (구독 메시지를 기다리지 않음)
+    apply_stage_invalidation(message)
+    try:
+        await redis_client.publish(STAGE_INVALIDATE_CHANNEL, message)
+    except redis.RedisError as e:
+        print(f"Cache invalidation publish failed ({message}): {e}")
+
+
+async def close_cache() -> None:
+    """앱 종료 시 Redis 연결 정리"""
+    await redis_client.aclose()
+
+
+class LocalTTLCache:
+    """
+    프로세스 로컬 TTL + LRU 캐시 (거의 바뀌지 않는 참조 데이터용)
+    워커 프로세스마다 따로 유지되므로, 다른 워커의 수정은 TTL 이후 반영됩니다.
+    """
+
+    def __init__(self, maxsize: int, ttl_sec: float):
+        self.maxsize = maxsize
+        self.ttl_sec = ttl_sec
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl_sec, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+
+# NFC 태그 표시 정보 캐시 (nfc_id → {"id", "udid", "tag_name"})
+nfc_info_cache = LocalTTLCache(maxsize=5000, ttl_sec=600)
+
+
+def apply_stage_invalidation(message: str) -> None:
+    """무효화 메시지에 따라 프로세스 로컬 캐시 정리"""
+    if message == STAGE_INVALIDATE_ALL:
+        return
+    try:
+        nfc_info_cache.pop(UUID(message))
+    except ValueError:
+        print(f"Invalid stage invalidation message: {message}")
+
+
+async def listen_stage_invalidation(retry_sec: float = 5) -> None:
+    """
+    스테이지 캐시 무효화 채널 구독 (앱 시작 시 백그라운드 태스크로 실행)
+    다른 워커에서 관리자 수정이 일어나면 이 워커의 로컬 캐시도 TTL을 기다리지 않고 정리합니다.
+    Redis 연결이 끊기면 retry_sec 후 다시 구독합니다.
+    """
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(STAGE_INVALIDATE_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    apply_stage_invalidation(message["data"])
+        except redis.RedisError as e:
+            print(f"Stage invalidation listener error: {e}")
+        finally:
+            await pubsub.aclose()
+        await asyncio.sleep(retry_sec)
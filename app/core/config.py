@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -22,8 +22,20 @@ class Settings(BaseSettings):
         "http://121.126.223.205:3000"
     ]
     
+    # 허용 호스트 (DEBUG=false일 때 TrustedHostMiddleware에 사용, 와일드카드 없이 정확한 호스트명)
+    ALLOWED_HOSTS: List[str] = ["api.xpg.example.com", "localhost"]
+    
     # 데이터베이스 설정
     DATABASE_URL: str = ""
+    # asyncpg prepared statement 캐시 크기 (PgBouncer transaction 모드 사용 시 DB_USE_PGBOUNCER=true → 0으로 비활성화)
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    DB_USE_PGBOUNCER: bool = False
+    # 짧은 쿼리 위주라 PostgreSQL JIT 컴파일 비용이 실행 시간보다 큼 → 연결 단위로 끔
+    DB_JIT_ENABLED: bool = False
+    # SQLAlchemy 컴파일된 SQL 캐시 크기 (statement 구조별 1개, 기본 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # 시작 시 주요 테이블 존재 여부 점검(init_db) 실행 여부 (기본 꺼짐, 필요할 때만 INIT_DB=true)
+    INIT_DB: bool = False
     
     # JWT 설정
     SECRET_KEY: str = ""
@@ -48,6 +60,13 @@ class Settings(BaseSettings):
     
     # Redis 설정 (레이트 제한, 캐시)
     REDIS_URL: str = "redis://localhost:6379"
+    REWARDS_CACHE_TTL_SEC: int = 30
+    ACTIVE_REWARDS_REFRESH_SEC: int = 30
+    STAGE_CACHE_TTL_SEC: int = 300
+    
+    # NFC 스캔 로그 월별 파티션 (미리 만들어 둘 개월 수, 보관 개월 수: None이면 삭제하지 않음)
+    NFC_SCAN_LOG_PARTITION_MONTHS_AHEAD: int = 3
+    NFC_SCAN_LOG_RETENTION_MONTHS: Optional[int] = None
     
     # 페이지네이션 기본값
     DEFAULT_PAGE_SIZE: int = 20
@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy import MetaData, create_engine, event, text
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
@@ -18,6 +18,18 @@ sync_engine = create_engine(
     pool_recycle=3600
 )
 
+# asyncpg prepared statement 캐시 (같은 SQL의 parse/plan 재사용)
+# PgBouncer transaction 모드에서는 연결이 바뀌면 prepared statement가 사라지므로 끔
+statement_cache_size = 0 if settings.DB_USE_PGBOUNCER else settings.DB_STATEMENT_CACHE_SIZE
+
+async_connect_args = {
+    "prepared_statement_cache_size": statement_cache_size,  # SQLAlchemy asyncpg 어댑터 캐시
+    "statement_cache_size": statement_cache_size,  # asyncpg 자체 캐시
+}
+# PgBouncer는 알 수 없는 startup 파라미터를 거부할 수 있으므로 직접 연결일 때만 설정
+if not settings.DB_JIT_ENABLED and not settings.DB_USE_PGBOUNCER:
+    async_connect_args["server_settings"] = {"jit": "off"}
+
 # 비동기 데이터베이스 엔진 (FastAPI용)
 async_engine = create_async_engine(
     async_database_url,
@@ -25,7 +37,10 @@ async_engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=20,
     max_overflow=0,
-    pool_recycle=3600
+    pool_recycle=3600,
+    # 같은 구조의 select(...)는 파라미터만 바꿔 컴파일 결과 재사용 (관리자/앱 라우터 statement 수 고려)
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=async_connect_args
 )
 
 # 세션 생성기
@@ -36,9 +51,9 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
-# 모든 모델의 베이스 클래스
-Base = declarative_base()
-Base.metadata.schema = "public"
+# 모든 모델의 베이스 클래스 (SQLAlchemy 2.0 DeclarativeBase, 기존 Column 선언 모델도 그대로 사용)
+class Base(DeclarativeBase):
+    metadata = MetaData(schema="public")
 
 
 # 의존성: 비동기 데이터베이스 세션
@@ -51,6 +66,46 @@ async def get_async_db():
             await session.close()
 
 
+# 트랜잭션 범위 헬퍼
+@asynccontextmanager
+async def transaction(session: AsyncSession):
+    """
+    블록이 정상 종료되면 commit, 예외(HTTPException 포함)가 발생하면 rollback 후 다시 발생시킵니다.
+    get_current_user 등 의존성의 조회로 세션이 이미 autobegin 상태일 수 있으므로 db.begin() 대신 사용합니다.
+    """
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+
+
+# 쿼리 수 측정 헬퍼 (N+1 회귀 확인용, 테스트/디버깅 전용)
+@contextmanager
+def count_queries(engine=None):
+    """
+    블록 안에서 엔진으로 실행된 SQL 문을 리스트로 수집합니다.
+    엔진 단위 리스너이므로 동시에 처리되는 다른 요청의 쿼리도 함께 집계됩니다.
+    
+    예) with count_queries() as queries:
+            await client.get(f"/api/v1/stages/{stage_id}")
+        assert len(queries) <= 6
+    """
+    target = engine or async_engine
+    target = getattr(target, "sync_engine", target)
+    statements = []
+    
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", _before_cursor_execute)
+
+
 # 의존성: 동기 데이터베이스 세션 (필요시)
 def get_sync_db():
     """동기 DB 세션 (테스트나 스크립트용)"""
@@ -64,7 +119,9 @@ def get_sync_db():
 # 데이터베이스 확장 기능 확인
 async def check_db_extensions():
     """필요한 PostgreSQL 확장들이 설치되어 있는지 확인"""
-    required_extensions = ['uuid-ossp', 'postgis', 'citext']
+    # pgcrypto: gen_random_uuid() (PostgreSQL 13 이상은 기본 내장, 이전 버전용)
+    # uuid-ossp: 기존 DB의 uuid_generate_v4() 기본값 호환용
+    required_extensions = ['pgcrypto', 'uuid-ossp', 'postgis', 'citext']
     
     async with AsyncSessionLocal() as session:
         for ext in required_extensions:
@@ -115,11 +172,3 @@ async def init_db():
                 print(f"Table {table}: {status}")
             except Exception as e:
                 print(f"Error checking table {table}: {e}")
-
-
-# UUID 생성 함수
-async def generate_uuid():
-    """PostgreSQL의 uuid_generate_v4() 사용해서 UUID 생성"""
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(text("SELECT uuid_generate_v4()"))
-        return result.scalar()
\ No newline at end of file
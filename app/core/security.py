@@ -1,14 +1,36 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from passlib.hash import bcrypt
+import bcrypt
+import hashlib
+import re
 import secrets
+import string
+import threading
+import time
 
 from app.core.config import settings
 
 # 비밀번호 해싱 컨텍스트 (bcrypt 사용 - 문서에 명시됨)
+# 해싱/검증은 bcrypt 모듈을 직접 사용하고, passlib은 bcrypt가 아닌 기존 해시 검증에만 사용
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_BYTES = 72  # bcrypt는 72바이트까지만 사용 (passlib과 동일하게 잘라서 처리)
+
+# 로그인 ID 형식 ([A-Za-z0-9._-]만 허용, \Z: 끝의 개행 문자도 허용하지 않음)
+_LOGIN_ID_RE = re.compile(r'^[A-Za-z0-9._-]+\Z')
+
+# 비밀번호 문자 종류 판별용 ASCII 집합 (ASCII가 아닌 문자는 str 메서드로 판별)
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_DIGIT = frozenset(string.digits)
+
+# verify_token 결과 캐시 (토큰 해시 → (payload, exp)), 토큰 만료 시각까지만 유효
+TOKEN_CACHE_MAXSIZE = 10000
+_token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -35,22 +57,59 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def _token_cache_key(token: str) -> bytes:
+    """토큰 원문 대신 해시를 캐시 키로 사용 (메모리에 토큰을 보관하지 않음)"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 def verify_token(token: str) -> Optional[dict]:
-    """JWT 토큰 검증 및 페이로드 반환"""
+    """JWT 토큰 검증 및 페이로드 반환 (검증된 토큰은 만료 전까지 서명 검증 생략)"""
+    key = _token_cache_key(token)
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            payload, exp = cached
+            if exp > time.time():
+                _token_cache.move_to_end(key)
+                return dict(payload)
+            del _token_cache[key]
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    
+    # exp가 없는 토큰은 캐시하지 않음
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[key] = (payload, exp)
+            if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+                _token_cache.popitem(last=False)
+    
+    return dict(payload)
+
+
+def invalidate_token_cache(token: str) -> None:
+    """토큰 검증 캐시에서 제거 (로그아웃 시)"""
+    with _token_cache_lock:
+        _token_cache.pop(_token_cache_key(token), None)
 
 
 def get_password_hash(password: str) -> str:
-    """비밀번호 해싱 (bcrypt 사용)"""
-    return pwd_context.hash(password)
+    """비밀번호 해싱 (bcrypt 사용, CPU 부하가 크므로 async 핸들러에서는 asyncio.to_thread로 호출)"""
+    return bcrypt.hashpw(password.encode()[:BCRYPT_MAX_BYTES], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+    """비밀번호 검증 (CPU 부하가 크므로 async 핸들러에서는 asyncio.to_thread로 호출)"""
+    if hashed_password.startswith("$2"):
+        try:
+            return bcrypt.checkpw(plain_password.encode()[:BCRYPT_MAX_BYTES], hashed_password.encode())
+        except ValueError:
+            return False
+    # bcrypt가 아닌 기존 해시
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -102,11 +161,7 @@ def verify_password_reset_token(token: str) -> Optional[str]:
 
 def validate_login_id(login_id: str) -> bool:
     """로그인 ID 형식 검증 (3~30자, [A-Za-z0-9._-])"""
-    import re
-    if not (3 <= len(login_id) <= 30):
-        return False
-    pattern = r'^[A-Za-z0-9._-]+$'
-    return bool(re.match(pattern, login_id))
+    return 3 <= len(login_id) <= 30 and _LOGIN_ID_RE.match(login_id) is not None
 
 
 def validate_password_strength(password: str) -> dict:
@@ -119,13 +174,32 @@ def validate_password_strength(password: str) -> dict:
     if len(password) > 128:
         errors.append("비밀번호는 128자를 초과할 수 없습니다.")
     
-    if not any(c.islower() for c in password):
+    # 문자 종류를 한 번의 순회로 확인 (모두 찾으면 중단)
+    has_lower = has_upper = has_digit = False
+    for c in password:
+        if c in _ASCII_LOWER:
+            has_lower = True
+        elif c in _ASCII_UPPER:
+            has_upper = True
+        elif c in _ASCII_DIGIT:
+            has_digit = True
+        elif not c.isascii():
+            if c.islower():
+                has_lower = True
+            elif c.isupper():
+                has_upper = True
+            elif c.isdigit():
+                has_digit = True
+        if has_lower and has_upper and has_digit:
+            break
+    
+    if not has_lower:
         errors.append("소문자를 포함해야 합니다.")
     
-    if not any(c.isupper() for c in password):
+    if not has_upper:
         errors.append("대문자를 포함해야 합니다.")
     
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         errors.append("숫자를 포함해야 합니다.")
     
     return {
@@ -30,7 +30,7 @@ from app.models.progress import (
 
 # 매장 및 리워드 모델
 from app.models.store import Store
-from app.models.reward import StoreReward
+from app.models.reward import StoreReward, MvActiveReward
 
 # 공지사항 모델
 from app.models.notification import Notification
@@ -70,6 +70,7 @@ __all__ = [
     # Store and Reward models
     "Store",
     "StoreReward",
+    "MvActiveReward",
     
     # Notification models
     "Notification",
@@ -2,8 +2,7 @@ from sqlalchemy import Column, String, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
 
 
 class Admin(Base):
@@ -12,7 +11,7 @@ class Admin(Base):
     __tablename__ = "admins"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 연결된 사용자 (users 중 권한 부여)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, unique=True)
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, String, DateTime, CheckConstraint, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from functools import cached_property
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID, ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
+
+# 인증 제공자 (PostgreSQL ENUM)
+AUTH_PROVIDER_ENUM = ENUM(
+    'local', 'google', 'apple', 'kakao', 'naver', 'facebook', 'github', 'line',
+    name='auth_provider_enum'
+)
 
 
 class AuthIdentity(Base):
@@ -12,13 +18,13 @@ class AuthIdentity(Base):
     __tablename__ = "auth_identities"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 사용자 연결
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # 인증 제공자 (local|google|apple|kakao|naver|facebook|github|line)
-    provider = Column(Text, nullable=False)
+    provider = Column(AUTH_PROVIDER_ENUM, nullable=False)
     
     # 제공자별 사용자 식별자 (local: login_id, SNS: subject/uid)
     provider_user_id = Column(Text, nullable=False)
@@ -36,12 +42,15 @@ class AuthIdentity(Base):
     # SNS 프로필 스냅샷 등 메타데이터
     meta = Column(JSONB, nullable=True)
     
-    # 제약조건
+    # 인덱스
     __table_args__ = (
-        # 제공자 검증
-        CheckConstraint(
-            "provider IN ('local', 'google', 'apple', 'kakao', 'naver', 'facebook', 'github', 'line')",
-            name="auth_identities_provider_chk"
+        # meta(JSONB) 조회용 GIN 인덱스 (jsonb_path_ops: @> 포함 검색 전용, 기본 jsonb_ops보다 작음)
+        # meta 조회는 meta @> '{"sub": "..."}' 형태의 포함 검색으로 작성해야 인덱스를 사용합니다.
+        Index(
+            "ix_auth_identities_meta_gin",
+            meta,
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"}
         ),
     )
     
@@ -51,16 +60,26 @@ class AuthIdentity(Base):
     def __repr__(self):
         return f"<AuthIdentity(id={self.id}, provider='{self.provider}', user_id={self.user_id})>"
     
-    @property
+    # provider는 생성 후 바뀌지 않으므로 첫 계산 결과를 인스턴스에 저장
+    @cached_property
     def is_local(self) -> bool:
         """로컬 인증인지 확인"""
         return self.provider == 'local'
     
-    @property
+    @cached_property
     def is_social(self) -> bool:
         """소셜 로그인인지 확인"""
         return self.provider != 'local'
     
-    def update_last_login(self):
-        """최근 로그인 시각 업데이트"""
-        self.last_login_at = func.now()
\ No newline at end of file
+    @classmethod
+    async def touch_last_login(cls, session, identity_id):
+        """
+        최근 로그인 시각 업데이트
+        로드된 객체를 수정해 flush하는 대신 UPDATE 한 번으로 처리 (다른 변경 속성과 무관하게 실행)
+        """
+        await session.execute(
+            update(cls)
+            .where(cls.id == identity_id)
+            .values(last_login_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
\ No newline at end of file
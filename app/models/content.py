@@ -1,20 +1,22 @@
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, CheckConstraint, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, CheckConstraint, ForeignKey, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.ext.hybrid import hybrid_property
 from geoalchemy2 import Geography
-from app.models.base import Base
-import uuid
+from app.models.base import Base, BaseModel
 
+# 값 목록이 고정된 컬럼은 PostgreSQL ENUM 타입 사용 (Text + CHECK 대신 4바이트 저장/비교)
+# 기존 DB 반영: migrations/0001_column_types.sql
+CONTENT_TYPE_ENUM = ENUM('story', 'domination', name='content_type_enum')
+EXPOSURE_SLOT_ENUM = ENUM('story', 'event', name='content_exposure_slot_enum')
+PREREQUISITE_REQUIREMENT_ENUM = ENUM('cleared', name='content_prerequisite_requirement_enum')
 
-class Content(Base):
-    """콘텐츠 모델 (DB 문서의 contents 테이블)"""
+
+class Content(BaseModel):
+    """콘텐츠 모델 (DB 문서의 contents 테이블, id/created_at/updated_at은 BaseModel)"""
     
     __tablename__ = "contents"
     
-    # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
-    
     # 기본 정보
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
@@ -24,10 +26,10 @@ class Content(Base):
     background_image_url = Column(Text, nullable=True)
     
     # 콘텐츠 유형 (story|domination)
-    content_type = Column(Text, nullable=False)
+    content_type = Column(CONTENT_TYPE_ENUM, nullable=False)
 
     # DB에 맞춰 컬럼명 및 기본값 수정
-    exposure_slot = Column(Text, nullable=False, default='story', server_default='story')
+    exposure_slot = Column(EXPOSURE_SLOT_ENUM, nullable=False, default='story', server_default='story')
     
     # 기간 설정
     start_at = Column(DateTime(timezone=True), nullable=True)
@@ -54,25 +56,12 @@ class Content(Base):
     # 관리자 정보
     created_by = Column(UUID(as_uuid=True), ForeignKey("admins.id"), nullable=True)
     
-    # 타임스탬프
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
-
     # [추가] 테스트 콘텐츠 여부 컬럼
     is_test = Column(Boolean, nullable=False, default=False, server_default='false') 
 
     
     # 제약조건
     __table_args__ = (
-        CheckConstraint(
-            "content_type IN ('story', 'domination')",
-            name="contents_content_type_chk"
-        ),
-        # DB에 맞춰 제약조건 값 수정
-        CheckConstraint(
-            "exposure_slot IN ('story', 'event')",
-            name="contents_exposure_slot_check"
-        ),
         CheckConstraint(
             "stage_count IS NULL OR (stage_count >= 1 AND stage_count <= 10)",
             name="contents_stage_count_range_chk"
@@ -85,33 +74,43 @@ class Content(Base):
             "next_content_id IS NULL OR next_content_id != id",
             name="contents_next_not_self_chk"
         ),
+        # 앱 콘텐츠 목록: is_open = true AND exposure_slot = ? ORDER BY created_at DESC LIMIT n
+        # 공개 콘텐츠만 담는 부분 인덱스로 정렬 없이 최신순으로 읽고, 기간 조건은 읽으면서 필터링
+        Index(
+            "ix_contents_feed",
+            exposure_slot,
+            text("created_at DESC"),
+            postgresql_where=text("is_open = true")
+        ),
     )
     
     # 관계 설정 (기존과 동일)
+    # passive_deletes: DB의 ON DELETE CASCADE/SET NULL에 맡겨, 삭제 시 하위 행을 컬렉션마다 조회하지 않음
     created_by_admin = relationship("Admin", back_populates="created_contents")
-    next_content = relationship("Content", remote_side=[id])
-    stages = relationship("Stage", back_populates="content", cascade="all, delete-orphan")
+    next_content = relationship("Content", remote_side="Content.id")
+    stages = relationship("Stage", back_populates="content", cascade="all, delete-orphan", passive_deletes=True)
     prerequisites_as_content = relationship(
         "ContentPrerequisite", 
         foreign_keys="ContentPrerequisite.content_id",
-        back_populates="content"
+        back_populates="content",
+        passive_deletes=True
     )
     prerequisites_as_required = relationship(
         "ContentPrerequisite", 
         foreign_keys="ContentPrerequisite.required_content_id",
         back_populates="required_content"
     )
-    user_progress = relationship("UserContentProgress", back_populates="content", cascade="all, delete-orphan")
-    rewards = relationship("RewardLedger", back_populates="content")
+    user_progress = relationship("UserContentProgress", back_populates="content", cascade="all, delete-orphan", passive_deletes=True)
+    rewards = relationship("RewardLedger", back_populates="content", passive_deletes=True)
     
     def __repr__(self):
         return f"<Content(id={self.id}, title='{self.title}', type='{self.content_type}')>"
     
-    @property
+    @hybrid_property
     def is_story(self) -> bool:
         return self.content_type == 'story'
     
-    @property
+    @hybrid_property
     def is_domination(self) -> bool:
         return self.content_type == 'domination'
     
@@ -126,13 +125,9 @@ class ContentPrerequisite(Base):
     
     content_id = Column(UUID(as_uuid=True), ForeignKey("contents.id", ondelete="CASCADE"), primary_key=True)
     required_content_id = Column(UUID(as_uuid=True), ForeignKey("contents.id", ondelete="RESTRICT"), primary_key=True)
-    requirement = Column(Text, nullable=False, default='cleared')
+    requirement = Column(PREREQUISITE_REQUIREMENT_ENUM, nullable=False, default='cleared')
     
     __table_args__ = (
-        CheckConstraint(
-            "requirement IN ('cleared')",
-            name="content_prerequisites_requirement_chk"
-        ),
         CheckConstraint(
             "content_id != required_content_id",
             name="content_prerequisites_not_self_chk"
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, CheckConstraint, ForeignKey, Text, BigInteger
-from sqlalchemy.dialects.postgresql import UUID, DOUBLE_PRECISION
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, Integer, SmallInteger, DateTime, ForeignKey, Text, BigInteger, Index, Sequence, text
+from sqlalchemy import cast
+from sqlalchemy.dialects.postgresql import UUID, ENUM
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func
-from geoalchemy2 import Geography
-from app.models.base import Base
-import uuid
+from geoalchemy2 import Geography, Geometry
+from app.models.base import Base, uuid7
+
+# NFC 태그 분류 (PostgreSQL ENUM)
+NFC_CATEGORY_ENUM = ENUM(
+    'none', 'stage', 'hint', 'checkpoint', 'base', 'safezone', 'treasure',
+    name='nfc_category_enum'
+)
 
 
 class NFCTag(Base):
@@ -13,10 +19,10 @@ class NFCTag(Base):
     __tablename__ = "nfc_tags"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
-    # 고유 식별자
-    udid = Column(Text, nullable=False, unique=True)
+    # 고유 식별자 (관리자/앱 등록 스키마의 최대 길이와 동일하게 제한)
+    udid = Column(String(100), nullable=False, unique=True, comment="NFC 태그 고유 UDID")
     
     # 태그 정보
     tag_name = Column(Text, nullable=False)
@@ -28,28 +34,23 @@ class NFCTag(Base):
     media_url = Column(Text, nullable=True)
     link_url = Column(Text, nullable=True)
     
-    # 위치 정보
-    latitude = Column(DOUBLE_PRECISION, nullable=True)
-    longitude = Column(DOUBLE_PRECISION, nullable=True)
+    # 위치 정보 (geom 하나만 저장, 반경 검색은 geom의 GiST 인덱스로 ST_DWithin 사용)
     geom = Column(Geography('POINT', srid=4326), nullable=True)
     
+    # 위도/경도는 geom에서 SQL로 계산해 함께 로드 (읽기 전용, 좌표 변경은 geom으로)
+    latitude = column_property(func.ST_Y(cast(geom, Geometry('POINT', srid=4326))))
+    longitude = column_property(func.ST_X(cast(geom, Geometry('POINT', srid=4326))))
+    
     # 태깅 설정
     tap_message = Column(Text, nullable=True)
-    point_reward = Column(Integer, nullable=False, default=0)
-    cooldown_sec = Column(Integer, nullable=False, default=0)
+    # 포인트/쿨다운은 SMALLINT(2바이트, 최대 32767)로 행 폭을 줄임 (use_limit은 범위가 커질 수 있어 INTEGER 유지)
+    point_reward = Column(SmallInteger, nullable=False, default=0)
+    cooldown_sec = Column(SmallInteger, nullable=False, default=0)
     use_limit = Column(Integer, nullable=True)
     
     # 활성화 및 분류
     is_active = Column(Boolean, nullable=False, default=True)
-    category = Column(Text, nullable=True)
-    
-    # 제약조건
-    __table_args__ = (
-        CheckConstraint(
-            "category IS NULL OR category IN ('none', 'stage', 'hint', 'checkpoint', 'base', 'safezone', 'treasure')",
-            name="nfc_tags_category_chk"
-        ),
-    )
+    category = Column(NFC_CATEGORY_ENUM, nullable=True)
     
     # 관계 설정
     hints = relationship("StageHint", back_populates="nfc")
@@ -61,7 +62,7 @@ class NFCTag(Base):
     @property
     def has_coordinates(self) -> bool:
         """좌표 정보가 있는지 확인"""
-        return self.latitude is not None and self.longitude is not None
+        return self.geom is not None
     
     @property
     def has_cooldown(self) -> bool:
@@ -79,13 +80,23 @@ class NFCTag(Base):
         return self.category == 'hint'
 
 
+NFC_SCAN_LOG_ID_SEQ = Sequence("nfc_scan_logs_id_seq", cache=100, metadata=Base.metadata)
+
+
 class NFCScanLog(Base):
     """NFC 스캔 로그 모델 (DB 문서의 nfc_scan_logs 테이블)"""
     
     __tablename__ = "nfc_scan_logs"
     
-    # 기본키 (bigserial)
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # 기본키 (id + scanned_at: 파티션 테이블은 파티션 키가 기본키에 포함되어야 함)
+    # 스캔이 몰릴 때 nextval() 부담을 줄이도록 시퀀스 CACHE 100 (세션별로 100개씩 미리 할당, 로그라 번호 빈틈은 무관)
+    # IDENTITY 컬럼은 PostgreSQL 17 미만에서 파티션 테이블에 쓸 수 없으므로 시퀀스 기본값 사용
+    id = Column(
+        BigInteger,
+        NFC_SCAN_LOG_ID_SEQ,
+        server_default=NFC_SCAN_LOG_ID_SEQ.next_value(),
+        primary_key=True
+    )
     
     # 사용자 (삭제 시 NULL로 설정)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -93,8 +104,8 @@ class NFCScanLog(Base):
     # NFC 태그 (삭제 시 NULL로 설정)
     nfc_id = Column(UUID(as_uuid=True), ForeignKey("nfc_tags.id", ondelete="SET NULL"), nullable=True)
     
-    # 스캔 시각
-    scanned_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # 스캔 시각 (월 단위 RANGE 파티션 키)
+    scanned_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     
     # 허용 여부 및 사유
     allowed = Column(Boolean, nullable=False, default=True)
@@ -103,6 +114,34 @@ class NFCScanLog(Base):
     # 관련 힌트 (삭제 시 NULL로 설정, 트리거로 자동 보정)
     hint_id = Column(UUID(as_uuid=True), ForeignKey("stage_hints.id", ondelete="SET NULL"), nullable=True)
     
+    # 스캔 로그는 대부분 허용된 스캔만 조회하므로 allowed = true 부분 인덱스로 크기를 줄임
+    # 월별 파티션(nfc_scan_logs_YYYY_MM)은 app/services/scan_log_partitions.py에서 생성/정리
+    __table_args__ = (
+        # 사용자의 최근 성공 스캔
+        Index(
+            "ix_nfc_scan_logs_user_time_ok",
+            user_id,
+            scanned_at.desc(),
+            postgresql_where=text("allowed = true")
+        ),
+        # 태그별 쿨다운 확인 (최근 성공 스캔 1건) 및 사용 횟수 제한 집계
+        Index(
+            "ix_nfc_scan_logs_nfc_user_time",
+            nfc_id,
+            user_id,
+            scanned_at.desc(),
+            postgresql_where=text("allowed = true")
+        ),
+        # 기간별 통계/분석: 추가 전용 로그라 scanned_at 순서가 물리 저장 순서와 일치 → BRIN (B-tree보다 훨씬 작음)
+        Index(
+            "ix_nfc_scan_logs_scanned_brin",
+            scanned_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+        {"postgresql_partition_by": "RANGE (scanned_at)"},
+    )
+    
     # 관계 설정
     user = relationship("User", back_populates="nfc_scan_logs")
     nfc = relationship("NFCTag", back_populates="scan_logs")
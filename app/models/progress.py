@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, BigInteger
-from sqlalchemy.dialects.postgresql import UUID
+from functools import cached_property
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, BigInteger, Identity, Index, case, literal_column, select, text
+from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from app.models.base import Base
+from app.models.stage import Stage
+
+# 콘텐츠 진행 상태 (PostgreSQL ENUM)
+CONTENT_PROGRESS_STATUS_ENUM = ENUM('joined', 'in_progress', 'cleared', 'left', name='content_progress_status_enum')
 
 
 class UserContentProgress(Base):
@@ -15,7 +21,7 @@ class UserContentProgress(Base):
     content_id = Column(UUID(as_uuid=True), ForeignKey("contents.id", ondelete="CASCADE"), primary_key=True)
     
     # 진행 상태 (joined|in_progress|cleared|left)
-    status = Column(Text, nullable=False)
+    status = Column(CONTENT_PROGRESS_STATUS_ENUM, nullable=False)
     
     # 시간 정보
     joined_at = Column(DateTime(timezone=True), nullable=True)
@@ -25,6 +31,15 @@ class UserContentProgress(Base):
     # 마지막 진행 스테이지
     last_stage_no = Column(Text, nullable=True)
     
+    __table_args__ = (
+        # 콘텐츠별 클리어 사용자 집계/조회 (클리어 행만 담는 부분 인덱스)
+        Index(
+            "ix_user_content_progress_cleared",
+            content_id,
+            postgresql_where=text("status = 'cleared'")
+        ),
+    )
+    
     # 관계 설정
     user = relationship("User", back_populates="content_progress")
     content = relationship("Content", back_populates="user_progress")
@@ -32,22 +47,27 @@ class UserContentProgress(Base):
     def __repr__(self):
         return f"<UserContentProgress(user_id={self.user_id}, content_id={self.content_id}, status='{self.status}')>"
     
-    @property
+    @hybrid_property
     def is_joined(self) -> bool:
         """참여한 상태인지 확인"""
         return self.status == 'joined'
     
-    @property
+    @hybrid_property
     def is_in_progress(self) -> bool:
         """진행 중인지 확인"""
         return self.status == 'in_progress'
     
-    @property
+    @hybrid_property
     def is_cleared(self) -> bool:
         """클리어했는지 확인"""
         return self.status == 'cleared'
     
-    @property
+    @is_cleared.expression
+    def is_cleared(cls):
+        # 바인드 파라미터 대신 리터럴로 렌더링해야 부분 인덱스(status = 'cleared')를 사용할 수 있음
+        return cls.status == literal_column("'cleared'")
+    
+    @hybrid_property
     def is_left(self) -> bool:
         """중도 포기했는지 확인"""
         return self.status == 'left'
@@ -80,6 +100,15 @@ class UserStageProgress(Base):
     nfc_count = Column(Integer, nullable=False, default=0)  # 태그한 NFC 수
     best_time_sec = Column(Integer, nullable=True)         # 최단 클리어 시간
     
+    __table_args__ = (
+        # 스테이지별 클리어 사용자 집계/조회 (클리어 행만 담는 부분 인덱스)
+        Index(
+            "ix_user_stage_progress_cleared",
+            stage_id,
+            postgresql_where=text("status = 'cleared'")
+        ),
+    )
+    
     # 관계 설정
     user = relationship("User", back_populates="stage_progress")
     stage = relationship("Stage", back_populates="user_progress")
@@ -87,26 +116,31 @@ class UserStageProgress(Base):
     def __repr__(self):
         return f"<UserStageProgress(user_id={self.user_id}, stage_id={self.stage_id}, status='{self.status}')>"
     
-    @property
+    @hybrid_property
     def is_locked(self) -> bool:
         """잠겨있는지 확인"""
         return self.status == 'locked'
     
-    @property
+    @hybrid_property
     def is_unlocked(self) -> bool:
         """해금되었는지 확인"""
         return self.status == 'unlocked'
     
-    @property
+    @hybrid_property
     def is_in_progress(self) -> bool:
         """진행 중인지 확인"""
         return self.status == 'in_progress'
     
-    @property
+    @hybrid_property
     def is_cleared(self) -> bool:
         """클리어했는지 확인"""
         return self.status == 'cleared'
     
+    @is_cleared.expression
+    def is_cleared(cls):
+        # 바인드 파라미터 대신 리터럴로 렌더링해야 부분 인덱스(status = 'cleared')를 사용할 수 있음
+        return cls.status == literal_column("'cleared'")
+    
     @property
     def best_time_minutes(self) -> float:
         """최단 시간을 분 단위로 반환"""
@@ -114,14 +148,34 @@ class UserStageProgress(Base):
             return self.best_time_sec / 60.0
         return 0.0
     
-    @property
+    @hybrid_property
     def completion_percentage(self) -> float:
-        """NFC 태깅 완료율 계산 (스테이지의 필요 NFC 수 기준)"""
-        # 실제로는 stage.clear_need_nfc_count와 비교해야 함
-        # 여기서는 기본 로직만 제공
-        if self.nfc_count > 0:
-            return min(100.0, (self.nfc_count / max(1, self.nfc_count)) * 100)
-        return 0.0
+        """
+        NFC 태깅 완료율 계산 (스테이지의 필요 NFC 수 기준, 최대 100)
+        필요 NFC 수가 없으면 한 번이라도 태깅했을 때 100으로 봅니다.
+        (인스턴스에서 사용할 때는 stage가 로드되어 있어야 함 - 비동기 세션에서는 selectinload 사용)
+        """
+        need = self.stage.clear_need_nfc_count if self.stage else None
+        if not need:
+            return 100.0 if self.nfc_count > 0 else 0.0
+        return min(100.0, 100.0 * self.nfc_count / need)
+    
+    @completion_percentage.expression
+    def completion_percentage(cls):
+        # 스테이지의 필요 NFC 수를 상관 서브쿼리로 조회해 SQL에서 계산 (목록 정렬/필터에 사용 가능)
+        need = (
+            select(Stage.clear_need_nfc_count)
+            .where(Stage.id == cls.stage_id)
+            .scalar_subquery()
+        )
+        # 필요 NFC 수가 NULL/0이면 NULLIF로 나눗셈 결과가 NULL → 태깅 여부로 대체
+        return func.least(
+            100.0,
+            func.coalesce(
+                100.0 * cls.nfc_count / func.nullif(need, 0),
+                case((cls.nfc_count > 0, 100.0), else_=0.0)
+            )
+        )
 
 
 class RewardLedger(Base):
@@ -129,8 +183,8 @@ class RewardLedger(Base):
     
     __tablename__ = "rewards_ledger"
     
-    # 기본키 (bigserial)
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # 기본키 (identity: COPY 등으로 id를 생략해도 DB가 순차 할당)
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
     
     # 사용자
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -148,6 +202,18 @@ class RewardLedger(Base):
     # 기록 시각
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
+    __table_args__ = (
+        # 사용자 포인트 내역: WHERE user_id = ? ORDER BY created_at DESC LIMIT n (정렬 없이 인덱스 순서로)
+        Index("ix_rewards_ledger_user_time", user_id, created_at.desc()),
+        # 사용자별 콘텐츠 보상 내역 대조용 (콘텐츠 보상 행만 담는 부분 인덱스)
+        Index(
+            "ix_rewards_ledger_user_content",
+            user_id,
+            content_id,
+            postgresql_where=text("content_id IS NOT NULL")
+        ),
+    )
+    
     # 관계 설정
     user = relationship("User", back_populates="rewards")
     content = relationship("Content", back_populates="rewards")
@@ -158,17 +224,18 @@ class RewardLedger(Base):
     def __repr__(self):
         return f"<RewardLedger(id={self.id}, user_id={self.user_id}, coin_delta={self.coin_delta})>"
     
-    @property
+    # 원장 행은 기록 후 수정되지 않으므로 파생 값은 첫 계산 결과를 인스턴스에 저장
+    @cached_property
     def is_earning(self) -> bool:
         """코인 획득인지 확인"""
         return self.coin_delta > 0
     
-    @property
+    @cached_property
     def is_spending(self) -> bool:
         """코인 사용인지 확인"""
         return self.coin_delta < 0
     
-    @property
+    @cached_property
     def reward_type(self) -> str:
         """보상 유형 반환"""
         if self.stage_id:
@@ -180,7 +247,7 @@ class RewardLedger(Base):
         else:
             return "system_reward"
     
-    @property
+    @cached_property
     def abs_amount(self) -> int:
         """절댓값 반환"""
         return abs(self.coin_delta)
\ No newline at end of file
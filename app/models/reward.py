@@ -1,14 +1,19 @@
-from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey, DateTime, Index, Float, MetaData, Table
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
+
+# 노출 순서가 없는(NULL) 상품의 정렬 키 (PostgreSQL ASC 기본 NULLS LAST와 동일하게 맨 뒤)
+# 앱 목록 정렬 인덱스는 mv_active_rewards에만 둠 (store_rewards는 재고 차감마다 인덱스 갱신 비용만 생김)
+EXPOSURE_ORDER_LAST = 2147483647
+# exposure_order(integer) 컬럼이 가질 수 있는 최솟값 (음수 우선순위도 허용)
+EXPOSURE_ORDER_FIRST = -2147483648
 
 class StoreReward(Base):
     __tablename__ = "store_rewards"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     store_id = Column(UUID(as_uuid=True), ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
     product_name = Column(Text, nullable=False)
     product_desc = Column(Text, nullable=True)
@@ -24,7 +29,59 @@ class StoreReward(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        # 관리자 매장 상세의 상품 목록 (selectinload: store_id IN (...)) 및 매장 삭제 시 ON DELETE CASCADE
+        Index("ix_store_rewards_store_id", store_id),
+    )
+    
     store = relationship("Store", back_populates="rewards")
 
     def __repr__(self):
-        return f"<StoreReward(id={self.id}, name='{self.product_name}')>"
\ No newline at end of file
+        return f"<StoreReward(id={self.id}, name='{self.product_name}')>"
+
+
+# 구체화 뷰는 Base.metadata와 분리된 MetaData에 등록
+# (create_all()/autogenerate가 mv_active_rewards를 일반 테이블로 만들지 않도록, 생성은 reward_catalog의 DDL이 담당)
+view_metadata = MetaData(schema="public")
+
+mv_active_rewards_table = Table(
+    "mv_active_rewards",
+    view_metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("store_id", UUID(as_uuid=True), nullable=False),
+    Column("product_name", Text, nullable=False),
+    Column("product_desc", Text, nullable=True),
+    Column("image_url", Text, nullable=True),
+    Column("price_coin", Integer, nullable=False),
+    Column("stock_qty", Integer, nullable=True),
+    Column("exposure_order", Integer, nullable=True),
+    Column("category", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("store_name", Text, nullable=False),
+    Column("store_description", Text, nullable=True),
+    Column("store_address", Text, nullable=True),
+    Column("store_latitude", Float, nullable=True),
+    Column("store_longitude", Float, nullable=True),
+)
+
+
+class MvActiveReward(Base):
+    """
+    현재 앱에 노출 가능한 상품 (mv_active_rewards 구체화 뷰, 읽기 전용)
+    뷰 생성/갱신은 app.services.reward_catalog 에서 관리합니다.
+    """
+    __table__ = mv_active_rewards_table
+
+    @property
+    def store(self) -> dict:
+        """StoreReward.store와 같은 형태로 매장 정보 반환 (응답 스키마 호환)"""
+        return {
+            "store_name": self.store_name,
+            "description": self.store_description,
+            "address": self.store_address,
+            "latitude": self.store_latitude,
+            "longitude": self.store_longitude,
+        }
+
+    def __repr__(self):
+        return f"<MvActiveReward(id={self.id}, name='{self.product_name}')>"
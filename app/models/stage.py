@@ -1,10 +1,15 @@
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, CheckConstraint, ForeignKey, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, CheckConstraint, ForeignKey, Text, UniqueConstraint, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from geoalchemy2 import Geography
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
+
+# 퍼즐 표시 시점 / 클리어 연출 설정 (PostgreSQL ENUM)
+PUZZLE_SHOW_WHEN_ENUM = ENUM('always', 'after_clear', name='stage_puzzle_show_when_enum')
+UNLOCK_PRESET_ENUM = ENUM('fullscreen', 'popup', name='stage_unlock_preset_enum')
+UNLOCK_NEXT_ACTION_ENUM = ENUM('next_step', 'next_stage', name='stage_unlock_next_action_enum')
 
 
 class Stage(Base):
@@ -13,7 +18,7 @@ class Stage(Base):
     __tablename__ = "stages"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 소속 콘텐츠
     content_id = Column(UUID(as_uuid=True), ForeignKey("contents.id", ondelete="CASCADE"), nullable=False)
@@ -63,41 +68,58 @@ class Stage(Base):
     __table_args__ = (
         # 콘텐츠 내 스테이지 번호 유니크
         UniqueConstraint("content_id", "stage_no", name="stages_content_id_stage_no_key"),
-        # 히든 스테이지는 unlock_stage_id 필수
+        # 히든 스테이지는 unlock_stage_id 필수 + 자기 참조 방지 (하나의 CHECK로 검사)
         CheckConstraint(
-            "(is_hidden = TRUE AND unlock_stage_id IS NOT NULL) OR (is_hidden = FALSE AND unlock_stage_id IS NULL)",
-            name="stages_hidden_unlock_consistency_chk"
+            "(unlock_stage_id IS NULL OR unlock_stage_id != id) AND is_hidden = (unlock_stage_id IS NOT NULL)",
+            name="stages_unlock_chk"
         ),
-        # 자기 참조 방지
-        CheckConstraint(
-            "unlock_stage_id IS NULL OR unlock_stage_id != id",
-            name="stages_unlock_not_self_chk"
+        # 자기 참조 FK 조회용 부분 인덱스 (스테이지 삭제 시 ON DELETE CASCADE/RESTRICT 검사, 서브 스테이지 조회)
+        # 대부분의 스테이지는 NULL이므로 값이 있는 행만 담음
+        Index(
+            "ix_stages_parent_stage_id",
+            parent_stage_id,
+            postgresql_where=text("parent_stage_id IS NOT NULL")
+        ),
+        Index(
+            "ix_stages_unlock_stage_id",
+            unlock_stage_id,
+            postgresql_where=text("unlock_stage_id IS NOT NULL")
         ),
     )
     
     # 관계 설정
+    # passive_deletes: DB의 ON DELETE CASCADE/SET NULL에 맡겨, 삭제 시 하위 행을 컬렉션마다 조회하지 않음
     content = relationship("Content", back_populates="stages")
     parent_stage = relationship("Stage", remote_side=[id], back_populates="sub_stages", foreign_keys=[parent_stage_id])
-    sub_stages = relationship("Stage", back_populates="parent_stage", foreign_keys=[parent_stage_id])
+    sub_stages = relationship("Stage", back_populates="parent_stage", foreign_keys=[parent_stage_id], passive_deletes=True)
     unlock_stage = relationship("Stage", remote_side=[id], foreign_keys=[unlock_stage_id])
-    hints = relationship("StageHint", back_populates="stage", cascade="all, delete-orphan")
-    puzzles = relationship("StagePuzzle", back_populates="stage", cascade="all, delete-orphan")
-    unlocks = relationship("StageUnlock", back_populates="stage", cascade="all, delete-orphan")
-    user_progress = relationship("UserStageProgress", back_populates="stage", cascade="all, delete-orphan")
-    rewards = relationship("RewardLedger", back_populates="stage")
+    hints = relationship("StageHint", back_populates="stage", cascade="all, delete-orphan", passive_deletes=True)
+    puzzles = relationship("StagePuzzle", back_populates="stage", cascade="all, delete-orphan", passive_deletes=True)
+    unlocks = relationship("StageUnlock", back_populates="stage", cascade="all, delete-orphan", passive_deletes=True)
+    # 사용자 진행/보상 내역은 스테이지 API에서 읽지 않는 큰 컬렉션이므로, 실수로 지연 로딩하면 오류로 알림
+    user_progress = relationship("UserStageProgress", back_populates="stage", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    rewards = relationship("RewardLedger", back_populates="stage", passive_deletes=True, lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Stage(id={self.id}, stage_no='{self.stage_no}', title='{self.title}')>"
     
-    @property
+    @hybrid_property
     def is_main_stage(self) -> bool:
         """메인 스테이지인지 확인"""
         return self.parent_stage_id is None
     
-    @property
+    @is_main_stage.expression
+    def is_main_stage(cls):
+        return cls.parent_stage_id.is_(None)
+    
+    @hybrid_property
     def is_sub_stage(self) -> bool:
         """서브 스테이지인지 확인"""
         return self.parent_stage_id is not None
+    
+    @is_sub_stage.expression
+    def is_sub_stage(cls):
+        return cls.parent_stage_id.is_not(None)
 
 
 class StageHint(Base):
@@ -106,7 +128,7 @@ class StageHint(Base):
     __tablename__ = "stage_hints"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 소속 스테이지
     stage_id = Column(UUID(as_uuid=True), ForeignKey("stages.id", ondelete="CASCADE"), nullable=False)
@@ -135,8 +157,8 @@ class StageHint(Base):
     # 관계 설정
     stage = relationship("Stage", back_populates="hints")
     nfc = relationship("NFCTag", back_populates="hints")
-    images = relationship("HintImage", back_populates="hint", cascade="all, delete-orphan")
-    scan_logs = relationship("NFCScanLog", back_populates="hint")
+    images = relationship("HintImage", back_populates="hint", cascade="all, delete-orphan", passive_deletes=True)
+    scan_logs = relationship("NFCScanLog", back_populates="hint", passive_deletes=True)
     
     def __repr__(self):
         return f"<StageHint(id={self.id}, stage_id={self.stage_id}, order_no={self.order_no})>"
@@ -148,7 +170,7 @@ class HintImage(Base):
     __tablename__ = "hint_images"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 소속 힌트
     hint_id = Column(UUID(as_uuid=True), ForeignKey("stage_hints.id", ondelete="CASCADE"), nullable=False)
@@ -160,6 +182,17 @@ class HintImage(Base):
     url = Column(Text, nullable=False)
     alt_text = Column(Text, nullable=True)
     
+    __table_args__ = (
+        # 스테이지 상세: hint_id IN (...) ORDER BY hint_id, order_no 를 인덱스 순서로 조회 (정렬 생략)
+        # INCLUDE 컬럼으로 테이블 접근 없이 index-only scan 가능
+        Index(
+            "ix_hint_images_hint_order",
+            hint_id,
+            order_no,
+            postgresql_include=["url", "alt_text"]
+        ),
+    )
+    
     # 관계 설정
     hint = relationship("StageHint", back_populates="images")
     
@@ -173,22 +206,21 @@ class StagePuzzle(Base):
     __tablename__ = "stage_puzzles"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 소속 스테이지
     stage_id = Column(UUID(as_uuid=True), ForeignKey("stages.id", ondelete="CASCADE"), nullable=False)
     
     # 퍼즐 설정
     puzzle_style = Column(Text, nullable=False)
-    show_when = Column(Text, nullable=False)  # always|after_clear
+    show_when = Column(PUZZLE_SHOW_WHEN_ENUM, nullable=False)  # always|after_clear
     config = Column(JSONB, nullable=True)
     
-    # 제약조건
+    # 인덱스
     __table_args__ = (
-        CheckConstraint(
-            "show_when IN ('always', 'after_clear')",
-            name="stage_puzzles_show_when_chk"
-        ),
+        # 스테이지 상세: WHERE stage_id = ? 로 퍼즐 설정(config)을 조회
+        # config는 내용으로 검색하지 않으므로 GIN 대신 stage_id B-tree만 둠
+        Index("ix_stage_puzzles_stage_id", stage_id),
     )
     
     # 관계 설정
@@ -204,32 +236,20 @@ class StageUnlock(Base):
     __tablename__ = "stage_unlocks"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
     # 소속 스테이지
     stage_id = Column(UUID(as_uuid=True), ForeignKey("stages.id", ondelete="CASCADE"), nullable=False)
     
     # 연출 설정
-    unlock_preset = Column(Text, nullable=False)  # fullscreen|popup
-    next_action = Column(Text, nullable=False)    # next_step|next_stage
+    unlock_preset = Column(UNLOCK_PRESET_ENUM, nullable=False)  # fullscreen|popup
+    next_action = Column(UNLOCK_NEXT_ACTION_ENUM, nullable=False)    # next_step|next_stage
     
     # 표시 내용
     title = Column(Text, nullable=True)
     image_url = Column(Text, nullable=True)
     bottom_text = Column(Text, nullable=True)
     
-    # 제약조건
-    __table_args__ = (
-        CheckConstraint(
-            "unlock_preset IN ('fullscreen', 'popup')",
-            name="stage_unlocks_preset_chk"
-        ),
-        CheckConstraint(
-            "next_action IN ('next_step', 'next_stage')",
-            name="stage_unlocks_next_action_chk"
-        ),
-    )
-    
     # 관계 설정
     stage = relationship("Stage", back_populates="unlocks")
     
@@ -1,25 +1,26 @@
-from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, Text, ForeignKey, DateTime, Index, text
+from sqlalchemy import cast
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
 
 # geoalchemy2 import는 Store 모델에서 사용하므로 아래로 이동
-from sqlalchemy import Float
-from geoalchemy2 import Geography
+from geoalchemy2 import Geography, Geometry
 
 class Store(Base):
     """매장 모델 (stores 테이블)"""
     __tablename__ = "stores"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     store_name = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
     address = Column(Text, nullable=True)
-    latitude = Column(Float, nullable=True)
-    longitude = Column(Float, nullable=True)
+    # 위치 정보 (geom 하나만 저장, 기존 DB 반영: migrations/0002_store_geom.sql)
     geom = Column(Geography('POINT', srid=4326), nullable=True)
+    # 위도/경도는 geom에서 SQL로 계산해 함께 로드 (읽기 전용, 좌표 변경은 geom으로)
+    latitude = column_property(func.ST_Y(cast(geom, Geometry('POINT', srid=4326))))
+    longitude = column_property(func.ST_X(cast(geom, Geometry('POINT', srid=4326))))
     display_start_at = Column(DateTime(timezone=True), nullable=True)
     display_end_at = Column(DateTime(timezone=True), nullable=True)
     is_always_on = Column(Boolean, nullable=False, default=False)
@@ -28,8 +29,20 @@ class Store(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
+    # 인덱스
+    __table_args__ = (
+        # 앱 리워드 목록의 노출 기간 필터 (상시 노출이 아닌 상품 노출 매장만)
+        Index(
+            "ix_store_display_window",
+            display_start_at,
+            display_end_at,
+            postgresql_where=text("show_products AND NOT is_always_on")
+        ),
+    )
+    
     # 관계 설정
-    rewards = relationship("StoreReward", back_populates="store", cascade="all, delete-orphan")
+    # passive_deletes: 매장 삭제 시 상품은 DB의 ON DELETE CASCADE로 삭제 (상품을 먼저 조회하지 않음)
+    rewards = relationship("StoreReward", back_populates="store", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Store(id={self.id}, name='{self.store_name}')>"
\ No newline at end of file
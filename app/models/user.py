@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, Boolean, DateTime, CheckConstraint, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import Column, Boolean, DateTime, CheckConstraint, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID, ENUM, CITEXT
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from app.models.base import Base
-import uuid
+from app.models.base import Base, uuid7
+
+# 계정 상태 (PostgreSQL ENUM)
+USER_STATUS_ENUM = ENUM('active', 'blocked', 'deleted', name='user_status_enum')
 
 
 class User(Base):
@@ -12,13 +15,13 @@ class User(Base):
     __tablename__ = "users"
     
     # 기본키
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.uuid_generate_v4())
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=func.gen_random_uuid())
     
-    # 로그인 ID (citext, 대소문자 무시, 3~30자, [A-Za-z0-9._-])
-    login_id = Column(String, nullable=False, unique=True)
+    # 로그인 ID (citext, 대소문자 무시, 3~30자, [A-Za-z0-9._-], 기존 DB 반영: migrations/0001_column_types.sql)
+    login_id = Column(CITEXT, nullable=False, unique=True)
     
-    # 이메일 (NULL 허용, 부분 유니크)
-    email = Column(String, nullable=True)
+    # 이메일 (citext, 대소문자 무시, NULL 허용, 부분 유니크)
+    email = Column(CITEXT, nullable=True)
     
     # 표시명
     nickname = Column(Text, nullable=True)
@@ -28,7 +31,7 @@ class User(Base):
     email_verified_at = Column(DateTime(timezone=True), nullable=True)
     
     # 계정 상태
-    status = Column(String, nullable=False, default='active')
+    status = Column(USER_STATUS_ENUM, nullable=False, default='active')
     
     # 프로필 (자유 확장)
     profile = Column(JSONB, nullable=True)
@@ -47,34 +50,45 @@ class User(Base):
             "length(login_id) >= 3 AND length(login_id) <= 30 AND login_id ~ '^[A-Za-z0-9._-]+$'",
             name="users_login_id_format_chk"
         ),
-        CheckConstraint(
-            "status IN ('active', 'blocked', 'deleted')",
-            name="users_status_chk"
+        # 이메일 부분 유니크 (NULL 제외)
+        # 로그인/비밀번호 초기화의 login_id = ? OR email = ? 조회가 login_id 유니크 인덱스와 BitmapOr로 합쳐짐
+        Index(
+            "ix_users_email",
+            email,
+            unique=True,
+            postgresql_where=text("email IS NOT NULL")
+        ),
+        # 탈퇴 계정 영구 삭제 배치(cleanup_deleted_users.py)의 deleted_at 범위 조회용 부분 인덱스
+        Index(
+            "ix_users_deleted_cleanup",
+            deleted_at,
+            postgresql_where=text("status = 'deleted'")
         ),
     )
     
     # 관계 설정
-    auth_identities = relationship("AuthIdentity", back_populates="user", cascade="all, delete-orphan")
+    # passive_deletes: DB의 ON DELETE CASCADE/SET NULL에 맡겨, 삭제 시 하위 행을 컬렉션마다 조회하지 않음
+    auth_identities = relationship("AuthIdentity", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     admin = relationship("Admin", back_populates="user", uselist=False)
-    content_progress = relationship("UserContentProgress", back_populates="user", cascade="all, delete-orphan")
-    stage_progress = relationship("UserStageProgress", back_populates="user", cascade="all, delete-orphan")
-    rewards = relationship("RewardLedger", back_populates="user", cascade="all, delete-orphan")
-    nfc_scan_logs = relationship("NFCScanLog", back_populates="user")
+    content_progress = relationship("UserContentProgress", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    stage_progress = relationship("UserStageProgress", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    rewards = relationship("RewardLedger", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    nfc_scan_logs = relationship("NFCScanLog", back_populates="user", passive_deletes=True)
     
     def __repr__(self):
         return f"<User(id={self.id}, login_id='{self.login_id}', status='{self.status}')>"
     
-    @property
+    @hybrid_property
     def is_active(self) -> bool:
         """계정이 활성 상태인지 확인"""
         return self.status == 'active'
     
-    @property
+    @hybrid_property
     def is_blocked(self) -> bool:
         """계정이 차단 상태인지 확인"""
         return self.status == 'blocked'
     
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         """계정이 삭제 상태인지 확인"""
         return self.status == 'deleted'
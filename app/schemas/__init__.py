@@ -1,48 +1,45 @@
-# 공통 스키마
-from app.schemas.common import (
-    PaginatedResponse,
-    ErrorResponse, 
-    SuccessResponse,
-    CoordinateSchema,
-    GeographySchema,
-    ImageSchema,
-    RewardSchema,
-    MetaSchema,
-    IDempotencyResponse
-)
+import importlib
 
-# 사용자 스키마
-from app.schemas.user import (
-    UserBase,
-    UserCreate,
-    UserUpdate,
-    UserUpdateRequest,
-    UserResponse,
-    UserSummary,
-    AuthIdentityResponse,
-    UserDetailResponse,
-    PasswordChangeRequest,
-    UserStatsResponse
-)
-
-# --- 새로 추가된 Store 및 Reward 스키마 import ---
-from app.schemas.store import (
-    StoreBase,
-    StoreCreate,
-    StoreUpdate,
-    StoreResponse
-)
-from app.schemas.reward import (
-    StoreRewardBase,
-    StoreRewardCreate,
-    StoreRewardUpdate,
-    StoreRewardResponse
-)
+# 스키마 이름 → 정의된 모듈 (PEP 562: 처음 접근할 때 해당 모듈만 import)
+_EXPORTS = {
+    # 공통 스키마
+    "PaginatedResponse": "app.schemas.common",
+    "CursorPaginatedResponse": "app.schemas.common",
+    "ErrorResponse": "app.schemas.common",
+    "SuccessResponse": "app.schemas.common",
+    "CoordinateSchema": "app.schemas.common",
+    "GeographySchema": "app.schemas.common",
+    "ImageSchema": "app.schemas.common",
+    "RewardSchema": "app.schemas.common",
+    "MetaSchema": "app.schemas.common",
+    "IDempotencyResponse": "app.schemas.common",
+    # 사용자 스키마
+    "UserBase": "app.schemas.user",
+    "UserCreate": "app.schemas.user",
+    "UserUpdate": "app.schemas.user",
+    "UserUpdateRequest": "app.schemas.user",
+    "UserResponse": "app.schemas.user",
+    "UserSummary": "app.schemas.user",
+    "AuthIdentityResponse": "app.schemas.user",
+    "UserDetailResponse": "app.schemas.user",
+    "PasswordChangeRequest": "app.schemas.user",
+    "UserStatsResponse": "app.schemas.user",
+    # Store 및 Reward 스키마
+    "StoreBase": "app.schemas.store",
+    "StoreCreate": "app.schemas.store",
+    "StoreUpdate": "app.schemas.store",
+    "StoreResponse": "app.schemas.store",
+    "StoreRewardBase": "app.schemas.reward",
+    "StoreRewardCreate": "app.schemas.reward",
+    "StoreRewardUpdate": "app.schemas.reward",
+    "StoreRewardResponse": "app.schemas.reward",
+}
 
 
 __all__ = [
     # Common schemas
     "PaginatedResponse",
+    "CursorPaginatedResponse",
     "ErrorResponse", 
     "SuccessResponse",
     "CoordinateSchema",
@@ -73,4 +70,18 @@ __all__ = [
     "StoreRewardCreate",
     "StoreRewardUpdate",
     "StoreRewardResponse",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """app.schemas.<이름> 접근 시 정의된 모듈을 import해서 반환 (한 번 읽은 값은 모듈 전역에 저장)"""
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,9 +1,46 @@
-from typing import List, TypeVar, Generic, Optional, Dict, Any
-from pydantic import BaseModel
+from typing import List, TypeVar, Generic, Optional, Dict, Any, Type, Annotated, ClassVar, Tuple
+from pydantic import BaseModel, ConfigDict, Field, computed_field, create_model
+from typing_extensions import TypedDict
 
 
 # 제네릭 타입 변수
 T = TypeVar('T')
+M = TypeVar('M', bound="ORMFastMixin")
+
+
+class ORMFastMixin:
+    """
+    DB에서 읽은 ORM 객체를 검증 없이 응답 모델로 변환하는 mixin
+    DB 컬럼 타입으로 이미 보장되는 평탄한(중첩 모델이 없는) 응답 모델에만 사용합니다.
+    """
+
+    # 필드 이름 목록 (클래스 생성 시 한 번만 계산, 행마다 model_fields를 순회하지 않음)
+    _orm_field_names: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._orm_field_names = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls: Type[M], obj: Any) -> M:
+        """model_validate 대신 model_construct로 생성 (ORM에 없는 필드는 기본값 사용)"""
+        data = {name: getattr(obj, name) for name in cls._orm_field_names if hasattr(obj, name)}
+        return cls.model_construct(**data)
+
+
+def make_partial(base: Type[BaseModel], name: str) -> Type[BaseModel]:
+    """
+    base의 모든 필드를 선택적(기본값 None)으로 바꾼 수정용 모델 생성
+    max_length, ge 같은 제약(metadata)과 description은 그대로 유지합니다. (validator는 복사하지 않음)
+    """
+    fields = {}
+    for field_name, field in base.model_fields.items():
+        annotation = field.annotation
+        if field.metadata:
+            annotation = Annotated[(annotation, *field.metadata)]
+        fields[field_name] = (Optional[annotation], Field(None, description=field.description))
+    return create_model(name, **fields)
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -13,22 +50,32 @@ class PaginatedResponse(BaseModel, Generic[T]):
     size: int
     total: int
     
+    @computed_field
     @property
     def total_pages(self) -> int:
         """전체 페이지 수 계산"""
         return (self.total + self.size - 1) // self.size
     
+    @computed_field
     @property
     def has_next(self) -> bool:
         """다음 페이지 존재 여부"""
         return self.page < self.total_pages
     
+    @computed_field
     @property
     def has_prev(self) -> bool:
         """이전 페이지 존재 여부"""
         return self.page > 1
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """커서(keyset) 페이지네이션 응답"""
+    items: List[T]
+    size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (없으면 마지막 페이지)
+
+
 class ErrorResponse(BaseModel):
     """에러 응답 (XPG API 문서 표준)"""
     error: Dict[str, Any]
@@ -40,7 +87,7 @@ class ErrorResponse(BaseModel):
         message: str, 
         details: Optional[Dict[str, Any]] = None
     ) -> "ErrorResponse":
-        """에러 응답 생성"""
+        """에러 응답 생성 (내부에서 만든 값이므로 검증 없이 model_construct로 생성)"""
         error_data = {
             "code": code,
             "message": message
@@ -48,7 +95,7 @@ class ErrorResponse(BaseModel):
         if details:
             error_data["details"] = details
         
-        return cls(error=error_data)
+        return cls.model_construct(error=error_data)
 
 
 class SuccessResponse(BaseModel):
@@ -58,8 +105,8 @@ class SuccessResponse(BaseModel):
     data: Optional[Dict[str, Any]] = None
 
 
-class CoordinateSchema(BaseModel):
-    """좌표 스키마"""
+class CoordinateSchema(TypedDict):
+    """좌표 스키마 (중첩 모델 생성 없이 dict로 검증)"""
     lon: float  # 경도
     lat: float  # 위도
 
@@ -86,8 +133,7 @@ class RewardSchema(BaseModel):
 
 class MetaSchema(BaseModel):
     """메타데이터 기본 스키마"""
-    class Config:
-        extra = "allow"  # 추가 필드 허용
+    model_config = ConfigDict(extra="allow")  # 추가 필드 허용
 
 
 class IDempotencyResponse(BaseModel):
@@ -1,46 +1,33 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import Optional, List, Literal
 import uuid
 from datetime import datetime
+from app.schemas.common import CoordinateSchema, make_partial
 
-class GeoPoint(BaseModel):
-    lon: float
-    lat: float
+# 콘텐츠 중심 좌표 (common.CoordinateSchema와 같은 lon/lat 구조이므로 같은 타입을 공유)
+GeoPoint = CoordinateSchema
 
 class ContentBase(BaseModel):
     title: str = Field(..., max_length=255)
     description: Optional[str] = None
     thumbnail_url: Optional[str] = None
     background_image_url: Optional[str] = None
-    content_type: str = Field(..., pattern="^(story|domination)$")
-    exposure_slot: str = Field("story", pattern="^(story|event)$")
-    is_always_on: bool = Field(False)
+    content_type: Literal["story", "domination"]
+    exposure_slot: Literal["story", "event"] = "story"
+    is_always_on: bool = False
     reward_coin: int = Field(0, ge=0)
     center_point: Optional[GeoPoint] = None
     start_at: Optional[datetime] = None
     end_at: Optional[datetime] = None
     stage_count: Optional[int] = Field(None, ge=1, le=10)
-    is_sequential: bool = Field(True)
+    is_sequential: bool = True
     is_test: bool = Field(False, description="테스트 콘텐츠 여부")
 
 class ContentCreate(ContentBase):
     pass
 
-class ContentUpdate(BaseModel):
-    title: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = None
-    thumbnail_url: Optional[str] = None
-    background_image_url: Optional[str] = None
-    content_type: Optional[str] = Field(None, pattern="^(story|domination)$")
-    exposure_slot: Optional[str] = Field(None, pattern="^(story|event)$")
-    is_always_on: Optional[bool] = None
-    reward_coin: Optional[int] = Field(None, ge=0)
-    center_point: Optional[GeoPoint] = None
-    start_at: Optional[datetime] = None
-    end_at: Optional[datetime] = None
-    stage_count: Optional[int] = Field(None, ge=1, le=10)
-    is_sequential: Optional[bool] = None
-    is_test: Optional[bool] = None
+# 수정 요청 (ContentBase의 모든 필드를 선택적으로)
+ContentUpdate = make_partial(ContentBase, "ContentUpdate")
 
 class ContentResponse(ContentBase):
     id: uuid.UUID
@@ -52,8 +39,9 @@ class ContentResponse(ContentBase):
     model_config = ConfigDict(from_attributes=True)
 
 class ContentListResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
-    id: str
+    # 응답 전용 (생성 후 수정하지 않음)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, extra='forbid', frozen=True)
+    id: uuid.UUID
     title: str
     description: Optional[str] = None
     thumbnail_url: Optional[str] = None
@@ -62,11 +50,11 @@ class ContentListResponse(BaseModel):
     exposure_slot: str
     is_always_on: bool
     reward_coin: int
-    center_point: Optional[Dict[str, float]] = None
+    center_point: Optional[GeoPoint] = None
     start_at: Optional[datetime] = None
     end_at: Optional[datetime] = None
     has_next_content: bool
-    is_sequential: bool = Field(True)
+    is_sequential: bool = True
     is_cleared: bool = Field(False, description="현재 사용자의 올클리어 여부")
     is_test: bool = Field(False, description="테스트 콘텐츠 여부")
     
@@ -76,7 +64,7 @@ class ContentNextConnect(BaseModel):
 
 class PrerequisiteItem(BaseModel):
     required_content_id: uuid.UUID
-    requirement: str = Field("cleared", pattern="^cleared$")
+    requirement: Literal["cleared"] = "cleared"
 
 class ContentPrerequisitesUpdate(BaseModel):
     requirements: List[PrerequisiteItem]
@@ -90,4 +78,7 @@ class ContentProgressResponse(BaseModel):
 
 class ContentJoinResponse(BaseModel):
     joined: bool = True
-    status: str = "in_progress"
\ No newline at end of file
+    status: str = "in_progress"
+
+# 목록 응답 직렬화용 TypeAdapter (모듈 로드 시 한 번만 생성해서 재사용)
+CONTENT_LIST_ADAPTER = TypeAdapter(List[ContentListResponse])
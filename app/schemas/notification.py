@@ -1,31 +1,25 @@
-from typing import Optional
+from typing import Optional, Literal, List
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, model_validator, TypeAdapter
+
+from app.schemas.common import ORMFastMixin, make_partial
 
 
 class NotificationBase(BaseModel):
     """공지사항 기본 스키마"""
     title: str = Field(..., min_length=1, max_length=200, description="공지사항 제목")
     content: str = Field(..., min_length=1, max_length=500, description="공지사항 내용")
-    notification_type: str = Field(..., description="공지 유형: system|event|promotion")
+    notification_type: Literal["system", "event", "promotion"] = Field(..., description="공지 유형: system|event|promotion")
     start_at: datetime = Field(..., description="게시 시작일")
     end_at: datetime = Field(..., description="게시 종료일")
     show_popup_on_app_start: bool = Field(default=False, description="앱 시작 시 팝업 표시 여부")
     
-    @field_validator('notification_type')
-    @classmethod
-    def validate_notification_type(cls, v: str) -> str:
-        if v not in ['system', 'event', 'promotion']:
-            raise ValueError('notification_type must be one of: system, event, promotion')
-        return v
-    
-    @field_validator('end_at')
-    @classmethod
-    def validate_date_range(cls, v: datetime, info) -> datetime:
-        if 'start_at' in info.data and v <= info.data['start_at']:
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        if self.end_at <= self.start_at:
             raise ValueError('end_at must be after start_at')
-        return v
+        return self
 
 
 class NotificationCreate(NotificationBase):
@@ -33,25 +27,19 @@ class NotificationCreate(NotificationBase):
     is_draft: bool = Field(default=False, description="임시저장 여부")
 
 
-class NotificationUpdate(BaseModel):
-    """공지사항 수정 스키마"""
-    title: Optional[str] = Field(None, min_length=1, max_length=200, description="공지사항 제목")
-    content: Optional[str] = Field(None, min_length=1, max_length=500, description="공지사항 내용")
-    notification_type: Optional[str] = Field(None, description="공지 유형: system|event|promotion")
-    start_at: Optional[datetime] = Field(None, description="게시 시작일")
-    end_at: Optional[datetime] = Field(None, description="게시 종료일")
-    show_popup_on_app_start: Optional[bool] = Field(None, description="앱 시작 시 팝업 표시 여부")
+class NotificationUpdate(make_partial(NotificationBase, "NotificationPartial")):
+    """공지사항 수정 스키마 (NotificationBase의 모든 필드를 선택적으로)"""
     is_draft: Optional[bool] = Field(None, description="임시저장 여부")
     
-    @field_validator('notification_type')
-    @classmethod
-    def validate_notification_type(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and v not in ['system', 'event', 'promotion']:
-            raise ValueError('notification_type must be one of: system, event, promotion')
-        return v
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        # 시작일과 종료일이 함께 전달된 경우만 검사
+        if self.start_at is not None and self.end_at is not None and self.end_at <= self.start_at:
+            raise ValueError('end_at must be after start_at')
+        return self
 
 
-class NotificationResponse(BaseModel):
+class NotificationResponse(ORMFastMixin, BaseModel):
     """공지사항 응답 스키마 (관리자용)"""
     model_config = ConfigDict(from_attributes=True)
     
@@ -68,9 +56,9 @@ class NotificationResponse(BaseModel):
     updated_at: datetime
 
 
-class NotificationAppResponse(BaseModel):
+class NotificationAppResponse(ORMFastMixin, BaseModel):
     """공지사항 응답 스키마 (앱 사용자용 - 간소화)"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
     
     id: UUID
     title: str
@@ -81,13 +69,17 @@ class NotificationAppResponse(BaseModel):
     show_popup_on_app_start: bool
 
 
-class NotificationSummary(BaseModel):
+class NotificationSummary(ORMFastMixin, BaseModel):
     """공지사항 요약 정보"""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True, defer_build=True)
     
     id: UUID
     title: str
     notification_type: str
     status: str
     start_at: datetime
-    end_at: datetime
\ No newline at end of file
+    end_at: datetime
+
+
+# 앱 공지 목록 직렬화용 TypeAdapter (모듈 로드 시 한 번만 생성해서 재사용)
+NOTIFICATION_APP_LIST_ADAPTER = TypeAdapter(List[NotificationAppResponse])
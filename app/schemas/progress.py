@@ -5,6 +5,8 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
+from app.schemas.common import ORMFastMixin, CoordinateSchema
+
 class StageUnlockRequest(BaseModel):
     """스테이지 해금 요청"""
     pass  # 빈 body, 인증된 사용자 정보로 처리
@@ -26,13 +28,13 @@ class RewardInfo(BaseModel):
 class StageClearResponse(BaseModel):
     """스테이지 클리어 응답"""
     cleared: bool = True
-    rewards: List[RewardInfo] = []
+    rewards: List[RewardInfo] = Field(default_factory=list)
     content_cleared: bool = False
     next_content: Optional[str] = None
 
-class RewardHistoryItem(BaseModel):
+class RewardHistoryItem(ORMFastMixin, BaseModel):
     """보상 히스토리 아이템"""
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, extra='forbid', frozen=True)
     
     id: int
     coin_delta: int
@@ -47,7 +49,7 @@ class NFCScanRequest(BaseModel):
     udid: str = Field(..., description="NFC 태그 UDID")
     hint_id: Optional[str] = Field(None, description="힌트 ID (알면 전달)")
     stage_id: Optional[str] = Field(None, description="스테이지 ID")
-    geo: Optional[Dict[str, float]] = Field(None, description="위치 정보 {lon, lat}")
+    geo: Optional[CoordinateSchema] = Field(None, description="위치 정보 {lon, lat}")
     client_ts: Optional[datetime] = Field(None, description="클라이언트 타임스탬프")
 
 class NFCScanResponse(BaseModel):
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 import uuid
 
+from app.schemas.common import make_partial
+
 class StoreSimpleResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     store_name: str
@@ -22,15 +24,7 @@ class StoreRewardCreate(StoreRewardBase):
     pass
 
 # 리워드 수정 시 요청 Body (모든 필드 선택적)
-class StoreRewardUpdate(BaseModel):
-    product_name: Optional[str] = None
-    product_desc: Optional[str] = None
-    image_url: Optional[str] = None
-    price_coin: Optional[int] = None
-    stock_qty: Optional[int] = None
-    is_active: Optional[bool] = None
-    exposure_order: Optional[int] = None
-    category: Optional[str] = None
+StoreRewardUpdate = make_partial(StoreRewardBase, "StoreRewardUpdate")
 
 # API 응답 시 사용될 모델
 class StoreRewardResponse(StoreRewardBase):
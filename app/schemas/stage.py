@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, AliasChoices, PrivateAttr, model_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 import uuid
 
@@ -63,11 +63,32 @@ class StageResponse(BaseModel):
     meta: Optional[Dict[str, Any]] = None
     created_at: datetime
 
+class HintImageItem(BaseModel):
+    """힌트 이미지 입력 항목 (alt_text / alt 키 모두 허용)"""
+    url: str = Field(..., min_length=1, description="이미지 URL")
+    alt_text: Optional[str] = Field("", validation_alias=AliasChoices("alt_text", "alt"), description="대체 텍스트")
+    order_no: int = Field(1, description="표시 순서")
+    
+    # 클라이언트가 보낸 대체 텍스트 키 (수정 결과를 같은 키로 돌려주기 위해 기억)
+    _alt_key: str = PrivateAttr("alt_text")
+    
+    @model_validator(mode='wrap')
+    @classmethod
+    def remember_alt_key(cls, data: Any, handler):
+        item = handler(data)
+        if isinstance(data, dict) and "alt" in data and "alt_text" not in data:
+            item._alt_key = "alt"
+        return item
+    
+    def as_input_dict(self) -> Dict[str, Any]:
+        """요청에서 사용한 키 그대로의 dict (alt 로 보냈으면 alt 로 반환)"""
+        return {"url": self.url, self._alt_key: self.alt_text, "order_no": self.order_no}
+
 class HintCreate(BaseModel):
     preset: str = Field(..., description="표시 프리셋")
     order_no: int = Field(..., description="표시 순서", ge=1)
-    text_blocks: List[str] = Field([], description="텍스트 블록들", max_items=3)
-    images: List[Dict[str, Any]] = Field([], description="이미지 목록 (예: [{'url': '...', 'alt_text': '...'}])")
+    text_blocks: List[str] = Field(default_factory=list, description="텍스트 블록들", max_length=3)
+    images: List[HintImageItem] = Field(default_factory=list, description="이미지 목록 (예: [{'url': '...', 'alt_text': '...'}])")
     cooldown_sec: int = Field(0, description="쿨다운(초)", ge=0)
     failure_cooldown_sec: int = Field(0, description="미션 실패 시 재시도 쿨타임(초)", ge=0)
     reward_coin: int = Field(0, description="힌트 보상 코인", ge=0)
@@ -79,8 +100,8 @@ class HintCreate(BaseModel):
 
 class HintUpdate(BaseModel):
     preset: Optional[str] = Field(None, description="표시 프리셋")
-    text_blocks: Optional[List[str]] = Field(None, description="텍스트 블록들", max_items=3)
-    images: Optional[List[Dict[str, Any]]] = Field(None, description="이미지 목록")
+    text_blocks: Optional[List[str]] = Field(None, description="텍스트 블록들", max_length=3)
+    images: Optional[List[HintImageItem]] = Field(None, description="이미지 목록")
     cooldown_sec: Optional[int] = Field(None, description="쿨다운(초)", ge=0)
     failure_cooldown_sec: Optional[int] = Field(None, description="미션 실패 시 재시도 쿨타임(초)", ge=0)
     reward_coin: Optional[int] = Field(None, description="힌트 보상 코인", ge=0)
@@ -104,26 +125,32 @@ class HintResponse(BaseModel):
     failure_cooldown_sec: int = 0
     reward_coin: int = 0
     nfc: Optional[Dict[str, Any]] = None
-    images: List[Dict[str, Any]] = []
+    images: List[Dict[str, Any]] = Field(default_factory=list)
     
     # [수정] 위치 정보 응답 필드 추가 (DB의 Geography 타입 -> Dict 변환됨을 가정)
     location: Optional[Dict[str, Any]] = None 
     radius_m: Optional[int] = None
 
 class HintImageUpdate(BaseModel):
-    images: List[Dict[str, Any]] = Field([], description="이미지 목록")
+    model_config = ConfigDict(frozen=True)
+    
+    images: List[HintImageItem] = Field(default_factory=list, description="이미지 목록")
 
 class PuzzleConfig(BaseModel):
-    puzzles: List[Dict[str, Any]] = Field([], description="퍼즐 목록")
+    model_config = ConfigDict(frozen=True)
+    
+    puzzles: List[Dict[str, Any]] = Field(default_factory=list, description="퍼즐 목록")
 
 class UnlockConfig(BaseModel):
-    preset: str = Field(..., description="프리셋: fullscreen|popup")
-    next_action: str = Field(..., description="다음 액션: next_step|next_stage")
+    model_config = ConfigDict(frozen=True)
+    
+    preset: Literal["fullscreen", "popup"] = Field(..., description="프리셋: fullscreen|popup")
+    next_action: Literal["next_step", "next_stage"] = Field(..., description="다음 액션: next_step|next_stage")
     title: Optional[str] = Field(None, description="서브 타이틀")
     image_url: Optional[str] = Field(None, description="이미지 URL")
     bottom_text: Optional[str] = Field(None, description="하단 텍스트")
 
 class StageDetailResponse(StageResponse):
-    hints: List[HintResponse] = []
-    puzzles: List[Dict[str, Any]] = []
+    hints: List[HintResponse] = Field(default_factory=list)
+    puzzles: List[Dict[str, Any]] = Field(default_factory=list)
     unlock_config: Optional[Dict[str, Any]] = None
\ No newline at end of file
@@ -37,6 +37,6 @@ class StoreUpdate(BaseModel):
 # API 응답 시 사용될 모델 (리워드 목록 포함)
 class StoreResponse(StoreBase):
     id: uuid.UUID
-    rewards: List[StoreRewardResponse] = []
+    rewards: List[StoreRewardResponse] = Field(default_factory=list)
     
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,8 +1,7 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
-from app.schemas.common import MetaSchema
+from pydantic import BaseModel, Field, ConfigDict, AliasPath
 
 
 class UserBase(BaseModel):
@@ -44,23 +43,10 @@ class UserResponse(BaseModel):
     email_verified_at: Optional[datetime] = None
     status: str
     profile: Optional[Dict[str, Any]] = None
-    points: int = 0
+    # profile(JSONB)의 points 값을 검증 단계에서 바로 읽음 (없으면 0)
+    points: int = Field(0, validation_alias=AliasPath("profile", "points"))
     created_at: datetime
     last_active_at: Optional[datetime] = None
-
-    # [추가] SQLAlchemy 모델에서 Pydantic 모델로 변환 시 points 값을 추출하는 로직
-    @classmethod
-    def model_validate(cls, obj, **kwargs):
-        # SQLAlchemy 모델 객체(obj)에서 데이터를 가져옴
-        data = super().model_validate(obj, **kwargs).model_dump()
-        
-        # obj.profile (JSONB 필드)에서 'points' 값을 추출
-        if hasattr(obj, 'profile') and isinstance(obj.profile, dict):
-            # profile.points가 있다면 사용하고, 없다면 기본값 0 사용
-            data['points'] = obj.profile.get('points', 0)
-        
-        # Pydantic 객체로 재구성하여 반환
-        return cls(**data)
     
     @property
     def display_name(self) -> str:
@@ -70,7 +56,8 @@ class UserResponse(BaseModel):
 
 class UserSummary(BaseModel):
     """사용자 요약 정보"""
-    model_config = ConfigDict(from_attributes=True)
+    # 라우트에서 쓰지 않는 모델이므로 첫 사용 시점까지 스키마 생성을 미룸
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: UUID
     login_id: str
@@ -93,34 +80,54 @@ class AuthIdentityResponse(BaseModel):
 
 class UserDetailResponse(UserResponse):
     """사용자 상세 응답 (관리자용)"""
-    auth_identities: List[AuthIdentityResponse] = []
+    model_config = ConfigDict(defer_build=True)
+    
+    auth_identities: List[AuthIdentityResponse] = Field(default_factory=list)
     is_admin: bool = False
     
     @classmethod
     def from_user(cls, user, include_admin: bool = False):
-        """User 모델에서 변환"""
-        data = user.__dict__.copy()
-        
-        # 인증 아이덴티티 정보
-        data['auth_identities'] = [
-            AuthIdentityResponse.model_validate(identity) 
+        """User 모델에서 변환 (DB에서 읽은 값이므로 검증 없이 model_construct로 생성)"""
+        auth_identities = [
+            AuthIdentityResponse.model_construct(
+                provider=identity.provider,
+                last_login_at=identity.last_login_at,
+                created_at=identity.created_at
+            )
             for identity in user.auth_identities
         ]
         
-        # 관리자 여부
-        data['is_admin'] = bool(user.admin) if include_admin else False
-        
-        return cls.model_validate(data)
+        return cls.model_construct(
+            id=user.id,
+            login_id=user.login_id,
+            email=user.email,
+            nickname=user.nickname,
+            profile_image_url=user.profile_image_url,
+            email_verified=user.email_verified,
+            email_verified_at=user.email_verified_at,
+            status=user.status,
+            profile=user.profile,
+            points=(user.profile or {}).get('points', 0),
+            created_at=user.created_at,
+            last_active_at=user.last_active_at,
+            auth_identities=auth_identities,
+            # 관리자 여부
+            is_admin=bool(user.admin) if include_admin else False
+        )
 
 
 class PasswordChangeRequest(BaseModel):
     """비밀번호 변경 요청"""
+    model_config = ConfigDict(frozen=True)
+    
     current_password: str = Field(..., description="현재 비밀번호")
     new_password: str = Field(..., min_length=8, max_length=128, description="새 비밀번호")
 
 
 class UserStatsResponse(BaseModel):
     """사용자 통계 응답"""
+    model_config = ConfigDict(defer_build=True)
+    
     total_users: int
     active_users: int
     blocked_users: int
@@ -131,6 +138,8 @@ class UserStatsResponse(BaseModel):
 
 class PointAdjustRequest(BaseModel):
     """관리자용 포인트 조정 요청"""
+    model_config = ConfigDict(frozen=True)
+    
     coin_delta: int = Field(..., description="조정할 포인트 값 (양수=지급, 음수=회수)")
     note: str = Field(..., min_length=1, max_length=100, description="조정 사유 (예: '관리자 지급')")
 
@@ -0,0 +1,78 @@
+# app/services/reward_catalog.py
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import invalidate_rewards_cache
+from app.core.database import AsyncSessionLocal
+from app.models.reward import EXPOSURE_ORDER_LAST
+
+# 현재 앱에 노출 가능한 상품 (활성 상품 + 상품 노출 매장 + 노출 기간)
+# now()는 갱신 시점에 평가되므로 노출 기간 반영은 최대 갱신 주기만큼 늦을 수 있습니다.
+ACTIVE_REWARDS_VIEW_DDL = [
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_active_rewards AS
+    SELECT
+        sr.id,
+        sr.store_id,
+        sr.product_name,
+        sr.product_desc,
+        sr.image_url,
+        sr.price_coin,
+        sr.stock_qty,
+        sr.exposure_order,
+        sr.category,
+        sr.created_at,
+        s.store_name,
+        s.description AS store_description,
+        s.address AS store_address,
+        ST_Y(s.geom::geometry) AS store_latitude,
+        ST_X(s.geom::geometry) AS store_longitude
+    FROM store_rewards sr
+    JOIN stores s ON s.id = sr.store_id
+    WHERE sr.is_active
+      AND s.show_products
+      AND (s.is_always_on OR (s.display_start_at <= now() AND s.display_end_at >= now()))
+    """,
+    # REFRESH ... CONCURRENTLY 에 필요한 유니크 인덱스
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_active_rewards_id ON mv_active_rewards (id)",
+    # 커서 페이지네이션 정렬 (app/api/v1/rewards.py의 exposure_order_key와 동일한 표현식)
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_mv_active_rewards_keyset
+    ON mv_active_rewards (COALESCE(exposure_order, {EXPOSURE_ORDER_LAST}), created_at DESC, id)
+    """,
+    # 매장별 상품 목록 (store_id = ? + 같은 정렬) 을 정렬 없이 인덱스 순서로 조회
+    f"""
+    CREATE INDEX IF NOT EXISTS ix_mv_active_rewards_store_keyset
+    ON mv_active_rewards (store_id, COALESCE(exposure_order, {EXPOSURE_ORDER_LAST}), created_at DESC, id)
+    """,
+]
+
+
+async def ensure_active_rewards_view(session: AsyncSession) -> None:
+    """mv_active_rewards 구체화 뷰와 인덱스 생성 (이미 있으면 그대로 둠)"""
+    for ddl in ACTIVE_REWARDS_VIEW_DDL:
+        await session.execute(text(ddl))
+    await session.commit()
+
+
+async def refresh_active_rewards_view(session: AsyncSession) -> None:
+    """mv_active_rewards 갱신 (CONCURRENTLY: 갱신 중에도 앱 목록 조회가 막히지 않음)"""
+    await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_active_rewards"))
+    await session.commit()
+
+
+async def refresh_rewards_listing() -> None:
+    """
+    관리자 매장/상품 수정 직후 호출: 뷰를 바로 갱신한 뒤 앱 리워드 목록 캐시 무효화
+    (캐시만 지우면 갱신 전 뷰 내용이 다시 캐시되어, 수정이 갱신 주기 + 캐시 TTL만큼 늦게 보임)
+    요청 세션과 별도 세션에서 갱신하므로, 실패해도 호출한 쪽의 ORM 객체(응답 생성용)는 그대로 유지됩니다.
+    수정 자체는 이미 커밋되었으므로 갱신 실패는 로그만 남기고 다음 주기 갱신에 맡깁니다.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await refresh_active_rewards_view(session)
+    except SQLAlchemyError as e:
+        print(f"Active rewards view refresh failed: {e}")
+    await invalidate_rewards_cache()
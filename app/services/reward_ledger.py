@@ -0,0 +1,40 @@
+# app/services/reward_ledger.py
+
+from typing import Iterable, Mapping
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# COPY로 넣는 rewards_ledger 컬럼 (id, created_at은 DB 기본값 사용)
+LEDGER_COPY_COLUMNS = ("user_id", "content_id", "stage_id", "store_reward_id", "coin_delta", "note")
+LEDGER_COPY_CHUNK_SIZE = 1000
+
+
+async def bulk_insert_reward_ledger(db: AsyncSession, rows: Iterable[Mapping]) -> int:
+    """
+    포인트 내역 대량 기록 (관리자 일괄 지급/초기화 등)
+    ORM add_all 대신 PostgreSQL COPY로 LEDGER_COPY_CHUNK_SIZE 건씩 전송합니다.
+    세션과 같은 연결/트랜잭션에서 실행되므로 commit/rollback은 호출하는 쪽에서 처리합니다.
+    단건 기록은 기존처럼 RewardLedger ORM 객체를 사용하세요.
+    """
+    conn = await db.connection()
+    raw_conn = await conn.get_raw_connection()
+    driver_conn = raw_conn.driver_connection  # asyncpg.Connection
+    
+    inserted = 0
+    chunk = []
+    for row in rows:
+        chunk.append(tuple(row.get(column) for column in LEDGER_COPY_COLUMNS))
+        if len(chunk) >= LEDGER_COPY_CHUNK_SIZE:
+            await driver_conn.copy_records_to_table(
+                "rewards_ledger", schema_name="public", columns=LEDGER_COPY_COLUMNS, records=chunk
+            )
+            inserted += len(chunk)
+            chunk = []
+    
+    if chunk:
+        await driver_conn.copy_records_to_table(
+            "rewards_ledger", schema_name="public", columns=LEDGER_COPY_COLUMNS, records=chunk
+        )
+        inserted += len(chunk)
+    
+    return inserted
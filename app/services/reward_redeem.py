@@ -0,0 +1,100 @@
+# app/services/reward_redeem.py
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import select, update, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User, StoreReward, RewardLedger
+
+
+@dataclass
+class RedeemResult:
+    """상품 교환 결과"""
+    reward_id: UUID
+    price_coin: int
+    ledger_id: int
+    remaining_points: int
+
+
+async def redeem_store_reward(db: AsyncSession, user_id: UUID, reward_id: UUID) -> RedeemResult:
+    """
+    상품 교환 (재고 차감 + 포인트 차감 + 포인트 내역 기록)
+    호출하는 쪽에서 transaction() 블록 안에서 실행해야 합니다. (예외 시 재고 차감까지 rollback)
+    """
+    # 재고 차감을 조건부 UPDATE 한 번으로 처리 (활성 상품 + 재고 무제한(NULL) 또는 1개 이상)
+    # stock_qty가 NULL이면 NULL - 1 = NULL 이므로 무제한 상품은 그대로 유지됩니다.
+    result = await db.execute(
+        update(StoreReward)
+        .where(
+            StoreReward.id == reward_id,
+            StoreReward.is_active == True,
+            or_(StoreReward.stock_qty.is_(None), StoreReward.stock_qty > 0)
+        )
+        .values(stock_qty=StoreReward.stock_qty - 1)
+        .returning(StoreReward.id, StoreReward.price_coin, StoreReward.product_name)
+        .execution_options(synchronize_session=False)
+    )
+    reward = result.first()
+
+    if reward is None:
+        # 차감 실패 사유 확인 (없는 상품 / 비활성 / 재고 소진)
+        probe_result = await db.execute(
+            select(StoreReward.is_active).where(StoreReward.id == reward_id)
+        )
+        is_active = probe_result.scalar_one_or_none()
+
+        if is_active is None:
+            raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다.")
+
+        if not is_active:
+            raise HTTPException(status_code=400, detail="현재 교환 불가능한 상품입니다.")
+
+        raise HTTPException(status_code=400, detail="상품 재고가 소진되었습니다.")
+
+    # profile(JSONB)만 수정하므로 FOR NO KEY UPDATE로 잠금 (users를 참조하는 원장 INSERT의 FK 검사와 충돌하지 않음)
+    # populate_existing: get_current_user에서 이미 로드된 객체도 잠금 후 최신 값으로 갱신
+    user_result = await db.execute(
+        select(User)
+        .where(User.id == user_id)
+        .with_for_update(key_share=True, of=User)
+        .execution_options(populate_existing=True)
+    )
+    user_to_update = user_result.scalar_one_or_none()
+    if user_to_update is None:
+        raise HTTPException(status_code=404, detail="사용자 정보를 찾을 수 없습니다.")
+
+    user_points = user_to_update.profile.get("points", 0) if user_to_update.profile else 0
+
+    if user_points < reward.price_coin:
+        raise HTTPException(status_code=400, detail=f"포인트가 부족합니다. (보유: {user_points}P, 필요: {reward.price_coin}P)")
+
+    new_points = user_points - reward.price_coin
+
+    updated_profile = (user_to_update.profile or {}).copy()
+    updated_profile["points"] = new_points
+
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(profile=updated_profile)
+    )
+
+    new_ledger_entry = RewardLedger(
+        user_id=user_id,
+        store_reward_id=reward.id,
+        coin_delta=-abs(reward.price_coin),
+        note=f"상품 교환: {reward.product_name}"
+    )
+    db.add(new_ledger_entry)
+
+    await db.flush([new_ledger_entry])
+
+    return RedeemResult(
+        reward_id=reward.id,
+        price_coin=reward.price_coin,
+        ledger_id=new_ledger_entry.id,
+        remaining_points=new_points
+    )
@@ -0,0 +1,135 @@
+# app/services/scan_log_partitions.py
+
+from datetime import date
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# nfc_scan_logs는 scanned_at 기준 월별 RANGE 파티션 테이블입니다.
+# 월별 파티션: nfc_scan_logs_YYYY_MM, 범위를 벗어난 행은 nfc_scan_logs_default 로 들어갑니다.
+# 보관 기간이 지난 로그는 DELETE 대신 파티션 DROP 으로 정리합니다.
+SCAN_LOG_TABLE = "nfc_scan_logs"
+SCAN_LOG_DEFAULT_PARTITION = f"{SCAN_LOG_TABLE}_default"
+
+
+def add_months(month_start: date, months: int) -> date:
+    """월 시작일에 개월 수를 더한 월 시작일"""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month_start: date) -> str:
+    return f"{SCAN_LOG_TABLE}_{month_start.year:04d}_{month_start.month:02d}"
+
+
+async def is_partitioned(session: AsyncSession) -> bool:
+    """nfc_scan_logs가 파티션 테이블인지 확인 (기존 일반 테이블이면 파티션 작업을 건너뜀)"""
+    result = await session.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": SCAN_LOG_TABLE}
+    )
+    return result.scalar_one_or_none() == "p"
+
+
+async def partition_exists(session: AsyncSession, name: str) -> bool:
+    result = await session.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+    return result.scalar_one()
+
+
+async def create_month_partition(session: AsyncSession, name: str, start: date, end: date) -> int:
+    """
+    월별 파티션 생성 (기본 파티션에 이미 그 달의 행이 있으면 옮긴 뒤 ATTACH)
+    기본 파티션에 범위가 겹치는 행이 남아 있으면 CREATE TABLE ... PARTITION OF 가 실패하므로,
+    같은 구조의 테이블을 만들어 행을 옮기고 파티션으로 붙입니다. 옮긴 행 수를 반환합니다.
+    """
+    bounds = f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    in_range = f"scanned_at >= '{start.isoformat()} 00:00:00+00' AND scanned_at < '{end.isoformat()} 00:00:00+00'"
+    
+    result = await session.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {SCAN_LOG_DEFAULT_PARTITION} WHERE {in_range})"
+    ))
+    if not result.scalar_one():
+        await session.execute(text(f"CREATE TABLE {name} PARTITION OF {SCAN_LOG_TABLE} {bounds}"))
+        return 0
+    
+    await session.execute(text(
+        f"CREATE TABLE {name} (LIKE {SCAN_LOG_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    moved = await session.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {SCAN_LOG_DEFAULT_PARTITION} WHERE {in_range} RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """))
+    # ATTACH 시 부모 테이블의 인덱스/외래키가 새 파티션에도 만들어짐
+    await session.execute(text(f"ALTER TABLE {SCAN_LOG_TABLE} ATTACH PARTITION {name} {bounds}"))
+    return moved.rowcount
+
+
+async def ensure_scan_log_partitions(session: AsyncSession, today: date, months_ahead: int) -> List[str]:
+    """
+    이번 달부터 months_ahead 개월 뒤까지의 월별 파티션과 기본 파티션 생성 (이미 있으면 그대로 둠)
+    파티션마다 SAVEPOINT 안에서 만들어, 한 달이 실패해도 나머지 달은 계속 생성합니다.
+    """
+    if not await is_partitioned(session):
+        return []
+    
+    await session.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCAN_LOG_DEFAULT_PARTITION} PARTITION OF {SCAN_LOG_TABLE} DEFAULT"
+    ))
+    
+    created = []
+    month_start = today.replace(day=1)
+    for offset in range(months_ahead + 1):
+        start = add_months(month_start, offset)
+        end = add_months(start, 1)
+        name = partition_name(start)
+        
+        if await partition_exists(session, name):
+            created.append(name)
+            continue
+        
+        try:
+            async with session.begin_nested():
+                moved = await create_month_partition(session, name, start, end)
+        except SQLAlchemyError as e:
+            print(f"Scan log partition {name} ({start:%Y-%m}) not created: {e}")
+            continue
+        
+        if moved:
+            print(f"Scan log partition {name}: moved {moved} rows from {SCAN_LOG_DEFAULT_PARTITION}")
+        created.append(name)
+    
+    await session.commit()
+    return created
+
+
+async def drop_expired_scan_log_partitions(session: AsyncSession, today: date, retention_months: int) -> List[str]:
+    """보관 기간(retention_months)이 지난 월별 파티션 삭제"""
+    if not await is_partitioned(session):
+        return []
+    
+    cutoff = partition_name(add_months(today.replace(day=1), -retention_months))
+    result = await session.execute(
+        text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(:table)
+            ORDER BY c.relname
+        """),
+        {"table": SCAN_LOG_TABLE}
+    )
+    
+    # 파티션 이름(nfc_scan_logs_YYYY_MM)은 문자열 순서가 곧 월 순서
+    expired = [
+        name for name in result.scalars()
+        if name != SCAN_LOG_DEFAULT_PARTITION and name < cutoff
+    ]
+    for name in expired:
+        await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    
+    await session.commit()
+    return expired
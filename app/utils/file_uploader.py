@@ -1,6 +1,7 @@
 # app/utils/file_uploader.py
-import aiofiles
+import asyncio
 import os
+import shutil
 import uuid
 from fastapi import UploadFile
 from typing import Optional
@@ -10,6 +11,28 @@ SAVE_DIR = "static/uploads"
 # 클라이언트에 반환할 기본 URL 경로
 BASE_URL_PATH = "/static/uploads"
 
+# 업로드 허용 확장자 (소문자, 점 제외)
+ALLOWED_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "gif", "pdf"})
+
+# 파일 복사 버퍼 크기 (1MB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def get_allowed_extension(filename: Optional[str]) -> Optional[str]:
+    """파일명에서 확장자(소문자)를 꺼내 허용 목록에 있으면 반환, 없거나 허용되지 않으면 None"""
+    name = filename or ""
+    if "." not in name:
+        return None
+    extension = name.rsplit(".", 1)[1].lower()
+    return extension if extension in ALLOWED_EXTENSIONS else None
+
+def _copy_to_path(src, dst_path: str) -> None:
+    """
+    [동기 함수] 업로드 파일 객체를 dst_path에 그대로 복사합니다.
+    I/O 작업이므로 asyncio.to_thread로 호출되어야 합니다.
+    """
+    with open(dst_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
 async def upload_file_to_storage(file: UploadFile, path_prefix: str) -> Optional[str]:
     """
     파일 저장소(로컬 'static/uploads')에 파일을 비동기적으로 저장하고 URL을 반환합니다.
@@ -25,17 +48,18 @@ async def upload_file_to_storage(file: UploadFile, path_prefix: str) -> Optional
         os.makedirs(full_save_dir, exist_ok=True)
         
         # 3. 고유한 파일명 생성 (보안 및 중복 방지)
-        # 예: 'original.jpg' -> '.jpg'
-        file_extension = os.path.splitext(file.filename)[1]
-        # 예: 'some-uuid-string.jpg'
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
+        # 예: 'original.JPG' -> 'jpg' (허용되지 않은 확장자는 저장하지 않음)
+        file_extension = get_allowed_extension(file.filename)
+        if file_extension is None:
+            print(f"허용되지 않은 파일 확장자: {file.filename}")
+            return None
+        # 예: '3f2a...c9.jpg'
+        unique_filename = f"{uuid.uuid4().hex}.{file_extension}"
         
         file_path = os.path.join(full_save_dir, unique_filename)
         
-        # 4. 파일 비동기 쓰기 (대용량 파일을 위해 청크 단위로)
-        async with aiofiles.open(file_path, 'wb') as f:
-            while content := await file.read(1024 * 1024): # 1MB 청크
-                await f.write(content)
+        # 4. 파일 쓰기 (SpooledTemporaryFile을 별도 스레드에서 한 번에 복사, 청크마다 await 하지 않음)
+        await asyncio.to_thread(_copy_to_path, file.file, file_path)
                 
         # 5. 웹 접근 가능 URL 반환
         # 예: '/static/uploads/users/profile/some-uuid-string.jpg'
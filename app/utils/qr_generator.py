@@ -1,5 +1,8 @@
 # app/utils/qr_generator.py
 import qrcode
+import aiofiles
+import hashlib
+import io
 import os
 import uuid
 import json
@@ -12,55 +15,57 @@ SAVE_DIR = "static/qrcodes"
 # 서버에서 클라이언트로 반환할 URL 경로
 BASE_URL_PATH = "/static/qrcodes"
 
-def _generate_and_save_qr(data_str: str, filename: str) -> str:
+def _render_qr_bytes(data_str: str) -> bytes:
     """
-    [동기 함수] QR 코드를 생성하고 파일 시스템에 저장합니다.
-    I/O 작업이므로 asyncio.to_thread로 호출되어야 합니다.
+    [동기 함수] QR 코드를 생성해 PNG bytes로 반환합니다.
+    CPU 작업이므로 asyncio.to_thread로 호출되어야 합니다. (파일 저장은 호출하는 쪽에서 비동기로)
     """
-    try:
-        # 1. 저장 디렉토리 생성 (없을 경우)
-        os.makedirs(SAVE_DIR, exist_ok=True)
-        
-        file_path = os.path.join(SAVE_DIR, filename)
-        
-        # 2. QR 코드 객체 생성
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(data_str)
-        qr.make(fit=True)
+    # 1. QR 코드 객체 생성
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data_str)
+    qr.make(fit=True)
 
-        # 3. 이미지 파일로 저장 (Pillow 사용)
-        img = qr.make_image(fill_color="black", back_color="white")
-        img.save(file_path)
-        
-        # 4. 웹 접근 가능 URL 반환
-        url_path = f"{BASE_URL_PATH}/{filename}"
-        return url_path
-
-    except Exception as e:
-        print(f"QR 코드 생성 실패: {e}")
-        return None
+    # 2. 메모리 버퍼에 PNG로 인코딩 (Pillow 사용)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
 
 async def generate_qr_code_image(data: Dict[str, Any], filename_prefix: str) -> str:
     """
-    [비동기 래퍼] QR 코드 생성 I/O 작업을 별도 스레드에서 실행합니다.
+    [비동기 래퍼] QR 코드 인코딩은 별도 스레드에서, 파일 저장은 aiofiles로 처리합니다.
     """
     # 1. QR 코드에 담을 데이터를 JSON 문자열로 변환
     data_str = json.dumps(data, ensure_ascii=False)
     
-    # 2. 고유 파일명 생성
-    unique_id = uuid.uuid4()
-    filename = f"{filename_prefix}_{unique_id}.png"
+    # 2. 데이터 해시로 파일명 생성 (같은 데이터면 같은 파일을 재사용)
+    payload_key = hashlib.blake2b(data_str.encode(), digest_size=16).hexdigest()
+    filename = f"{filename_prefix}_{payload_key}.png"
+    file_path = os.path.join(SAVE_DIR, filename)
+    url_path = f"{BASE_URL_PATH}/{filename}"
+    
+    # 이미 생성된 QR 코드가 있으면 인코딩/저장 없이 바로 반환
+    if os.path.exists(file_path):
+        return url_path
     
-    # 3. 동기 I/O 함수를 별도 스레드에서 실행 (asyncio 이벤트 루프 차단 방지)
     try:
-        url_path = await asyncio.to_thread(_generate_and_save_qr, data_str, filename)
-        if url_path is None:
-            raise Exception("QR code generation failed in thread.")
+        # 3. PNG 인코딩을 별도 스레드에서 실행 (asyncio 이벤트 루프 차단 방지)
+        png = await asyncio.to_thread(_render_qr_bytes, data_str)
+        
+        # 4. 저장 디렉토리 생성 (없을 경우) 후 비동기 쓰기
+        # 임시 파일에 다 쓴 뒤 rename (쓰다 만 파일이 캐시로 재사용되지 않도록)
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            await f.write(png)
+        os.replace(tmp_path, file_path)
+        
+        # 5. 웹 접근 가능 URL 반환
         return url_path
     except Exception as e:
         # 실제 운영 환경에서는 로깅 필요
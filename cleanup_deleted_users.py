@@ -3,14 +3,14 @@
 import asyncio
 from datetime import datetime, timedelta
 from sqlalchemy import select, delete, func
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
-# DB 설정과 User 모델을 가져옵니다.
-from app.core.config import settings
+# 앱과 같은 엔진/세션 설정(asyncpg URL, 커넥션 풀)과 User 모델을 가져옵니다.
+from app.core.database import AsyncSessionLocal, async_engine
 from app.models.user import User
 
 # 스케줄러 작업 설정
 RETENTION_DAYS = 30 # 30일이 지난 사용자를 삭제
+BATCH_SIZE = 500 # 한 트랜잭션에서 삭제할 최대 사용자 수 (CASCADE 잠금 시간 제한)
 
 async def cleanup_task():
     """
@@ -19,32 +19,37 @@ async def cleanup_task():
     """
     print(f"[{datetime.now()}] 스케줄러 작업 시작: {RETENTION_DAYS}일 지난 계정 삭제...")
 
-    # DB 연결 설정
-    engine = create_async_engine(settings.DATABASE_URL)
-    SessionLocal = async_sessionmaker(bind=engine)
-    
     # 삭제 기준 시각 (30일 전)
     # DB의 현재 시각(func.now())을 기준으로 30일 전보다
     # deleted_at이 오래된(작은) 사용자를 찾습니다.
     cutoff_time_sql = func.now() - timedelta(days=RETENTION_DAYS)
     
-    # 대상 쿼리
+    # 대상 조건 (ix_users_deleted_cleanup 부분 인덱스 사용)
+    target_conditions = (
+        User.status == 'deleted',
+        User.deleted_at != None, # deleted_at이 설정된 사용자만
+        User.deleted_at < cutoff_time_sql
+    )
+    
+    # 대상 쿼리 (BATCH_SIZE명씩 나눠 삭제해서 한 번에 대량의 행을 잠그지 않음)
     delete_query = (
         delete(User)
-        .where(
-            User.status == 'deleted',
-            User.deleted_at != None, # deleted_at이 설정된 사용자만
-            User.deleted_at < cutoff_time_sql
-        )
+        .where(User.id.in_(select(User.id).where(*target_conditions).limit(BATCH_SIZE)))
+        .execution_options(synchronize_session=False)
     )
 
-    async with SessionLocal() as session:
+    async with AsyncSessionLocal() as session:
         try:
-            # 삭제 실행
-            result = await session.execute(delete_query)
-            await session.commit()
+            deleted_count = 0
+            while True:
+                # 배치 단위로 삭제 후 바로 커밋 (다른 쓰기 작업이 오래 막히지 않도록)
+                result = await session.execute(delete_query)
+                await session.commit()
+                
+                deleted_count += result.rowcount
+                if result.rowcount < BATCH_SIZE:
+                    break
             
-            deleted_count = result.rowcount
             if deleted_count > 0:
                 print(f"성공: {deleted_count}명의 사용자 및 연관 데이터를 영구 삭제했습니다.")
             else:
@@ -53,10 +58,15 @@ async def cleanup_task():
         except Exception as e:
             await session.rollback()
             print(f"오류: DB 작업 실패. {e}")
-        finally:
-            await engine.dispose()
 
     print(f"[{datetime.now()}] 스케줄러 작업 종료.")
 
+async def main():
+    """스크립트 단독 실행 시: 작업 후 공유 엔진의 커넥션 풀을 한 번만 정리"""
+    try:
+        await cleanup_task()
+    finally:
+        await async_engine.dispose()
+
 if __name__ == "__main__":
-    asyncio.run(cleanup_task())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -1,13 +1,66 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import asyncio
 import os
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.core.config import settings
-from app.core.database import check_db_connection, init_db
+from app.core.database import check_db_connection, init_db, AsyncSessionLocal
+from app.core.cache import close_cache, listen_stage_invalidation
+from app.services.reward_catalog import ensure_active_rewards_view
+from app.services.scan_log_partitions import ensure_scan_log_partitions
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 실행할 초기화 및 정리 작업"""
+    print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+
+    db_connected = await check_db_connection()
+    if not db_connected:
+        print("Database connection failed!")
+    else:
+        print("Database connected successfully")
+
+        # 앱 리워드 목록용 구체화 뷰 준비 (갱신은 refresh_active_rewards.py 워커가 담당)
+        try:
+            async with AsyncSessionLocal() as session:
+                await ensure_active_rewards_view(session)
+        except Exception as e:
+            print(f"Warning: mv_active_rewards not ready - {e}")
+
+    if settings.INIT_DB:
+        await init_db()
+
+    # NFC 스캔 로그 월별 파티션 준비 (이후 생성/정리는 maintain_scan_log_partitions.py 스케줄러가 담당)
+    if db_connected:
+        try:
+            async with AsyncSessionLocal() as session:
+                await ensure_scan_log_partitions(
+                    session,
+                    datetime.now(timezone.utc).date(),
+                    settings.NFC_SCAN_LOG_PARTITION_MONTHS_AHEAD
+                )
+        except Exception as e:
+            print(f"Warning: nfc_scan_logs partitions not ready - {e}")
+
+    # 관리자 수정 시 다른 워커의 로컬 캐시도 정리되도록 무효화 채널 구독
+    stage_invalidation_task = asyncio.create_task(listen_stage_invalidation())
+
+    yield
+
+    print(f"Shutting down {settings.APP_NAME}")
+    stage_invalidation_task.cancel()
+    try:
+        await stage_invalidation_task
+    except asyncio.CancelledError:
+        pass
+    await close_cache()
+
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
@@ -16,6 +69,9 @@ app = FastAPI(
     description="XPG API - 관리자용 API 및 사용자 앱 API",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    # UUID/datetime이 많은 응답을 C 구현(orjson)으로 직렬화 (전체 API 기본 응답 클래스)
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -30,7 +86,7 @@ app.add_middleware(
 # 신뢰할 수 있는 호스트 미들웨어 (보안)
 app.add_middleware(
     TrustedHostMiddleware,
-    allowed_hosts=["*"] if settings.DEBUG else ["api.xpg.example.com", "localhost"]
+    allowed_hosts=["*"] if settings.DEBUG else settings.ALLOWED_HOSTS
 )
 
 static_dir = "static"
@@ -44,27 +100,6 @@ MEDIA_URL_PREFIX = "/media/images"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 app.mount(MEDIA_URL_PREFIX, StaticFiles(directory=UPLOAD_DIR), name="media")
 
-@app.on_event("startup")
-async def startup_event():
-    """앱 시작 시 실행할 초기화 작업"""
-    print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-
-    db_connected = await check_db_connection()
-    if not db_connected:
-        print("Database connection failed!")
-    else:
-        print("Database connected successfully")
-
-    if settings.DEBUG:
-        await init_db()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """앱 종료 시 정리 작업"""
-    print(f"Shutting down {settings.APP_NAME}")
-
-
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -0,0 +1,48 @@
+# /var/www/xpg/xpg_backend/maintain_scan_log_partitions.py
+
+import asyncio
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.scan_log_partitions import ensure_scan_log_partitions, drop_expired_scan_log_partitions
+
+
+async def maintain_task():
+    """
+    NFC 스캔 로그 월별 파티션을 관리합니다. (하루 1회 실행 권장)
+    - 다음 NFC_SCAN_LOG_PARTITION_MONTHS_AHEAD 개월분 파티션을 미리 생성
+    - NFC_SCAN_LOG_RETENTION_MONTHS 가 설정된 경우 보관 기간이 지난 파티션을 삭제
+    """
+    print(f"[{datetime.now()}] 스케줄러 작업 시작: NFC 스캔 로그 파티션 관리...")
+
+    today = datetime.now(timezone.utc).date()
+
+    async with AsyncSessionLocal() as session:
+        try:
+            created = await ensure_scan_log_partitions(
+                session, today, settings.NFC_SCAN_LOG_PARTITION_MONTHS_AHEAD
+            )
+            print(f"성공: 파티션 확인 완료 ({', '.join(created) or '파티션 테이블 아님'})")
+
+            if settings.NFC_SCAN_LOG_RETENTION_MONTHS is not None:
+                dropped = await drop_expired_scan_log_partitions(
+                    session, today, settings.NFC_SCAN_LOG_RETENTION_MONTHS
+                )
+                print(f"성공: 보관 기간이 지난 파티션 {len(dropped)}개 삭제 {dropped}")
+
+        except Exception as e:
+            await session.rollback()
+            print(f"오류: DB 작업 실패. {e}")
+
+    print(f"[{datetime.now()}] 스케줄러 작업 종료.")
+
+async def main():
+    """스크립트 단독 실행 시: 작업 후 공유 엔진의 커넥션 풀을 한 번만 정리"""
+    try:
+        await maintain_task()
+    finally:
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
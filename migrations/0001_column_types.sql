@@ -0,0 +1,222 @@
+-- migrations/0001_column_types.sql
+--
+-- 모델의 컬럼 타입 변경을 기존 DB에 반영합니다.
+--   - 고정 값 텍스트 컬럼 → PostgreSQL ENUM (기존 CHECK 제약 삭제)
+--     (users.status 변경 전에는 로그인/인증 조회가 실패하므로 배포 전에 실행)
+--   - users.login_id / email → CITEXT (대소문자만 다른 중복이 있으면 중단)
+-- 여러 번 실행해도 안전합니다. (이미 반영된 항목은 건너뜀)
+--
+-- 실행: psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/0001_column_types.sql
+
+BEGIN;
+
+-- 텍스트 컬럼을 ENUM으로 변경 (이미 해당 ENUM이면 아무것도 하지 않음)
+-- 기본값이 있으면 잠시 떼었다가 ENUM 값으로 다시 설정합니다. (text 기본값은 자동 변환되지 않음)
+CREATE FUNCTION pg_temp.alter_column_to_enum(tbl text, col text, enum_type text) RETURNS void AS $$
+DECLARE
+    col_udt text;
+    col_default text;
+BEGIN
+    SELECT udt_name, column_default INTO col_udt, col_default
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = tbl AND column_name = col;
+
+    IF col_udt IS NULL OR col_udt = enum_type THEN
+        RETURN;
+    END IF;
+
+    IF col_default IS NOT NULL THEN
+        EXECUTE format('ALTER TABLE public.%I ALTER COLUMN %I DROP DEFAULT', tbl, col);
+    END IF;
+
+    EXECUTE format(
+        'ALTER TABLE public.%I ALTER COLUMN %I TYPE public.%I USING %I::text::public.%I',
+        tbl, col, enum_type, col, enum_type
+    );
+
+    IF col_default IS NOT NULL THEN
+        EXECUTE format(
+            'ALTER TABLE public.%I ALTER COLUMN %I SET DEFAULT (%s)::text::public.%I',
+            tbl, col, col_default, enum_type
+        );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 부분 인덱스 조건이 text 비교로 남아 있으면 ENUM 비교로 다시 생성
+-- (status::text = 'x' 조건은 status = 'x'::enum 쿼리에 사용되지 않음)
+CREATE FUNCTION pg_temp.rebuild_text_partial_index(index_name text, create_sql text) RETURNS void AS $$
+BEGIN
+    IF to_regclass('public.' || index_name) IS NOT NULL
+       AND pg_get_expr(
+               (SELECT indpred FROM pg_index WHERE indexrelid = to_regclass('public.' || index_name)),
+               (SELECT indrelid FROM pg_index WHERE indexrelid = to_regclass('public.' || index_name))
+           ) LIKE '%::text%' THEN
+        EXECUTE format('DROP INDEX public.%I', index_name);
+    END IF;
+    EXECUTE create_sql;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- ---------------------------------------------------------------------------
+-- 콘텐츠 / 인증 / NFC / 공지 / 진행 상태 ENUM
+-- ---------------------------------------------------------------------------
+
+DO $$ BEGIN
+    CREATE TYPE public.content_type_enum AS ENUM ('story', 'domination');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.content_exposure_slot_enum AS ENUM ('story', 'event');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.content_prerequisite_requirement_enum AS ENUM ('cleared');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.auth_provider_enum AS ENUM (
+        'local', 'google', 'apple', 'kakao', 'naver', 'facebook', 'github', 'line'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.nfc_category_enum AS ENUM (
+        'none', 'stage', 'hint', 'checkpoint', 'base', 'safezone', 'treasure'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.notification_type_enum AS ENUM ('system', 'event', 'promotion');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.notification_status_enum AS ENUM ('draft', 'scheduled', 'published', 'expired');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.content_progress_status_enum AS ENUM ('joined', 'in_progress', 'cleared', 'left');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- ENUM이 같은 값 목록을 보장하므로 CHECK 제약은 삭제
+ALTER TABLE public.contents DROP CONSTRAINT IF EXISTS contents_content_type_chk;
+ALTER TABLE public.contents DROP CONSTRAINT IF EXISTS contents_exposure_slot_check;
+ALTER TABLE public.content_prerequisites DROP CONSTRAINT IF EXISTS content_prerequisites_requirement_chk;
+ALTER TABLE public.auth_identities DROP CONSTRAINT IF EXISTS auth_identities_provider_chk;
+ALTER TABLE public.nfc_tags DROP CONSTRAINT IF EXISTS nfc_tags_category_chk;
+ALTER TABLE public.notifications DROP CONSTRAINT IF EXISTS check_notification_type;
+ALTER TABLE public.notifications DROP CONSTRAINT IF EXISTS check_status;
+
+-- ALTER COLUMN ... TYPE <enum> USING col::<enum>
+SELECT pg_temp.alter_column_to_enum('contents', 'content_type', 'content_type_enum');
+SELECT pg_temp.alter_column_to_enum('contents', 'exposure_slot', 'content_exposure_slot_enum');
+SELECT pg_temp.alter_column_to_enum('content_prerequisites', 'requirement', 'content_prerequisite_requirement_enum');
+SELECT pg_temp.alter_column_to_enum('auth_identities', 'provider', 'auth_provider_enum');
+SELECT pg_temp.alter_column_to_enum('nfc_tags', 'category', 'nfc_category_enum');
+SELECT pg_temp.alter_column_to_enum('notifications', 'notification_type', 'notification_type_enum');
+SELECT pg_temp.alter_column_to_enum('notifications', 'status', 'notification_status_enum');
+SELECT pg_temp.alter_column_to_enum('user_content_progress', 'status', 'content_progress_status_enum');
+
+SELECT pg_temp.rebuild_text_partial_index(
+    'ix_user_content_progress_cleared',
+    'CREATE INDEX IF NOT EXISTS ix_user_content_progress_cleared
+         ON public.user_content_progress (content_id) WHERE status = ''cleared'''
+);
+
+
+-- ---------------------------------------------------------------------------
+-- 스테이지 퍼즐/클리어 연출 / 사용자 상태 ENUM
+-- ---------------------------------------------------------------------------
+
+DO $$ BEGIN
+    CREATE TYPE public.stage_puzzle_show_when_enum AS ENUM ('always', 'after_clear');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.stage_unlock_preset_enum AS ENUM ('fullscreen', 'popup');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.stage_unlock_next_action_enum AS ENUM ('next_step', 'next_stage');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE public.user_status_enum AS ENUM ('active', 'blocked', 'deleted');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+ALTER TABLE public.stage_puzzles DROP CONSTRAINT IF EXISTS stage_puzzles_show_when_chk;
+ALTER TABLE public.stage_unlocks DROP CONSTRAINT IF EXISTS stage_unlocks_preset_chk;
+ALTER TABLE public.stage_unlocks DROP CONSTRAINT IF EXISTS stage_unlocks_next_action_chk;
+ALTER TABLE public.users DROP CONSTRAINT IF EXISTS users_status_chk;
+
+SELECT pg_temp.alter_column_to_enum('stage_puzzles', 'show_when', 'stage_puzzle_show_when_enum');
+SELECT pg_temp.alter_column_to_enum('stage_unlocks', 'unlock_preset', 'stage_unlock_preset_enum');
+SELECT pg_temp.alter_column_to_enum('stage_unlocks', 'next_action', 'stage_unlock_next_action_enum');
+SELECT pg_temp.alter_column_to_enum('users', 'status', 'user_status_enum');
+
+SELECT pg_temp.rebuild_text_partial_index(
+    'ix_users_deleted_cleanup',
+    'CREATE INDEX IF NOT EXISTS ix_users_deleted_cleanup
+         ON public.users (deleted_at) WHERE status = ''deleted'''
+);
+
+
+-- ---------------------------------------------------------------------------
+-- users.login_id / email → CITEXT
+-- ---------------------------------------------------------------------------
+
+CREATE EXTENSION IF NOT EXISTS citext;
+
+-- 대소문자만 다른 중복 확인 (결과가 있으면 먼저 정리해야 유니크 인덱스가 다시 만들어짐)
+--   SELECT 'login_id' AS col, lower(login_id) AS value, array_agg(id) AS user_ids
+--     FROM public.users GROUP BY lower(login_id) HAVING count(*) > 1
+--   UNION ALL
+--   SELECT 'email', lower(email), array_agg(id)
+--     FROM public.users WHERE email IS NOT NULL GROUP BY lower(email) HAVING count(*) > 1;
+DO $$
+DECLARE
+    dup_login_ids bigint;
+    dup_emails bigint;
+BEGIN
+    SELECT count(*) INTO dup_login_ids FROM (
+        SELECT 1 FROM public.users
+        GROUP BY lower(login_id::text) HAVING count(*) > 1
+    ) d;
+    SELECT count(*) INTO dup_emails FROM (
+        SELECT 1 FROM public.users WHERE email IS NOT NULL
+        GROUP BY lower(email::text) HAVING count(*) > 1
+    ) d;
+
+    IF dup_login_ids > 0 OR dup_emails > 0 THEN
+        RAISE EXCEPTION 'users에 대소문자만 다른 중복이 있습니다 (login_id %건, email %건). 위 조회로 확인 후 정리하세요.',
+            dup_login_ids, dup_emails;
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'users'
+          AND column_name IN ('login_id', 'email') AND udt_name <> 'citext'
+    ) THEN
+        ALTER TABLE public.users
+            ALTER COLUMN login_id TYPE citext,
+            ALTER COLUMN email TYPE citext;
+    END IF;
+END $$;
+
+COMMIT;
@@ -0,0 +1,35 @@
+-- migrations/0002_store_geom.sql
+--
+-- stores.latitude / longitude 컬럼을 geom 하나로 합칩니다.
+-- (모델은 위도/경도를 geom에서 계산하므로, geom이 비어 있는 매장은 좌표가 null로 보임)
+-- 여러 번 실행해도 안전합니다. (컬럼이 이미 없으면 건너뜀)
+--
+-- 실행 순서: 이 스크립트 → 앱 재시작 (mv_active_rewards는 앱 시작 시 geom 기준으로 다시 생성)
+-- 실행: psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/0002_store_geom.sql
+
+BEGIN;
+
+-- 1) 기존 뷰는 stores.latitude/longitude를 참조하므로 먼저 삭제
+--    (CREATE MATERIALIZED VIEW IF NOT EXISTS 로는 정의가 바뀌지 않음)
+DROP MATERIALIZED VIEW IF EXISTS public.mv_active_rewards;
+
+-- 2) 관리자 API가 지금까지 위도/경도 컬럼에만 저장했으므로 geom 백필
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'stores' AND column_name = 'latitude'
+    ) AND EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'stores' AND column_name = 'longitude'
+    ) THEN
+        UPDATE public.stores
+           SET geom = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+         WHERE geom IS NULL AND latitude IS NOT NULL AND longitude IS NOT NULL;
+    END IF;
+END $$;
+
+-- 3) 백필 후 중복 컬럼 삭제
+ALTER TABLE public.stores DROP COLUMN IF EXISTS latitude, DROP COLUMN IF EXISTS longitude;
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- migrations/0003_drop_store_rewards_keyset.sql
+--
+-- 앱 리워드 목록은 mv_active_rewards(ix_mv_active_rewards_keyset)에서 조회하므로
+-- store_rewards의 커서 정렬 인덱스는 더 이상 읽는 쿼리가 없습니다. (상품 교환 재고 차감 시 쓰기 비용만 발생)
+-- 여러 번 실행해도 안전합니다.
+--
+-- CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 BEGIN/COMMIT 없이 실행합니다.
+-- 실행: psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f migrations/0003_drop_store_rewards_keyset.sql
+
+DROP INDEX CONCURRENTLY IF EXISTS public.ix_store_rewards_keyset;
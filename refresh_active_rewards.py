@@ -0,0 +1,42 @@
+# /var/www/xpg/xpg_backend/refresh_active_rewards.py
+
+import asyncio
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.reward_catalog import ensure_active_rewards_view, refresh_active_rewards_view
+
+
+async def refresh_worker():
+    """
+    앱 리워드 목록용 구체화 뷰(mv_active_rewards)를 주기적으로 갱신합니다.
+    (ACTIVE_REWARDS_REFRESH_SEC 간격, 기본 30초)
+    """
+    print(f"[{datetime.now()}] 리워드 목록 뷰 갱신 워커 시작 ({settings.ACTIVE_REWARDS_REFRESH_SEC}초 간격)")
+
+    # 앱과 같은 엔진 사용 (PgBouncer 사용 시 statement 캐시 끄기, jit 설정 등 connect_args 공유)
+    async with AsyncSessionLocal() as session:
+        await ensure_active_rewards_view(session)
+
+    while True:
+        async with AsyncSessionLocal() as session:
+            try:
+                await refresh_active_rewards_view(session)
+            except Exception as e:
+                await session.rollback()
+                print(f"[{datetime.now()}] 오류: 뷰 갱신 실패. {e}")
+
+        await asyncio.sleep(settings.ACTIVE_REWARDS_REFRESH_SEC)
+
+
+async def main():
+    """스크립트 단독 실행 시: 워커 종료 후 공유 엔진의 커넥션 풀 정리"""
+    try:
+        await refresh_worker()
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
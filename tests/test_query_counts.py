@@ -0,0 +1,87 @@
+# tests/test_query_counts.py
+# N+1 회귀 방지용 쿼리 수 확인 (벤치마크가 아니라 상한만 확인하는 가드레일)
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from app.core.database import count_queries
+from tests.conftest import requires_db
+
+# GET /api/v1/stages/{id} 캐시 MISS 경로의 최대 SQL 문 수 (힌트 수와 무관해야 함)
+# 스테이지 1 + 힌트 1 + 힌트 이미지 1 + NFC 1 + 퍼즐 1 + 해금 설정 1
+STAGE_DETAIL_MAX_QUERIES = 6
+
+
+def test_count_queries_collects_statements_inside_block():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with count_queries(engine) as queries:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        # 블록을 벗어나면 리스너가 제거되어 더 이상 집계하지 않음
+        conn.execute(text("SELECT 3"))
+
+    assert queries == ["SELECT 1", "SELECT 2"]
+
+
+def test_count_queries_accepts_async_engine_wrapper():
+    engine = create_engine("sqlite://")
+
+    class AsyncEngineLike:
+        sync_engine = engine
+
+    with engine.connect() as conn:
+        with count_queries(AsyncEngineLike()) as queries:
+            conn.execute(text("SELECT 1"))
+
+    assert len(queries) == 1
+
+
+@requires_db
+@pytest.mark.asyncio
+async def test_stage_detail_query_count(client, monkeypatch):
+    from app.api import deps
+    from app.api.v1 import stages as stages_api
+    from app.core.database import AsyncSessionLocal
+    from app.models import Stage, StageHint, User, UserContentProgress
+    from main import app
+
+    # 힌트가 가장 많은 공개 스테이지 + 해당 콘텐츠에 참여한 사용자
+    async with AsyncSessionLocal() as session:
+        row = (await session.execute(
+            select(Stage.id, UserContentProgress.user_id)
+            .join(UserContentProgress, UserContentProgress.content_id == Stage.content_id)
+            .outerjoin(StageHint, StageHint.stage_id == Stage.id)
+            .where(Stage.is_hidden == False)
+            .group_by(Stage.id, UserContentProgress.user_id)
+            .order_by(func.count(StageHint.id).desc())
+            .limit(1)
+        )).first()
+        if row is None:
+            pytest.skip("no visible stage with a joined user in the test database")
+        stage_id, user_id = row
+        user = await session.get(User, user_id)
+
+    app.dependency_overrides[deps.get_current_user] = lambda: user
+
+    # 항상 DB 경로(캐시 MISS)를 측정
+    async def cache_miss(key):
+        return None
+
+    async def cache_skip(key, value, ttl_sec):
+        return None
+
+    monkeypatch.setattr(stages_api, "cache_get", cache_miss)
+    monkeypatch.setattr(stages_api, "cache_set", cache_skip)
+
+    # 첫 연결 시 dialect 초기화 쿼리가 섞이지 않도록 한 번 호출한 뒤 측정
+    warmup = await client.get(f"/api/v1/stages/{stage_id}")
+    assert warmup.status_code == 200, warmup.text
+
+    stages_api.nfc_info_cache._data.clear()
+    with count_queries() as queries:
+        response = await client.get(f"/api/v1/stages/{stage_id}")
+
+    assert response.status_code == 200, response.text
+    assert len(queries) <= STAGE_DETAIL_MAX_QUERIES, "\n\n".join(queries)
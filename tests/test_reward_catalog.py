@@ -0,0 +1,66 @@
+# tests/test_reward_catalog.py
+# 관리자 수정 후 리워드 목록 뷰 갱신 (갱신 실패가 관리자 응답에 영향을 주지 않는지 확인)
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.services import reward_catalog
+from tests.conftest import requires_db
+
+
+def fail_refresh(calls):
+    async def _refresh(session):
+        calls.append(session)
+        raise OperationalError("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_active_rewards", {}, Exception("view is locked"))
+    return _refresh
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_still_invalidates_cache(monkeypatch):
+    refresh_calls = []
+    invalidated = []
+
+    async def record_invalidate():
+        invalidated.append(True)
+
+    monkeypatch.setattr(reward_catalog, "refresh_active_rewards_view", fail_refresh(refresh_calls))
+    monkeypatch.setattr(reward_catalog, "invalidate_rewards_cache", record_invalidate)
+
+    await reward_catalog.refresh_rewards_listing()
+
+    assert len(refresh_calls) == 1
+    assert invalidated == [True]
+
+
+@requires_db
+@pytest.mark.asyncio
+async def test_reward_update_returns_200_when_view_refresh_fails(client, monkeypatch):
+    from app.api import deps
+    from app.core.database import AsyncSessionLocal
+    from app.models import Admin, StoreReward
+    from main import app
+
+    async with AsyncSessionLocal() as session:
+        reward = (await session.execute(select(StoreReward).limit(1))).scalar_one_or_none()
+        admin = (await session.execute(select(Admin).limit(1))).scalar_one_or_none()
+    if reward is None or admin is None:
+        pytest.skip("no store reward or admin in the test database")
+
+    async def skip_invalidate():
+        return None
+
+    refresh_calls = []
+    monkeypatch.setattr(reward_catalog, "refresh_active_rewards_view", fail_refresh(refresh_calls))
+    monkeypatch.setattr(reward_catalog, "invalidate_rewards_cache", skip_invalidate)
+    app.dependency_overrides[deps.get_current_admin] = lambda: admin
+
+    # 같은 값으로 수정 (데이터는 바뀌지 않고 커밋 + 뷰 갱신 경로만 실행)
+    response = await client.patch(
+        f"/api/v1/admin/rewards/{reward.id}",
+        json={"product_name": reward.product_name}
+    )
+
+    assert len(refresh_calls) == 1
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == str(reward.id)
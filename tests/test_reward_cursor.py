@@ -0,0 +1,51 @@
+# tests/test_reward_cursor.py
+# 앱 리워드 목록 커서 인코딩/디코딩
+
+import base64
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.rewards import decode_reward_cursor, encode_reward_cursor
+from app.models.reward import EXPOSURE_ORDER_FIRST, EXPOSURE_ORDER_LAST
+
+REWARD_ID = UUID("0190a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b")
+CREATED_AT = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def make_cursor(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+@pytest.mark.parametrize("exposure_order", [0, 7, -3, EXPOSURE_ORDER_FIRST, EXPOSURE_ORDER_LAST])
+def test_cursor_round_trip(exposure_order):
+    reward = SimpleNamespace(exposure_order=exposure_order, created_at=CREATED_AT, id=REWARD_ID)
+
+    assert decode_reward_cursor(encode_reward_cursor(reward)) == (exposure_order, CREATED_AT, REWARD_ID)
+
+
+def test_cursor_without_exposure_order_sorts_last():
+    reward = SimpleNamespace(exposure_order=None, created_at=CREATED_AT, id=REWARD_ID)
+
+    assert decode_reward_cursor(encode_reward_cursor(reward))[0] == EXPOSURE_ORDER_LAST
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    make_cursor("1|2025-03-01T12:30:15+00:00"),
+    make_cursor(f"abc|2025-03-01T12:30:15+00:00|{REWARD_ID}"),
+    make_cursor(f"1|not-a-date|{REWARD_ID}"),
+    make_cursor("1|2025-03-01T12:30:15+00:00|not-a-uuid"),
+    make_cursor(f"99999999999|2025-03-01T12:30:15+00:00|{REWARD_ID}"),
+    make_cursor(f"{EXPOSURE_ORDER_LAST + 1}|2025-03-01T12:30:15+00:00|{REWARD_ID}"),
+    make_cursor(f"{EXPOSURE_ORDER_FIRST - 1}|2025-03-01T12:30:15+00:00|{REWARD_ID}"),
+    base64.urlsafe_b64encode(b"\xff\xfe|x|y").decode(),
+])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_reward_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
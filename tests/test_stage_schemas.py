@@ -0,0 +1,28 @@
+# tests/test_stage_schemas.py
+# 관리자 힌트 이미지 입력 검증
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.stage import HintImageItem, HintImageUpdate
+
+
+@pytest.mark.parametrize("payload", [{}, {"alt": "x"}, {"url": ""}])
+def test_hint_image_requires_url(payload):
+    with pytest.raises(ValidationError):
+        HintImageItem.model_validate(payload)
+
+
+def test_hint_image_echo_keeps_client_alt_key():
+    update = HintImageUpdate.model_validate({
+        "images": [
+            {"url": "/media/images/a.png", "alt": "a"},
+            {"url": "/media/images/b.png", "alt_text": "b", "order_no": 2},
+        ]
+    })
+
+    assert [image.alt_text for image in update.images] == ["a", "b"]
+    assert [image.as_input_dict() for image in update.images] == [
+        {"url": "/media/images/a.png", "alt": "a", "order_no": 1},
+        {"url": "/media/images/b.png", "alt_text": "b", "order_no": 2},
+    ]